@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Construction cost of 'FileUrlSplit'
+
+python3 -m benchmarks.bench_construction
+"""
+import argparse
+import timeit
+
+import src.fileurlsplit as file_url_split
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    cases = {
+        'empty': lambda: file_url_split.FileUrlSplit(),
+        'plain': lambda: file_url_split.FileUrlSplit('/srv/data/photo.png'),
+        'prefix': lambda: file_url_split.FileUrlSplit(
+            'file:///srv/data/photo.png'),
+    }
+    for label, case in cases.items():
+        best = min(timeit.repeat(case, number=args.number, repeat=args.repeat))
+        print(
+            f'{label:<8} {best / args.number * 1e9:8.0f} ns/object  '
+            f'{args.number / best:12,.0f} objects/s')
+
+
+if __name__ == '__main__':
+    main()
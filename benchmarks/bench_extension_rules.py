@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Extension lookup cost with few and many compound extension rules
+
+The lookups are compared to the previous implementation, which only knew
+the '.tar.*' rule, as a baseline.
+
+python3 -m benchmarks.bench_extension_rules
+"""
+import argparse
+import random
+import string
+import timeit
+
+import src.fileurlsplit as file_url_split
+
+
+def previous_extension(filename: str) -> str:
+    # Extension rules before the 'ExtensionRules' table, the baseline
+    file_name = filename.lstrip('.')
+    if '.' not in file_name or file_name[-1] == '.':
+        return ''
+    file_slices = file_name.split('.')
+    if len(file_slices) == 2:
+        return '.' + file_slices[-1]
+    if file_slices[-2] == 'tar':
+        return '.' + file_slices[-2] + '.' + file_slices[-1]
+    return '.' + file_slices[-1]
+
+
+def make_rules(count: int, seed: int = 0) -> list:
+    # '.tar.*' plus random rules of 2 and 3 extensions
+    rng = random.Random(seed)
+    rules = {'.tar.*'}
+    while len(rules) < count:
+        rules.add(''.join(
+            '.' + ''.join(rng.choices(string.ascii_lowercase, k=3))
+            for _ in range(rng.randint(2, 3))))
+    return sorted(rules)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    filenames = [
+        'photo.png', 'backup.tar.gz', 'app.min.js', 'a.b.c.d.e.txt',
+        '.bashrc', 'README']
+    tables = {
+        'default': file_url_split.ExtensionRules(),
+        '10 rules': file_url_split.ExtensionRules(make_rules(10)),
+        '10000 rules': file_url_split.ExtensionRules(make_rules(10_000)),
+    }
+    for filename in filenames:
+        baseline = min(timeit.repeat(
+            lambda: previous_extension(filename),
+            number=args.number, repeat=args.repeat))
+        print(
+            f'{"previous":<12} {filename:<15} '
+            f'{baseline / args.number * 1e9:6.0f} ns/lookup')
+        for label, rules in tables.items():
+            best = min(timeit.repeat(
+                lambda: rules.extension(filename),
+                number=args.number, repeat=args.repeat))
+            print(
+                f'{label:<12} {filename:<15} '
+                f'{best / args.number * 1e9:6.0f} ns/lookup  '
+                f'{best / baseline:5.2f}x previous')
+
+
+if __name__ == '__main__':
+    main()
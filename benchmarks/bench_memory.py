@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Memory per instance of 'FileUrlSplit' and 'CompactFileUrlSplit'
+
+python3 -m benchmarks.bench_memory --count 100000
+"""
+import argparse
+import gc
+import tracemalloc
+
+import src.fileurlsplit as file_url_split
+from benchmarks.manifest import make_manifest
+
+
+def bytes_per_instance(cls: type, manifest: list) -> float:
+    """Traced memory allocated per instance of the class"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(file_url) for file_url in manifest]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del instances
+    return (after - before) / len(manifest)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=100_000)
+    args = parser.parse_args()
+
+    manifest = make_manifest(args.count)
+    print(f'{args.count} instances (includes the list of instances)')
+    for cls in (file_url_split.FileUrlSplit,
+                file_url_split.CompactFileUrlSplit):
+        print(
+            f'{cls.__name__:<20} '
+            f'{bytes_per_instance(cls, manifest):8.1f} bytes/instance')
+
+
+if __name__ == '__main__':
+    main()
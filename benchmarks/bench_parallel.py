@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Scaling of 'split_parallel' from 1 to N processes
+
+python3 -m benchmarks.bench_parallel --count 1000000 --workers 8
+"""
+import argparse
+import os
+import time
+
+import src.fileurlsplit as file_url_split
+from benchmarks.manifest import make_manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--chunksize', type=int, default=None)
+    args = parser.parse_args()
+
+    manifest = make_manifest(args.count)
+    print(f'{args.count} URLs')
+
+    baseline = None
+    for workers in range(1, args.workers + 1):
+        start = time.perf_counter()
+        file_url_split.split_parallel(
+            manifest, workers=workers, chunksize=args.chunksize)
+        elapsed = time.perf_counter() - start
+
+        baseline = baseline or elapsed
+        print(
+            f'workers={workers:<3} {elapsed:8.3f}s  '
+            f'{args.count / elapsed:12,.0f} URLs/s  '
+            f'speedup x{baseline / elapsed:.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Subtree queries of a 'PathIndex' against a linear scan of the splits
+
+python3 -m benchmarks.bench_path_index --count 1000000
+"""
+import argparse
+import time
+
+import src.fileurlsplit as file_url_split
+from benchmarks.manifest import make_manifest
+
+
+def best_time(function, repeat: int) -> float:
+    """Best wall time in seconds of calling 'function'"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    records = list(file_url_split.iter_split(make_manifest(args.count)))
+    start = time.perf_counter()
+    index = file_url_split.PathIndex(records)
+    print(
+        f'build    {time.perf_counter() - start:8.3f} s  '
+        f'{len(index):,} records')
+
+    # The whole tree, a directory near the root and a deep one
+    deep = max((x.path for x in records[:1000]), key=len)
+    queries = [
+        ('/', '.parquet'),
+        (deep[:deep.index('/', len('/srv/data/')) + 1], '.parquet'),
+        (deep, '.parquet'),
+    ]
+    for path, extension in queries:
+        cases = {
+            'scan': lambda: [
+                x for x in records
+                if x.path.startswith(path) and x.extension == extension],
+            'find': lambda: list(index.find(path, extension)),
+            'count': lambda: index.count(path, extension),
+        }
+        found = index.count(path, extension)
+        for label, case in cases.items():
+            print(
+                f'{label:<8} {best_time(case, args.repeat) * 1e3:10.3f} ms  '
+                f'{found:>8,} found under {path}')
+
+
+if __name__ == '__main__':
+    main()
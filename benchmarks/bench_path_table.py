@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Max RSS of keeping many 'FileUrlSplit' objects, with and without a
+'PathTable'
+
+python3 -m benchmarks.bench_path_table --count 1000000
+"""
+import argparse
+import resource
+import subprocess
+import sys
+
+import src.fileurlsplit as file_url_split
+from benchmarks.manifest import make_manifest
+
+
+def max_rss(count: int, interned: bool) -> int:
+    """Max RSS in KiB of a process that keeps 'count' objects"""
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.bench_path_table',
+         '--count', str(count),
+         '--child', 'interned' if interned else 'plain'],
+        check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return int(output)
+
+
+def child(count: int, interned: bool) -> None:
+    manifest = make_manifest(count)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    path_table = file_url_split.PathTable() if interned else None
+    objects = [
+        file_url_split.FileUrlSplit(file_url, path_table=path_table)
+        for file_url in manifest]
+
+    print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline)
+    del objects
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--child', choices=['plain', 'interned'])
+    args = parser.parse_args()
+
+    if args.child:
+        child(count=args.count, interned=args.child == 'interned')
+        return
+
+    plain = max_rss(count=args.count, interned=False)
+    interned = max_rss(count=args.count, interned=True)
+    print(f'{args.count} objects, RSS growth')
+    print(f'plain     {plain / 1024:10.1f} MiB')
+    print(f'interned  {interned / 1024:10.1f} MiB  '
+          f'({(plain - interned) / plain:.1%} less)')
+
+
+if __name__ == '__main__':
+    main()
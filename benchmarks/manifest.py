@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Synthetic URL manifests shared by the benchmarks"""
+import random
+from typing import List
+
+_EXTENSIONS = [
+    '.txt', '.png', '.jpg', '.pdf', '.parquet', '.tar.gz', '.tar.xz', '.py',
+    '.json', '', '.csv', '.mp4']
+
+
+def make_manifest(count: int, seed: int = 0) -> List[str]:
+    """Make a list of realistic absolute URLs
+
+    About 10% of the URLs have a "file://" prefix and 5% are URL-encoded,
+    the rest are already clean absolute paths.
+
+    :param count: Number of URLs
+    :param seed: Random seed, the same seed always makes the same manifest
+    :return: List of URL strings
+    """
+    rand = random.Random(seed)
+    directories = [
+        '/srv/data/' + '/'.join(
+            f'dir_{rand.randrange(50)}' for _ in range(rand.randint(1, 6)))
+        for _ in range(max(count // 100, 1))]
+
+    manifest = []
+    for index in range(count):
+        url = (
+            f'{rand.choice(directories)}/file_{index}'
+            f'{rand.choice(_EXTENSIONS)}')
+        kind = rand.random()
+        if kind < 0.10:
+            url = 'file://' + url
+        elif kind < 0.15:
+            url = url.replace('/', '%2F')
+        manifest.append(url)
+
+    return manifest
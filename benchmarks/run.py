@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Benchmark suite of 'FileUrlSplit'
+
+Measures the constructor, each property setter and the bulk functions,
+reporting operations per second and the peak memory allocated by an
+operation. Results can be saved as JSON and compared, and two commits can
+be compared directly, so that performance regressions are caught.
+
+python3 -m benchmarks.run
+python3 -m benchmarks.run --json head.json
+python3 -m benchmarks.run --compare base.json head.json
+python3 -m benchmarks.run --rev HEAD~1 --rev HEAD
+"""
+import argparse
+import importlib.util
+import inspect
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.manifest import make_manifest
+
+MODULE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'src', 'fileurlsplit.py')
+
+DEEP_URL = '/' + '/'.join(f'dir_{x}' for x in range(40)) + '/file.txt'
+LONG_FILENAME_URL = '/home/user/' + 'long_name.' * 24 + 'txt'
+
+
+def load_module(path: str):
+    """Import a fileurlsplit module file"""
+    spec = importlib.util.spec_from_file_location(
+        f'fileurlsplit_{abs(hash(path))}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_cases(fus) -> Dict[str, Callable[[], None]]:
+    """Benchmark cases of the module. Each case runs a single operation"""
+    file_url_split = fus.FileUrlSplit
+    cases = {
+        'init/empty': lambda: file_url_split(),
+        'init/plain': lambda: file_url_split('/home/user/photo.png'),
+        'init/prefix': lambda: file_url_split('file:///home/user/photo.png'),
+        'init/encoded': lambda: file_url_split(
+            'file%3A%2F%2F%2Fhome%2Fuser%2Fphoto.png'),
+        'init/windows': lambda: file_url_split(
+            r'C:\Users\user\Pictures\photo.png'),
+        'init/deep': lambda: file_url_split(DEEP_URL),
+        'init/prefix_deep': lambda: file_url_split('file://' + DEEP_URL),
+        'init/windows_deep': lambda: file_url_split(
+            'C:' + DEEP_URL.replace('/', '\\')),
+        'init/long_filename': lambda: file_url_split(LONG_FILENAME_URL),
+    }
+    if 'assume_clean' in inspect.signature(file_url_split).parameters:
+        cases['init/assume_clean'] = lambda: file_url_split(
+            '/home/user/photo.png', assume_clean=True)
+
+    # The setters do nothing when the value does not change, so each case
+    # alternates between two values
+    setter_values = {
+        'url': ('/home/user/photo.png', '/home/user/other/photo.jpg'),
+        'url_deep': (DEEP_URL, DEEP_URL.replace('dir_3', 'dir_x')),
+        'path': ('/home/user/', '/srv/data/files/'),
+        'name': ('photo', 'other photo'),
+        'filename': ('photo.png', 'book.tar.gz'),
+        'extension': ('.png', 'jpg'),
+    }
+    for label, values in setter_values.items():
+        cases[f'setter/{label}'] = _setter_case(
+            obj=file_url_split('/home/user/photo.png'),
+            attribute=label.split('_')[0], values=values)
+
+    manifest = make_manifest(1000)
+    if hasattr(file_url_split, 'split_many'):
+        cases['bulk/split_many_1000'] = (
+            lambda: file_url_split.split_many(manifest))
+    if hasattr(fus, 'iter_split'):
+        cases['bulk/iter_split_1000'] = (
+            lambda: list(fus.iter_split(manifest)))
+    if hasattr(fus, 'split_bytes'):
+        manifest_bytes = '\n'.join(manifest).encode()
+        cases['bulk/split_bytes_1000'] = (
+            lambda: list(fus.split_bytes(manifest_bytes)))
+    if hasattr(fus, 'group_by'):
+        cases['bulk/group_by_1000'] = (
+            lambda: fus.group_by(manifest))
+    cases['bulk/objects_1000'] = (
+        lambda: [file_url_split(x) for x in manifest])
+
+    return cases
+
+
+def _setter_case(obj, attribute: str, values: tuple) -> Callable[[], None]:
+    state = [0]
+
+    def case() -> None:
+        state[0] ^= 1
+        setattr(obj, attribute, values[state[0]])
+
+    return case
+
+
+def measure(case: Callable[[], None], min_time: float) -> dict:
+    """Operations per second and peak bytes allocated by one operation"""
+    timer = timeit.Timer(case)
+    number, _ = timer.autorange()
+    number = max(int(number * min_time / 0.2), 1)
+    best = min(timer.repeat(repeat=5, number=number))
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    case()
+    peak = tracemalloc.get_traced_memory()[1] - start
+    tracemalloc.stop()
+
+    return {'ops_per_sec': number / best, 'peak_bytes': peak}
+
+
+def run(module_path: str, min_time: float, only: Optional[str]) -> dict:
+    """Run all the cases of a module file"""
+    cases = make_cases(load_module(module_path))
+    return {
+        label: measure(case, min_time=min_time)
+        for label, case in cases.items() if not only or only in label}
+
+
+def run_revision(revision: str, min_time: float, only: Optional[str]) -> dict:
+    """Run all the cases of the module of a git revision"""
+    source = subprocess.run(
+        ['git', 'show', f'{revision}:src/fileurlsplit.py'],
+        cwd=os.path.dirname(MODULE_PATH), check=True,
+        stdout=subprocess.PIPE).stdout
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'fileurlsplit.py')
+        with open(path, 'wb') as module_file:
+            module_file.write(source)
+        return run(module_path=path, min_time=min_time, only=only)
+
+
+def print_results(results: dict) -> None:
+    print(f'{"case":<26} {"ops/s":>14} {"peak bytes/op":>14}')
+    for label, result in results.items():
+        print(
+            f'{label:<26} {result["ops_per_sec"]:14,.0f} '
+            f'{result["peak_bytes"]:14,}')
+
+
+def print_comparison(
+        base: dict, head: dict, names: List[str], threshold: float) -> int:
+    """Print the change of each case. Returns the number of regressions"""
+    print(f'{"case":<26} {names[0]:>14} {names[1]:>14} {"change":>9}')
+    regressions = 0
+    for label in head:
+        if label not in base:
+            print(f'{label:<26} {"n/a":>14} '
+                  f'{head[label]["ops_per_sec"]:14,.0f}')
+            continue
+
+        base_ops = base[label]['ops_per_sec']
+        head_ops = head[label]['ops_per_sec']
+        change = (head_ops - base_ops) / base_ops * 100
+        mark = ''
+        if change < -threshold:
+            regressions += 1
+            mark = '  REGRESSION'
+        print(f'{label:<26} {base_ops:14,.0f} {head_ops:14,.0f} '
+              f'{change:+8.1f}%{mark}')
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='\n'.join(__doc__.splitlines()[6:]))
+    parser.add_argument(
+        '--rev', action='append', default=[],
+        help='Git revision to benchmark. Pass twice to compare two commits')
+    parser.add_argument(
+        '--compare', nargs=2, metavar=('BASE', 'HEAD'),
+        help='Compare two JSON result files')
+    parser.add_argument('--json', help='Save the results as JSON')
+    parser.add_argument(
+        '--only', help='Only run the cases with this text in the name')
+    parser.add_argument(
+        '--min-time', type=float, default=0.2,
+        help='Min time in seconds of each timing repeat')
+    parser.add_argument(
+        '--threshold', type=float, default=10.0,
+        help='Slowdown percentage reported as a regression')
+    args = parser.parse_args()
+
+    if args.compare:
+        base, head = [
+            json.load(open(path, encoding='utf-8')) for path in args.compare]
+        names = [os.path.basename(path) for path in args.compare]
+        return 1 if print_comparison(
+            base, head, names=names, threshold=args.threshold) else 0
+
+    if len(args.rev) > 2:
+        parser.error('--rev can be passed at most twice')
+
+    if len(args.rev) == 2:
+        base, head = [
+            run_revision(rev, min_time=args.min_time, only=args.only)
+            for rev in args.rev]
+        return 1 if print_comparison(
+            base, head, names=args.rev, threshold=args.threshold) else 0
+
+    if args.rev:
+        results = run_revision(
+            args.rev[0], min_time=args.min_time, only=args.only)
+    else:
+        results = run(
+            module_path=MODULE_PATH, min_time=args.min_time, only=args.only)
+
+    print_results(results)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as json_file:
+            json.dump(results, json_file, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,25 @@
 #!/usr/bin/env python3
+import array
+import asyncio
+import collections
+import concurrent.futures
+import functools
+import itertools
 import os
 import re
 import string
 import sys
+import time
 import urllib.parse
+from typing import (
+    IO, Any, AsyncIterator, Dict, Iterable, Iterator, List, NamedTuple,
+    Optional, Tuple, Union)
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    # Optional, only used by 'split_array'
+    numpy = None
 
 
 class Error(Exception):
@@ -68,6 +84,12 @@ class InvalidCharacterError(Error):
         """The all invalid characters list"""
         return self.__all_invalid_characters_list
 
+    def __reduce__(self):
+        # Pickled with all the arguments, to be sent by the pool workers
+        return type(self), (
+            self.__message, self.__invalid_character_found,
+            self.__all_invalid_characters_list)
+
 
 class InvalidFilenameError(Error):
     """
@@ -88,6 +110,1080 @@ class InvalidFilenameError(Error):
         """The all invalid filename list"""
         return self.__all_invalid_filename_list
 
+    def __reduce__(self):
+        # Pickled with all the arguments, to be sent by the pool workers
+        return type(self), (self.__message, self.__all_invalid_filename_list)
+
+
+class SplitColumns(NamedTuple):
+    """Columnar result of a batch split
+
+    Each attribute is a list with one item per URL, in the input order.
+    """
+    urls: List[str]
+    paths: List[str]
+    filenames: List[str]
+    names: List[str]
+    extensions: List[str]
+
+
+class SplitRecord(NamedTuple):
+    """Split of a single URL"""
+    url: str
+    path: str
+    filename: str
+    name: str
+    extension: str
+
+
+class SplitError(NamedTuple):
+    """Error found when splitting a single URL
+
+    Only yielded when the "record" error policy is used. 'error' is an
+    'Error', or the 'OSError' of a file checked by 'stat_split'.
+    """
+    file_url: str
+    error: Exception
+
+
+class PlatformRules(NamedTuple):
+    """Invalid characters and names of a platform"""
+    platform: str
+    invalid_chars: Tuple[str, ...]
+    invalid_names: Tuple[str, ...]
+
+
+# Rules of each platform profile
+LINUX_RULES = PlatformRules('Linux', ('/', '\\'), ())
+BSD_RULES = PlatformRules('BSD', ('/', '\\', ':'), ())
+MAC_RULES = PlatformRules('Mac', ('/', '\\', ':'), ())
+WINDOWS_RULES = PlatformRules(
+    'Windows',
+    ('\\', '/', ':', '*', '?', '"', '<', '>', '|'),
+    ('CON', 'PRN', 'AUX', 'NUL', 'COM0', 'COM1', 'COM2', 'COM3', 'COM4',
+     'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT0', 'LPT1', 'LPT2', 'LPT3',
+     'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'))
+ANOTHER_RULES = PlatformRules(
+    'Another',
+    tuple(x for x in string.punctuation
+          if x not in ['~', ' ', '-', '_', '.']),
+    ())
+
+# Platform profiles of 'platform_mask'. The bit of a platform in a mask is
+# '1 << index'.
+PLATFORMS = (LINUX_RULES, BSD_RULES, MAC_RULES, WINDOWS_RULES, ANOTHER_RULES)
+ALL_PLATFORMS = (1 << len(PLATFORMS)) - 1
+
+# Validators already made, by 'sys.platform' value
+_validator_cache = {}
+
+# Platform used instead of 'sys.platform', see 'set_platform'
+_platform_override = None
+
+
+def get_platform_rules(platform: str = None) -> PlatformRules:
+    """Get the invalid characters and names of a platform
+
+    The rules are made only once per process for each platform.
+
+    >>> get_platform_rules('linux').invalid_chars
+    ('/', '\\\\')
+    >>> get_platform_rules('win32').platform
+    'Windows'
+
+    :param platform: A 'sys.platform' value. Default is the platform passed
+        to 'set_platform', or else the current 'sys.platform'
+    :return: PlatformRules of the platform
+    """
+    return _get_validator(platform=platform).rules
+
+
+def set_platform(platform: str = None) -> None:
+    """Validate for another platform
+
+    All objects created after this call use the rules of the platform
+    passed, instead of the rules of the current platform. Useful for tests
+    and to validate URLs for another OS.
+
+    :param platform: A 'sys.platform' value, like 'win32' or 'darwin'.
+        None returns to the current platform
+    """
+    global _platform_override
+    _platform_override = platform
+
+
+def _get_validator(platform: str = None) -> '_Validator':
+    # Returns the validator of the platform, made once per process
+    if platform is None:
+        platform = _platform_override or sys.platform
+
+    validator = _validator_cache.get(platform)
+    if validator is None:
+        validator = _validator_cache[platform] = _Validator(
+            rules=_make_platform_rules(platform=platform))
+
+    return validator
+
+
+def _make_platform_rules(platform: str) -> PlatformRules:
+    # Linux:             linux or linux2 (*)
+    # Windows:           win32
+    # Windows/Cygwin:    cygwin
+    # Windows/MSYS2:     msys
+    # Mac OS X:          darwin
+    # OS/2:              os2
+    # OS/2 EMX:          os2emx
+    # RiscOS:            riscos
+    # AtheOS:            atheos
+    # FreeBSD 7:         freebsd7
+    # FreeBSD 8:         freebsd8
+    # FreeBSD N:         freebsdN
+    # OpenBSD 6:         openbsd6
+
+    if platform.startswith('linux'):
+        return LINUX_RULES
+
+    elif 'bsd' in platform:
+        return BSD_RULES
+
+    elif platform == 'darwin':
+        return MAC_RULES
+
+    elif 'win' in platform or 'msys' in platform:
+        return WINDOWS_RULES
+
+    return ANOTHER_RULES
+
+
+class ExtensionRules(object):
+    """Table of compound extensions
+
+    A file has a single extension after its last dot, like '.gz', unless
+    its end matches a compound extension rule, like '.tar.gz'. A rule can
+    end with '*' to match any last extension, as the default rule
+    '.tar.*'. When more than one rule matches, the longest wins.
+
+    The rules are kept in hash sets of suffixes, and a filename is checked
+    from its end, one dot at a time, up to the deepest rule. So finding an
+    extension takes the same time with 10 or 10,000 rules. The default
+    table, with only '.tar.*', checks just the two last extensions.
+
+    >>> rules = ExtensionRules(['.tar.*', '.min.js', '.pkg.tar.xz'])
+    >>> rules.extension('app.min.js')
+    '.min.js'
+    >>> rules.extension('linux.pkg.tar.xz')
+    '.pkg.tar.xz'
+    >>> rules.extension('photo.tar.gz')
+    '.tar.gz'
+    >>> rules.extension('photo.png')
+    '.png'
+    """
+    __slots__ = (
+        '__rules', '__suffixes', '__heads', '__max_dots', '_tar_only')
+
+    def __init__(self, rules: Iterable[str] = ('.tar.*',)) -> None:
+        """Constructor
+
+        :param rules: Compound extensions, like '.tar.gz' or '.tar.*'
+        :raises ValueError: If a rule is not a compound extension
+        """
+        self.__rules = set()
+        # Both as str and as UTF-8 bytes, for 'find_bytes'
+        self.__suffixes = set()  # Like '.tar.gz'
+        self.__heads = set()  # Like '.tar' for '.tar.*'
+        self.__max_dots = 1
+        # Only the default rule '.tar.*'. Also read by '_get_extension'
+        self._tar_only = False
+        for rule in rules:
+            self.add(rule=rule)
+
+    def add(self, rule: str) -> None:
+        """Add a compound extension rule
+
+        :param rule: Compound extension, like '.tar.gz' or '.tar.*'
+        :raises ValueError: If the rule is not a compound extension
+        """
+        components = rule.split('.')
+        if (len(components) < 3 or components[0]
+                or not all(components[1:])
+                or '*' in ''.join(components[1:-1])
+                or ('*' in components[-1] and components[-1] != '*')):
+            raise ValueError(
+                f'Invalid compound extension rule "{rule}". Use rules like '
+                '".tar.gz" or ".tar.*"')
+
+        self.__rules.add(rule)
+        if components[-1] == '*':
+            self.__heads.update((rule[:-2], rule[:-2].encode()))
+        else:
+            self.__suffixes.update((rule, rule.encode()))
+        self.__max_dots = max(self.__max_dots, len(components) - 1)
+        self._tar_only = self.__rules == {'.tar.*'}
+
+    def remove(self, rule: str) -> None:
+        """Remove a compound extension rule
+
+        :param rule: A rule added before
+        :raises KeyError: If the rule is not in the table
+        """
+        self.__rules.remove(rule)
+        if rule.endswith('*'):
+            self.__heads.difference_update((rule[:-2], rule[:-2].encode()))
+        else:
+            self.__suffixes.difference_update((rule, rule.encode()))
+        self.__max_dots = max(
+            (x.count('.') for x in self.__rules), default=1)
+        self._tar_only = self.__rules == {'.tar.*'}
+
+    def find(self, filename: str) -> int:
+        """Index of the start of the extension in the filename
+
+        :param filename: Filename with the extension, without the path
+        :return: Index of the extension, or the filename size when it has
+            no extension
+        """
+        return len(filename) - len(self.extension(filename))
+
+    def extension(self, filename: str) -> str:
+        """Get the extension of a filename
+
+        :param filename: Filename with the extension, without the path
+        :return: The extension, or an empty string
+        """
+        # Olhar o fim do nome do arquivo a partir do último ponto, não
+        # produz o resultado esperado, pois um arquivo de nome '.txt' não
+        # pode ser reconhecido como um arquivo de nome vazio '' e extensão
+        # '.txt', e sim como um arquivo que tem o nome oculto '.txt' e
+        # extensão vazia ''. Os pontos no início do nome são ignorados.
+        last_dot = filename.rfind('.')
+
+        # Arquivos sem extensão
+        if last_dot < 1 or filename[-1] == '.':
+            return ''
+        if filename[0] != '.':
+            start = 0
+        else:
+            start = len(filename) - len(filename.lstrip('.'))
+            if last_dot < start:
+                return ''
+
+        # Só a regra padrão '.tar.*', sem procurar os outros pontos
+        if self._tar_only:
+            if (last_dot - 4 >= start
+                    and filename[last_dot - 4:last_dot] == '.tar'):
+                return filename[last_dot - 4:]
+            return filename[last_dot:]
+
+        # Arquivos que só tem uma extensão
+        dot = filename.rfind('.', start, last_dot)
+        if dot < 0:
+            return filename[last_dot:]
+
+        # Extensões internas, de trás pra frente, um ponto de cada vez
+        extension_start = last_dot
+        suffixes = self.__suffixes
+        heads = self.__heads
+        for _ in range(self.__max_dots - 1):
+            if filename[dot:] in suffixes or filename[dot:last_dot] in heads:
+                extension_start = dot
+
+            dot = filename.rfind('.', start, dot)
+            if dot < 0:
+                break
+
+        return filename[extension_start:]
+
+    def find_bytes(self, filename: bytes) -> int:
+        """Index of the start of the extension in an UTF-8 filename
+
+        Same as 'find', without decoding the filename.
+
+        :param filename: UTF-8 filename with the extension, without the
+            path, as 'bytes' or 'bytearray'
+        :return: Index in bytes of the extension, or the filename size when
+            it has no extension
+        """
+        end = len(filename)
+        last_dot = filename.rfind(b'.')
+        if last_dot < 1 or filename[-1] == 46:  # '.'
+            return end
+        if filename[0] != 46:
+            start = 0
+        else:
+            start = end - len(filename.lstrip(b'.'))
+            if last_dot < start:
+                return end
+
+        if self._tar_only:
+            if (last_dot - 4 >= start
+                    and filename[last_dot - 4:last_dot] == b'.tar'):
+                return last_dot - 4
+            return last_dot
+
+        dot = filename.rfind(b'.', start, last_dot)
+        if dot < 0:
+            return last_dot
+
+        # 'bytes', as slices of a 'bytearray' are not hashable
+        extension_start = last_dot
+        suffixes = self.__suffixes
+        heads = self.__heads
+        for _ in range(self.__max_dots - 1):
+            if (bytes(filename[dot:]) in suffixes
+                    or bytes(filename[dot:last_dot]) in heads):
+                extension_start = dot
+
+            dot = filename.rfind(b'.', start, dot)
+            if dot < 0:
+                break
+
+        return extension_start
+
+    def __contains__(self, rule: str) -> bool:
+        return rule in self.__rules
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self.__rules))
+
+    def __len__(self) -> int:
+        return len(self.__rules)
+
+    def __repr__(self):
+        return f'ExtensionRules({sorted(self.__rules)})'
+
+    def __reduce__(self):
+        # Sent to the workers of 'split_parallel'
+        return (type(self), (sorted(self.__rules),))
+
+
+# Compound extensions used by all splits, see 'set_extension_rules'
+_extension_rules = ExtensionRules()
+
+
+def get_extension_rules() -> ExtensionRules:
+    """Get the compound extension rules used by all splits
+
+    Rules can be added to it, like
+    'get_extension_rules().add(".min.js")'. Call 'cache_clear' after
+    changing it if the split cache is enabled.
+
+    :return: The ExtensionRules in use
+    """
+    return _extension_rules
+
+
+def set_extension_rules(rules: ExtensionRules = None) -> None:
+    """Set the compound extension rules used by all splits
+
+    Objects already made keep their extensions. The split cache is
+    cleared, see 'enable_cache'.
+
+    :param rules: ExtensionRules. None returns to the default rules
+    """
+    global _extension_rules
+    _extension_rules = ExtensionRules() if rules is None else rules
+    cache_clear()
+
+
+# Validation codes of 'validate_many'. The '_Validator' returns the same
+# codes for the kinds of errors it finds.
+VALID = 0
+INVALID_CHARACTER = 1
+INVALID_FILENAME = 2
+FILENAME_TOO_LONG = 3
+NOT_ABSOLUTE_PATH = 4
+
+
+class _Validator(object):
+    # Checks the chars, names and len size of the platform rules.
+    # A whole URL is checked with a single scan for invalid chars (a
+    # precompiled character class), and the URL is only split into
+    # components when there are reserved names or it is too long.
+    __slots__ = (
+        'rules', '__invalid_names', '__search_chars', '__search_url_chars')
+
+    def __init__(self, rules: PlatformRules) -> None:
+        self.rules = rules
+        self.__invalid_names = frozenset(rules.invalid_names)
+        self.__search_chars = re.compile(
+            '[' + ''.join(re.escape(x) for x in rules.invalid_chars) + ']'
+        ).search
+        # The slash is the components separator of an URL
+        self.__search_url_chars = re.compile(
+            '[' + ''.join(
+                re.escape(x) for x in rules.invalid_chars if x != '/') + ']'
+        ).search
+
+    def find_url_error(self, url: str) -> Optional[Tuple[int, int, str]]:
+        # Returns None for a valid URL, or the kind of the error, the index
+        # of the URL component and the invalid char or component.
+        # The components are checked in order, and each one for chars, then
+        # names, then len size, so the error is always the first one.
+        match = self.__search_url_chars(url)
+        end = len(url) if not match else url.rfind('/', 0, match.start()) + 1
+
+        # Components before the one with an invalid char
+        if self.__invalid_names or end > 255:
+            for index, component in enumerate(url[:end].split('/')):
+                if component in self.__invalid_names:
+                    return INVALID_FILENAME, index, component
+                if len(component) > 255:
+                    return FILENAME_TOO_LONG, index, component
+
+        if match:
+            component_end = url.find('/', match.start())
+            component = url[end:] if component_end < 0 else url[
+                end:component_end]
+            return (
+                INVALID_CHARACTER, url.count('/', 0, end),
+                self.__first_invalid_char(text=component))
+
+        return None
+
+    def check_url(self, url: str) -> None:
+        # raise: InvalidCharacterError, InvalidFilenameError,
+        # FilenameTooLongError
+        error = self.find_url_error(url=url)
+        if not error:
+            return
+
+        kind, _, found = error
+        if kind == INVALID_CHARACTER:
+            self.__raise_invalid_char(invalid_char=found)
+        if kind == INVALID_FILENAME:
+            self.__raise_invalid_name(name=found)
+        raise FilenameTooLongError(
+            message=(
+                'File name too long. The file name together with '
+                'the extension cannot exceed the limit of 255 '
+                'characters.'))
+
+    def check_chars(self, text: str) -> None:
+        # raise: InvalidCharacterError
+        if self.__search_chars(text):
+            self.__raise_invalid_char(
+                invalid_char=self.__first_invalid_char(text=text))
+
+    def check_name(self, name: str) -> None:
+        # raise: InvalidFilenameError
+        if name in self.__invalid_names:
+            self.__raise_invalid_name(name=name)
+
+    def __first_invalid_char(self, text: str) -> str:
+        # The first char of the rules found in the text. The rules order is
+        # kept, so the char reported is always the same for a text.
+        for invalid_char in self.rules.invalid_chars:
+            if invalid_char in text:
+                return invalid_char
+
+    def __raise_invalid_char(self, invalid_char: str) -> None:
+        raise InvalidCharacterError(
+            message=f"Cannot contain '{invalid_char}'",
+            invalid_character_found=invalid_char,
+            all_invalid_characters_list=list(self.rules.invalid_chars),
+        )
+
+    def __raise_invalid_name(self, name: str) -> None:
+        raise InvalidFilenameError(
+            message=f'The name "{name}" is reserved and cannot be used.',
+            all_invalid_filename_list=list(self.rules.invalid_names),
+        )
+
+
+class _MultiValidator(object):
+    # Checks an URL for all the 'PLATFORMS' at once. Each invalid char and
+    # reserved name is mapped to the mask of the platforms that forbid it,
+    # and a single scan of the URL finds all of them.
+    __slots__ = ('__char_masks', '__name_masks', '__find_chars',
+                 '__find_names')
+
+    def __init__(self, platforms: Tuple[PlatformRules, ...]) -> None:
+        self.__char_masks = {}
+        self.__name_masks = {}
+        for index, rules in enumerate(platforms):
+            for char in rules.invalid_chars:
+                self.__char_masks[char] = (
+                    self.__char_masks.get(char, 0) | 1 << index)
+            for name in rules.invalid_names:
+                self.__name_masks[name] = (
+                    self.__name_masks.get(name, 0) | 1 << index)
+
+        # The slash is the components separator of an URL
+        chars = [x for x in self.__char_masks if x != '/']
+        self.__find_chars = re.compile(
+            '[' + ''.join(re.escape(x) for x in chars) + ']').findall
+        self.__find_names = re.compile(
+            '(?<=/)(?:' + '|'.join(
+                re.escape(x) for x in self.__name_masks) + ')(?=/|$)'
+        ).findall if self.__name_masks else None
+
+    def mask(self, url: str) -> int:
+        # Mask of the platforms a clean URL is valid on
+        mask = ALL_PLATFORMS
+        for char in set(self.__find_chars(url)):
+            mask &= ~self.__char_masks[char]
+
+        if self.__find_names and mask:
+            for name in self.__find_names(url):
+                mask &= ~self.__name_masks[name]
+
+        # The 255 chars limit is the same for all platforms
+        if len(url) > 256 and mask and max(map(len, url.split('/'))) > 255:
+            return 0
+
+        return mask
+
+
+_multi_validator = _MultiValidator(platforms=PLATFORMS)
+
+
+def platform_mask(file_url: str) -> int:
+    """Bitmask of the platforms an URL is valid on
+
+    The URL is checked for the rules of all the 'PLATFORMS' in a single
+    scan. The bit of a platform is '1 << index' of its index in
+    'PLATFORMS', and 'ALL_PLATFORMS' has all bits set. Not absolute URLs
+    are valid on no platform.
+
+    >>> platform_names(platform_mask('/home/user/a:b.txt'))
+    ['Linux']
+    >>> platform_mask('/home/user/text.txt') == ALL_PLATFORMS
+    True
+
+    :param file_url: URL string
+    :return: Bitmask of the platforms, 0 if valid on none
+    """
+    url = _clean_url(file_url=file_url)
+    return _multi_validator.mask(url=url) if url is not None else 0
+
+
+def platform_masks(file_urls: Iterable[str]) -> array.array:
+    """Bitmask of the platforms each URL is valid on
+
+    Same as 'platform_mask', for many URLs.
+
+    >>> masks = platform_masks(['/srv/AUX/a.txt', '/srv/a?.txt'])
+    >>> [platform_names(x) for x in masks]
+    [['Linux', 'BSD', 'Mac', 'Another'], ['Linux', 'BSD', 'Mac']]
+
+    :param file_urls: Iterable of URL strings
+    :return: 'array.array' of the bitmask of each URL
+    """
+    mask = _multi_validator.mask
+    masks = array.array('B')
+    add_mask = masks.append
+    for file_url in file_urls:
+        url = _clean_url(file_url=file_url)
+        add_mask(mask(url) if url is not None else 0)
+    return masks
+
+
+def platform_names(mask: int) -> List[str]:
+    """Names of the platforms in a bitmask
+
+    :param mask: Bitmask of 'platform_mask'
+    :return: List of the 'PlatformRules.platform' names
+    """
+    return [x.platform for index, x in enumerate(PLATFORMS)
+            if mask & 1 << index]
+
+
+# URL decoding, a global so that it can be timed, see
+# 'enable_instrumentation'
+_unquote = urllib.parse.unquote
+
+# Prefix like "file:" or "c:"
+_match_prefix = re.compile(r'\w+:').match
+
+# Prefix removal of the URLs not handled by the '_clean_url' scanner
+_search_path = re.compile(r'/\w.+$').search
+
+
+def _get_url(file_url: str) -> str:
+    # Returns a clean url
+    # raise: AbsolutePathError
+    url = _clean_url(file_url=file_url)
+    if url is None:
+        raise AbsolutePathError(
+            message=(
+                'You need an absolute URL like: '
+                '"/path", "file://path", "file:///path" or "c:/path"'))
+
+    return url
+
+
+def _clean_url(file_url: str) -> Optional[str]:
+    # Returns a clean url, or None if it is not absolute
+    # Decode url-encode and remove prefix like "file://", "c:/"
+
+    # Empt
+    if not file_url:
+        return '/'
+
+    # Fast path: an absolute path without anything to decode, fix or remove
+    if _is_clean_url(url=file_url):
+        return file_url
+
+    # Decode url
+    if '%' in file_url:
+        file_url = _unquote(
+            string=file_url, encoding='utf-8', errors='replace')
+
+    # Fix slash
+    file_url = file_url.replace('\\', '/')
+
+    # Absolute path: starts with a slash, or has a slash after a prefix like
+    # "file:" or "c:"
+    start = 0
+    if file_url[0] != '/':
+        prefix_match = _match_prefix(file_url)
+        if not prefix_match or file_url[
+                prefix_match.end():prefix_match.end() + 1] != '/':
+            return None
+        start = prefix_match.end()
+
+    # Remove prefix like "file://", "c:/"
+    # Single pass from the start of the path: the URL is the last of the
+    # slashes after the prefix, if a word char follows it. This is the
+    # first match of the '_search_path' regex, when there is no line break.
+    end = len(file_url)
+    slash = start
+    while slash + 1 < end and file_url[slash + 1] == '/':
+        slash += 1
+
+    if slash + 2 < end and '\n' not in file_url and (
+            file_url[slash + 1].isalnum() or file_url[slash + 1] == '_'):
+        return file_url[slash:]
+
+    # Rare URLs, like a hidden dir after the prefix "file:///.dir/x"
+    match = _search_path(file_url)
+    if match:
+        file_url = file_url[match.start():match.end()]
+
+    return file_url
+
+
+def _is_clean_url(url: str) -> bool:
+    # True if '_get_url' would return the (not empty) URL unchanged.
+    # There is nothing to decode or fix, and the prefix removal would match
+    # the whole URL (slash, word char, no line break) or nothing at all.
+    return (
+        url[0] == '/'
+        and '%' not in url
+        and '\\' not in url
+        and '\n' not in url
+        and (len(url) < 3 or url[1].isalnum() or url[1] == '_'))
+
+
+def _get_path(url: str) -> str:
+    # Returns only the file path, up to the last slash. Slicing at the
+    # offsets keeps every division a part of the URL, like in '/srv//a.txt'
+    # where 'os.path.dirname' would drop a slash.
+    return url[:url.rfind('/') + 1]
+
+
+def _get_filename(url: str, path: str) -> str:
+    # Returns the filename with the extension
+    return url[len(path):]
+
+
+def _get_extension(filename: str) -> str:
+    # Returns only the file extension
+
+    # splitext does not work for .tar*
+    # >>> filename, file_extension = os.path.splitext("/path/foo.tar.gz")
+    # >>> file_extension
+    # '.gz'
+    # Compound extensions are in the 'ExtensionRules' table.
+    if not _extension_rules._tar_only:
+        return _extension_rules.extension(filename)
+
+    # Same as 'ExtensionRules.extension' with the default table. It runs for
+    # every split, so it is not a second call.
+    last_dot = filename.rfind('.')
+    if last_dot < 1 or filename[-1] == '.':
+        return ''
+    if filename[0] != '.':
+        start = 0
+    else:
+        start = len(filename) - len(filename.lstrip('.'))
+        if last_dot < start:
+            return ''
+
+    if last_dot - 4 >= start and filename[last_dot - 4:last_dot] == '.tar':
+        return filename[last_dot - 4:]
+    return filename[last_dot:]
+
+
+def _get_name(filename: str, extension: str) -> str:
+    # Returns the file name without the extension. The extension is always
+    # the end of the filename, so 'x.gz.gz' has the name 'x.gz'.
+    return filename[:len(filename) - len(extension)]
+
+
+def _split(file_url: str) -> SplitRecord:
+    # Returns all divisions of the URL
+    # raise: AbsolutePathError
+    url = _get_url(file_url=file_url)
+    path = _get_path(url=url)
+    filename = _get_filename(url=url, path=path)
+    extension = _get_extension(filename=filename)
+    return SplitRecord(
+        url, path, filename, _get_name(filename=filename, extension=extension),
+        extension)
+
+
+def _is_new_directory(entry: os.DirEntry, walked: set) -> bool:
+    # True the first time a directory is found, by its device and inode
+    status = entry.stat()
+    key = (status.st_dev, status.st_ino)
+    if key in walked:
+        return False
+    walked.add(key)
+    return True
+
+
+class PathTable(object):
+    """Table of shared path strings
+
+    Many URLs of a directory listing have the same path, but each split
+    makes its own copy of the path string. Splits made with the same table
+    share a single string for each path, which saves memory when many
+    splits are kept.
+
+    >>> table = PathTable()
+    >>> a = FileUrlSplit('/home/user/a.txt', path_table=table)
+    >>> b = FileUrlSplit('/home/user/b.txt', path_table=table)
+    >>> a.path is b.path
+    True
+    >>> table.parent(a.path)
+    '/home/'
+    """
+    __slots__ = ('__paths', '__parents')
+
+    def __init__(self) -> None:
+        """Constructor"""
+        self.__paths = {}
+        self.__parents = {}
+
+    def intern(self, path: str) -> str:
+        """Get the shared string of the path
+
+        The first string of a path becomes the shared one.
+
+        :param path: Path string
+        :return: The shared string equal to the path
+        """
+        return self.__paths.setdefault(path, path)
+
+    def parent(self, path: str) -> Optional[str]:
+        """Get the shared string of the parent path
+
+        The parents are added to the table as they are requested, so the
+        parents of all paths form a chain of shared strings up to the root.
+
+        :param path: Path string, ending with a slash
+        :return: Parent path, or None for the root path '/'
+        """
+        parent = self.__parents.get(path)
+        if parent is None and path != '/':
+            parent = self.intern(path[:path.rstrip('/').rfind('/') + 1])
+            self.__parents[self.intern(path)] = parent
+
+        return parent
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.__paths
+
+    def __len__(self) -> int:
+        return len(self.__paths)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__paths)
+
+
+class _PathNode(object):
+    # A directory of a 'PathIndex'. 'files' has the records of the
+    # directory by extension and URL, 'counts' the number of records of the
+    # whole subtree by extension and 'size' the total of the subtree.
+    __slots__ = ('children', 'files', 'counts', 'size')
+
+    def __init__(self) -> None:
+        self.children = {}
+        self.files = {}
+        self.counts = {}
+        self.size = 0
+
+
+class PathIndex(object):
+    """Index of split URLs by directory and extension
+
+    The records are kept in a tree with a node for each directory, and each
+    node knows how many records of each extension its subtree has. So
+    counting the files under a directory only walks the path, and listing
+    them only visits the directories that have matching files.
+
+    >>> index = PathIndex(['/data/x/a.parquet', '/data/x/y/b.parquet',
+    ...                    '/data/x/c.csv', '/data/z/d.parquet'])
+    >>> [x.url for x in index.find('/data/x/', extension='.parquet')]
+    ['/data/x/a.parquet', '/data/x/y/b.parquet']
+    >>> index.count('/data/', extension='.parquet')
+    3
+    >>> index.remove_tree('/data/x/')
+    3
+    >>> len(index)
+    1
+    """
+    __slots__ = ('__root',)
+
+    def __init__(self, records: Iterable[Any] = ()) -> None:
+        """Constructor
+
+        :param records: Records to add, see 'add'
+        """
+        self.__root = _PathNode()
+        for record in records:
+            self.add(record=record)
+
+    def add(self, record: Any) -> None:
+        """Add a split URL
+
+        A record with the URL of one already in the index replaces it.
+
+        :param record: SplitRecord, FileUrlSplit (or any object with the
+            'url', 'path' and 'extension' attributes), or an URL string,
+            which is split into a SplitRecord
+        :raises AbsolutePathError: When an URL passed is not absolute
+        """
+        if isinstance(record, str):
+            record = (_split_cache or _split)(record)
+
+        node = self.__root
+        nodes = [node]
+        for component in _path_components(path=record.path):
+            child = node.children.get(component)
+            if child is None:
+                child = node.children[component] = _PathNode()
+            node = child
+            nodes.append(node)
+
+        files = node.files.setdefault(record.extension, {})
+        is_new = record.url not in files
+        files[record.url] = record
+        if is_new:
+            extension = record.extension
+            for node in nodes:
+                node.counts[extension] = node.counts.get(extension, 0) + 1
+                node.size += 1
+
+    def remove(self, record: Any) -> None:
+        """Remove a split URL
+
+        :param record: Record or URL string, see 'add'
+        :raises KeyError: If the URL is not in the index
+        """
+        if isinstance(record, str):
+            record = (_split_cache or _split)(record)
+
+        nodes = self.__find_nodes(path=record.path)
+        if nodes is None:
+            raise KeyError(record.url)
+        files = nodes[-1].files.get(record.extension)
+        if files is None or record.url not in files:
+            raise KeyError(record.url)
+
+        del files[record.url]
+        if not files:
+            del nodes[-1].files[record.extension]
+        self.__discount(
+            nodes=nodes, path=record.path, counts={record.extension: 1},
+            size=1)
+
+    def remove_tree(self, path: str) -> int:
+        """Remove all the records under a directory
+
+        :param path: Path of the directory, like '/data/x/'
+        :return: Number of records removed
+        """
+        nodes = self.__find_nodes(path=path)
+        if nodes is None or not nodes[-1].size:
+            return 0
+
+        node = nodes[-1]
+        size = node.size
+        counts = dict(node.counts)
+        node.children.clear()
+        node.files.clear()
+        self.__discount(nodes=nodes, path=path, counts=counts, size=size)
+        return size
+
+    def find(self, path: str = '/', extension: str = None) -> Iterator[Any]:
+        """Records under a directory
+
+        :param path: Path of the directory, like '/data/x/'. Default is all
+            the records
+        :param extension: Only the records with the extension, like
+            '.parquet' ('' for the files without an extension)
+        :return: Generator of the records, as added, directory by
+            directory
+        """
+        nodes = self.__find_nodes(path=path)
+        if nodes is None:
+            return iter(())
+        if extension is None:
+            return self.__iter_all(node=nodes[-1])
+        return self.__iter_extension(node=nodes[-1], extension=extension)
+
+    def count(self, path: str = '/', extension: str = None) -> int:
+        """Number of records under a directory
+
+        :param path: Path of the directory, like '/data/x/'
+        :param extension: Only the records with the extension
+        :return: Number of records
+        """
+        nodes = self.__find_nodes(path=path)
+        if nodes is None:
+            return 0
+        if extension is None:
+            return nodes[-1].size
+        return nodes[-1].counts.get(extension, 0)
+
+    def extensions(self, path: str = '/') -> Dict[str, int]:
+        """Number of records of each extension under a directory
+
+        :param path: Path of the directory, like '/data/x/'
+        :return: Dict of the extensions and their number of records
+        """
+        nodes = self.__find_nodes(path=path)
+        return dict(nodes[-1].counts) if nodes else {}
+
+    def __contains__(self, record: Any) -> bool:
+        if isinstance(record, str):
+            try:
+                record = (_split_cache or _split)(record)
+            except AbsolutePathError:
+                return False
+
+        nodes = self.__find_nodes(path=record.path)
+        return nodes is not None and record.url in nodes[-1].files.get(
+            record.extension, ())
+
+    def __len__(self) -> int:
+        return self.__root.size
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.find()
+
+    def __find_nodes(self, path: str) -> Optional[List[_PathNode]]:
+        # Nodes from the root to the directory, or None if it is not there
+        node = self.__root
+        nodes = [node]
+        for component in _path_components(path=path):
+            node = node.children.get(component)
+            if node is None:
+                return None
+            nodes.append(node)
+        return nodes
+
+    @staticmethod
+    def __discount(
+            nodes: List[_PathNode], path: str, counts: Dict[str, int],
+            size: int) -> None:
+        # Remove the counts from the directory and its parents, and the
+        # directories left empty
+        for node in nodes:
+            node.size -= size
+            for extension, count in counts.items():
+                node.counts[extension] -= count
+                if not node.counts[extension]:
+                    del node.counts[extension]
+
+        components = _path_components(path=path)
+        for index in range(len(nodes) - 1, 0, -1):
+            if nodes[index].size:
+                break
+            del nodes[index - 1].children[components[index - 1]]
+
+    @staticmethod
+    def __iter_all(node: _PathNode) -> Iterator[Any]:
+        # All the records of the subtree
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for files in node.files.values():
+                yield from files.values()
+            stack.extend(reversed(node.children.values()))
+
+    @staticmethod
+    def __iter_extension(node: _PathNode, extension: str) -> Iterator[Any]:
+        # Records of the subtree with the extension. Only the directories
+        # with records of the extension are visited.
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            yield from node.files.get(extension, {}).values()
+            stack.extend(
+                x for x in reversed(node.children.values())
+                if extension in x.counts)
+
+    def __repr__(self):
+        return f'PathIndex({self.__root.size} records)'
+
+
+def _path_components(path: str) -> List[str]:
+    # Directory names of a path like '/a/b/', or 'a/b' for the user input
+    path = path.strip('/')
+    return path.split('/') if path else []
+
+
+# Memoized '_split', see 'enable_cache'
+_split_cache = None
+
+
+def enable_cache(maxsize: int = 65536) -> None:
+    """Keep the splits of the most recently used URLs
+
+    When the same URLs are split again and again, the cached split is
+    reused instead of decoding and splitting the URL again. Used by the
+    'FileUrlSplit' constructor and 'iter_split'. Enabling the cache again
+    starts a new empty cache.
+
+    >>> enable_cache(maxsize=1024)
+    >>> FileUrlSplit('/home/user/photo.png').name
+    'photo'
+    >>> FileUrlSplit('/home/user/photo.png').extension
+    '.png'
+    >>> cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+    >>> disable_cache()
+
+    :param maxsize: Max number of URLs kept. The least recently used are
+        removed first. None is unbounded
+    """
+    global _split_cache
+    _split_cache = functools.lru_cache(maxsize=maxsize)(_split)
+
+
+def disable_cache() -> None:
+    """Stop using and remove the cache of URL splits"""
+    global _split_cache
+    _split_cache = None
+
+
+def cache_info() -> Optional[Any]:
+    """Statistics of the cache of URL splits
+
+    :return: Named tuple of hits, misses, maxsize and currsize, or None if
+        the cache is not enabled
+    """
+    return _split_cache.cache_info() if _split_cache else None
+
+
+def cache_clear() -> None:
+    """Remove all URL splits from the cache and reset its statistics"""
+    if _split_cache:
+        _split_cache.cache_clear()
+
 
 class FileUrlSplit(object):
     """Object that handles file url divisions
@@ -119,11 +1215,12 @@ class FileUrlSplit(object):
     >>> file_url_split.extension
     '.png'
     """
-    __platform = None
-    __invalid_chars = None
-    __invalid_names = None
-
-    def __init__(self, file_url: str = None) -> None:
+    def __init__(
+            self,
+            file_url: str = None,
+            lazy: bool = False,
+            path_table: PathTable = None,
+            assume_clean: bool = False) -> None:
         """Constructor
 
         It will not be checked if the file from the passed URL already exists.
@@ -136,14 +1233,170 @@ class FileUrlSplit(object):
         If the URL contains backslashes '\', then it must be escaped or passed
         as a raw string. Example: r'C:\path', 'c:\\path'
 
+        In lazy mode, only the URL is cleaned by the constructor. The path,
+        filename, extension and name are computed the first time they are
+        read, and then kept. Reading only the extension of many URLs is
+        faster this way.
+
+        With a 'PathTable', the path string is shared with the other
+        objects made with the same table.
+
+        With 'assume_clean', the URL is used as it is, without decoding,
+        fixing slashes or removing prefixes. Only use it when the URL is
+        known to be a clean absolute path, like '/home/user/photo.png'.
+
         :param file_url: URL string
+        :param lazy: Compute the URL divisions only when they are read
+        :param path_table: PathTable of shared path strings
+        :param assume_clean: The URL is already a clean absolute path
+        """
+        self.__validator = _get_validator()
+        self.__lazy = lazy
+        if assume_clean:
+            self.__url = file_url or '/'
+            self.__update_divisions()
+        elif _split_cache:
+            (self.__url, self.__path, self.__filename, self.__name,
+             self.__extension) = _split_cache(file_url)
+        else:
+            self.__url = _get_url(file_url)
+            self.__update_divisions()
+
+        if path_table is not None:
+            self.__path = path_table.intern(self.path)
+
+    @classmethod
+    def split_many(
+            cls,
+            file_urls: Iterable[str],
+            path_table: PathTable = None) -> SplitColumns:
+        """Split many URLs at once
+
+        Same result as creating a 'FileUrlSplit' object for each URL, but
+        without the cost of the objects. Only the absolute URL check is
+        performed, as in the constructor. Equal paths are the same string
+        object.
+
+        >>> columns = FileUrlSplit.split_many(
+        ...     ['/home/user/photo.png', 'file:///home/user/book.tar.gz'])
+        >>> columns.names
+        ['photo', 'book']
+        >>> columns.extensions
+        ['.png', '.tar.gz']
+
+        :param file_urls: Iterable of URL strings
+        :param path_table: PathTable of shared path strings. By default, the
+            paths are shared only between the URLs of this call
+        :raises AbsolutePathError: When an URL passed is not absolute
+        :return: SplitColumns with the lists of urls, paths, filenames, names
+            and extensions
+        """
+        intern_path = (path_table or PathTable()).intern
+        columns = SplitColumns([], [], [], [], [])
+        add_url = columns.urls.append
+        add_path = columns.paths.append
+        add_filename = columns.filenames.append
+        add_name = columns.names.append
+        add_extension = columns.extensions.append
+
+        for file_url in file_urls:
+            url = _get_url(file_url=file_url)
+            path = _get_path(url=url)
+            filename = _get_filename(url=url, path=path)
+            extension = _get_extension(filename=filename)
+
+            add_url(url)
+            add_path(intern_path(path))
+            add_filename(filename)
+            add_name(_get_name(filename=filename, extension=extension))
+            add_extension(extension)
+
+        return columns
+
+    @classmethod
+    def walk(
+            cls,
+            root: str,
+            recursive: bool = True,
+            extensions: Iterable[str] = None,
+            follow_symlinks: bool = False) -> Iterator[SplitRecord]:
+        """Split the URLs of the files of a directory tree
+
+        The directories are read with 'os.scandir', and each record is made
+        directly from the directory path and the entry name, so the URL is
+        not parsed. All files of a directory share the same path string.
+        Unreadable subdirectories are ignored, as in 'os.walk'. Only regular
+        files, and symbolic links to them, are split; FIFOs, sockets,
+        devices and broken links are not.
+
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as tmp:
+        ...     open(os.path.join(tmp, 'photo.png'), 'w').close()
+        ...     [x.filename for x in FileUrlSplit.walk(tmp)]
+        ['photo.png']
+
+        :param root: Directory, relative to the current directory or
+            absolute
+        :param recursive: Also split the files of the subdirectories
+        :param extensions: Only split the files with these extensions, like
+            ['.png', 'jpg']. An empty string is for files without extension
+        :param follow_symlinks: Also walk into the symbolic links to
+            directories, as 'os.walk(followlinks=True)'. Each directory is
+            walked only once, so link loops end
+        :raises OSError: When the root directory can not be read
+        :return: Generator of SplitRecord
         """
-        self.__set_invalid_chars()
-        self.__url = self.__get_url(file_url)
-        self.__path = self.__get_path()
-        self.__filename = self.__get_filename()
-        self.__extension = self.__get_extension()
-        self.__name = self.__get_name()
+        if extensions is not None:
+            extensions = {
+                x if not x or x[0] == '.' else '.' + x for x in extensions}
+
+        # The real paths are used as they are, nothing is decoded. As in a
+        # clean URL, the drive is removed and the separator is a slash
+        root = os.path.abspath(root)
+        root_path = os.path.splitdrive(root)[1].replace(os.sep, '/')
+        if root_path[-1] != '/':
+            root_path = root_path + '/'
+
+        # Pairs of OS directory and its URL path
+        directories = [(root, root_path)]
+
+        # Device and inode of the directories walked, to stop at link loops
+        walked = set()
+        if follow_symlinks:
+            status = os.stat(root)
+            walked.add((status.st_dev, status.st_ino))
+
+        while directories:
+            directory, path = directories.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                if directory is root:
+                    raise
+                continue
+
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=follow_symlinks):
+                            if recursive and (
+                                    not follow_symlinks
+                                    or _is_new_directory(entry, walked)):
+                                directories.append(
+                                    (entry.path, path + entry.name + '/'))
+                            continue
+
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+
+                    filename = entry.name
+                    extension = _get_extension(filename)
+                    if extensions is None or extension in extensions:
+                        yield SplitRecord(
+                            path + filename, path, filename,
+                            _get_name(filename, extension), extension)
 
     @property
     def url(self) -> str:
@@ -173,30 +1426,15 @@ class FileUrlSplit(object):
             # Clean path: AbsolutePathError
             file_url = self.__get_url(file_url=file_url)
 
-            # Valid URL chars: InvalidCharacterError
-            for split_name in file_url.split('/'):
-                # Invalid chars in dirs
-                self.__check_invalid_chars(str_to_check=split_name)
-
-                # Invalid dir name: InvalidCharacterError
-                self.__check_invalid_names(name_string=split_name)
-
-                # Valid len size
-                if len(split_name) > 255:
-                    raise FilenameTooLongError(
-                        message=(
-                            'File name too long. The file name together with '
-                            'the extension cannot exceed the limit of 255 '
-                            'characters.'))
+            # Valid URL chars, names and len size: InvalidCharacterError,
+            # InvalidFilenameError, FilenameTooLongError
+            self.__validator.check_url(url=file_url)
 
             # Update URL
-            self.__url = self.__get_url(file_url)
+            self.__url = file_url
 
             # Update the affected properties
-            self.__path = self.__get_path()
-            self.__filename = self.__get_filename()  # FilenameTooLongError
-            self.__extension = self.__get_extension()  # FilenameTooLongError
-            self.__name = self.__get_name()  # FilenameTooLongError
+            self.__update_divisions()
 
     @property
     def path(self) -> str:
@@ -206,6 +1444,8 @@ class FileUrlSplit(object):
 
         :return: File path
         """
+        if self.__path is None:
+            self.__path = _get_path(url=self.__url)
         return self.__path
 
     @path.setter
@@ -221,6 +1461,8 @@ class FileUrlSplit(object):
         :raises AbsolutePathError: When path passed is not absolute
         :raises InvalidCharacterError: If path passed contains reserved chars
         """
+        self.__load_divisions()
+
         # Clean path: AbsolutePathError
         file_path = self.__get_url(file_url=file_path)
 
@@ -228,21 +1470,9 @@ class FileUrlSplit(object):
             if file_path[-1] != '/':
                 file_path = file_path + '/'
 
-            # Valid path chars: InvalidCharacterError
-            for split_name in file_path.split('/'):
-                # Invalid chars in dirs
-                self.__check_invalid_chars(str_to_check=split_name)
-
-                # Invalid dir name: InvalidCharacterError
-                self.__check_invalid_names(name_string=split_name)
-
-                # Valid len size
-                if len(split_name) > 255:
-                    raise FilenameTooLongError(
-                        message=(
-                            'File name too long. The file name together with '
-                            'the extension cannot exceed the limit of 255 '
-                            'characters.'))
+            # Valid path chars, names and len size: InvalidCharacterError,
+            # InvalidFilenameError, FilenameTooLongError
+            self.__validator.check_url(url=file_path)
 
             # Update path
             self.__path = file_path
@@ -258,6 +1488,9 @@ class FileUrlSplit(object):
 
         :return: File name
         """
+        if self.__name is None:
+            self.__name = _get_name(
+                filename=self.filename, extension=self.extension)
         return self.__name
 
     @name.setter
@@ -276,18 +1509,20 @@ class FileUrlSplit(object):
         :raises InvalidCharacterError: If name passed contains reserved chars
         :raises FilenameTooLongError: File name with the extension is too long
         """
+        self.__load_divisions()
+
         # None | UrlEncode
-        file_name = '' if not file_name else urllib.parse.unquote(
+        file_name = '' if not file_name else _unquote(
             string=file_name, encoding='utf-8', errors='replace')
 
         if file_name != self.__name:
             if file_name:
                 # Valid chars in file name: InvalidCharacterError
-                self.__check_invalid_chars(str_to_check=file_name)
+                self.__validator.check_chars(text=file_name)
 
                 # Valid file name: InvalidCharacterError
-                self.__check_invalid_names(
-                    name_string=file_name + self.__extension)
+                self.__validator.check_name(
+                    name=file_name + self.__extension)
 
                 # Valid len size
                 if len(file_name + self.__extension) > 255:
@@ -315,6 +1550,8 @@ class FileUrlSplit(object):
 
         :return: Filename
         """
+        if self.__filename is None:
+            self.__filename = _get_filename(url=self.__url, path=self.path)
         return self.__filename
 
     @filename.setter
@@ -332,17 +1569,19 @@ class FileUrlSplit(object):
         :raises InvalidCharacterError: If name passed contains reserved chars
         :raises FilenameTooLongError: File name with the extension is too long
         """
+        self.__load_divisions()
+
         # None | UrlEncode
-        filename = '' if not filename else urllib.parse.unquote(
+        filename = '' if not filename else _unquote(
             string=filename, encoding='utf-8', errors='replace')
 
         if filename != self.__filename:
             if filename:
                 # Valid chars in filename: InvalidCharacterError
-                self.__check_invalid_chars(str_to_check=filename)
+                self.__validator.check_chars(text=filename)
 
                 # Valid filename: InvalidCharacterError
-                self.__check_invalid_names(name_string=filename)
+                self.__validator.check_name(name=filename)
 
                 # Valid len size
                 if len(filename) > 255:
@@ -353,9 +1592,9 @@ class FileUrlSplit(object):
                             'characters.'))
 
             self.__filename = filename
-            self.__url = self.__path + self.__filename
-            self.__extension = self.__get_extension()
-            self.__name = self.__get_name()
+            self.__url = self.__path + filename
+            self.__extension = extension = _get_extension(filename=filename)
+            self.__name = _get_name(filename=filename, extension=extension)
 
     @property
     def extension(self) -> str:
@@ -365,6 +1604,8 @@ class FileUrlSplit(object):
 
         :return: File extension
         """
+        if self.__extension is None:
+            self.__extension = _get_extension(filename=self.filename)
         return self.__extension
 
     @extension.setter
@@ -377,14 +1618,16 @@ class FileUrlSplit(object):
         :raises InvalidCharacterError: If name passed contains reserved chars
         :raises FilenameTooLongError: File name with the extension is too long
         """
+        self.__load_divisions()
+
         # None | UrlEncode
-        file_extension = '' if not file_extension else urllib.parse.unquote(
+        file_extension = '' if not file_extension else _unquote(
             string=file_extension, encoding='utf-8', errors='replace')
 
         if file_extension != self.__extension:
             if file_extension:
                 # Valid extension chars: InvalidCharacterError
-                self.__check_invalid_chars(str_to_check=file_extension)
+                self.__validator.check_chars(text=file_extension)
 
                 # Fix dot
                 if file_extension[0] != '.':
@@ -402,163 +1645,1567 @@ class FileUrlSplit(object):
             self.__url = self.__path + self.__name + self.__extension
             self.__filename = self.__get_filename()
 
+    def __update_divisions(self) -> None:
+        # Updates the path, filename, extension and name of the current URL
+        if self.__lazy:
+            self.__path = None
+            self.__filename = None
+            self.__extension = None
+            self.__name = None
+        else:
+            self.__path = path = _get_path(self.__url)
+            self.__filename = filename = _get_filename(self.__url, path)
+            self.__extension = extension = _get_extension(filename)
+            self.__name = _get_name(filename, extension)
+
+    def __load_divisions(self) -> None:
+        # Computes the divisions not yet read in lazy mode
+        if self.__name is None:
+            self.__name = _get_name(
+                filename=self.filename, extension=self.extension)
+
     @staticmethod
     def __get_url(file_url: str) -> str:
         # Returns a clean url
-        # Decode url-encode and remove prefix like "file://", "c:/"
         # raise: AbsolutePathError
+        return _get_url(file_url=file_url)
 
-        # Empt
-        if not file_url:
-            return '/'
+    def __get_path(self) -> str:
+        # Returns only the file path
+        return _get_path(url=self.__url)
 
-        # Decode url
-        file_url = urllib.parse.unquote(
-            string=file_url, encoding='utf-8', errors='replace')
+    def __get_filename(self) -> str:
+        # Returns the filename with the extension
+        return _get_filename(url=self.__url, path=self.__path)
 
-        # Fix slash
-        file_url = file_url.replace('\\', '/')
+    def __repr__(self):
+        return f'FileUrlSplit("{self.__url}")'
 
-        # Raise a non-absolute path
-        absolute_path_error_msg = (
-            'You need an absolute URL like: '
-            '"/path", "file://path", "file:///path" or "c:/path"')
 
-        prefix_match = re.search(r'^\w+:', file_url)  # file prefix -> c: file:
-        if prefix_match:
-            if file_url[prefix_match.end():][0] != '/':
-                raise AbsolutePathError(message=absolute_path_error_msg)
-        else:
-            if file_url[0] != '/':
-                raise AbsolutePathError(message=absolute_path_error_msg)
+class CompactFileUrlSplit(object):
+    """Read-only, memory saving version of 'FileUrlSplit'
 
-        # Match - remove prefix like "file://", "c:/"
-        match = re.search(r'/\w.+$', file_url)
-        if match:
-            file_url = file_url[match.start():match.end()]
+    Only the clean URL and two integer offsets are stored. The path, name,
+    filename and extension are slices of the URL made when the property is
+    read. Useful for keeping millions of split URLs in memory.
 
-        return file_url
+    >>> file_url_split = CompactFileUrlSplit('file:///home/user/photo.png')
+    >>> print(file_url_split)
+    CompactFileUrlSplit("/home/user/photo.png")
+    >>> file_url_split.path
+    '/home/user/'
+    >>> file_url_split.name
+    'photo'
+    >>> file_url_split.extension
+    '.png'
+    """
+    __slots__ = ('__url', '__path_end', '__extension_start')
 
-    def __get_path(self) -> str:
-        # Returns only the file path
-        path = os.path.dirname(self.__url)
-        return path if path == '/' else path + '/'
+    def __init__(self, file_url: str = None, assume_clean: bool = False
+                 ) -> None:
+        """Constructor
 
-    def __get_filename(self) -> str:
-        # Returns the filename with the extension
-        return self.__url.replace(self.__path, '')
+        Same URL rules as the 'FileUrlSplit' constructor.
 
-    def __get_extension(self) -> str:
-        # Returns only the file extension
+        :param file_url: URL string
+        :param assume_clean: The URL is already a clean absolute path
+        :raises AbsolutePathError: When URL passed is not absolute
+        """
+        url = (file_url or '/') if assume_clean else _get_url(file_url)
+        path_end = url.rfind('/') + 1
 
-        # splitext does not work for .tar*
-        # >>> filename, file_extension = os.path.splitext("/path/foo.tar.gz")
-        # >>> file_extension
-        # '.gz'
+        self.__url = url
+        self.__path_end = path_end
+        self.__extension_start = len(url) - len(
+            _get_extension(filename=url[path_end:]))
 
-        # Olhar o fim do nome do arquivo a partir do último ponto, não produz
-        # o resultado esperado, pois um arquivo de nome '.txt' não pode ser
-        # reconhecido como um arquivo de nome vazio '' e extensão '.txt', e
-        # sim como um arquivo que tem o nome oculto '.txt' e extensão vazia ''.
-        # Remover o ponto '.' no início do nome do arquivo, ajuda na posterior
-        # divisão ( split('.') ). Na extensão nada é alterado.
-        file_name = self.__filename.lstrip('.')
+    @property
+    def url(self) -> str:
+        """Get the clean url
 
-        # Arquivos sem extensão
-        if '.' not in file_name or file_name[-1] == '.':
-            return ''
+        :return: File url
+        """
+        return self.__url
+
+    @property
+    def path(self) -> str:
+        """Get file path only
 
-        # Divide o nome do arquivo em todos os pontos, criando uma lista.
-        # O último item, representam a extensão.
-        file_slices = file_name.split('.')
-
-        # Pontos no início e fim ja foram tratados, então uma lista de 2 itens
-        # representa um arquivo que só tem uma extensão.
-        # O primeiro item é o nome do arquivo, e último item é a extensão.
-        if len(file_slices) == 2:
-            return '.' + file_slices[-1]
-
-        # Lista sempre de 3 itens pra cima, representa arquivo que
-        # tem mais de uma extensão, ou pontos no meio do nome.
-        elif len(file_slices) > 2:
-
-            # Extensão interna. Futuramente, adicionar extensões internas aqui.
-            if file_slices[-2] == 'tar':
-                return '.' + file_slices[-2] + '.' + file_slices[-1]
-
-            return '.' + file_slices[-1]
-
-    def __get_name(self) -> str:
-        # Returns the file name without the extension
-        return self.__filename.replace(self.__extension, '')
-
-    def __set_invalid_chars(self) -> None:
-        # Linux:             linux or linux2 (*)
-        # Windows:           win32
-        # Windows/Cygwin:    cygwin
-        # Windows/MSYS2:     msys
-        # Mac OS X:          darwin
-        # OS/2:              os2
-        # OS/2 EMX:          os2emx
-        # RiscOS:            riscos
-        # AtheOS:            atheos
-        # FreeBSD 7:         freebsd7
-        # FreeBSD 8:         freebsd8
-        # FreeBSD N:         freebsdN
-        # OpenBSD 6:         openbsd6
-
-        if not self.__platform:
-            if sys.platform.startswith('linux'):
-                self.__platform = 'Linux'
-                self.__invalid_chars = ['/', '\\']  # Linux
-
-            elif 'bsd' in sys.platform:
-                self.__platform = 'BSD'
-                self.__invalid_chars = ['/', '\\', ':']
-
-            elif sys.platform == 'darwin':
-                self.__platform = 'Mac'
-                self.__invalid_chars = ['/', '\\', ':']
-
-            elif 'win' in sys.platform or 'msys' in sys.platform:
-                self.__platform = 'Windows'
-                self.__invalid_chars = [
-                    '\\', '/', ':', '*', '?', '"', '<', '>', '|']
-                self.__invalid_names = [
-                    'CON', 'PRN', 'AUX', 'NUL', 'COM0', 'COM1', 'COM2', 'COM3',
-                    'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT0',
-                    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7',
-                    'LPT8', 'LPT9']
+        :return: File path
+        """
+        return self.__url[:self.__path_end]
+
+    @property
+    def name(self) -> str:
+        """Get only the file name
+
+        The filename without the extension at its end.
+
+        :return: File name
+        """
+        return self.__url[self.__path_end:self.__extension_start]
+
+    @property
+    def filename(self) -> str:
+        """Get only the filename
+
+        :return: Filename
+        """
+        return self.__url[self.__path_end:]
+
+    @property
+    def extension(self) -> str:
+        """Get file extension only
+
+        :return: File extension
+        """
+        return self.__url[self.__extension_start:]
+
+    def __repr__(self):
+        return f'{type(self).__name__}("{self.__url}")'
+
+
+@functools.total_ordering
+class FrozenFileUrlSplit(CompactFileUrlSplit):
+    """Immutable and hashable version of 'FileUrlSplit'
+
+    Can be used as a dict key or in a set. Objects are equal when their
+    clean URLs are equal, and are sorted by the clean URL. Instead of
+    setters, the 'with_*' methods return a new object with the change.
+
+    >>> photo = FrozenFileUrlSplit('file:///home/user/photo.png')
+    >>> photo == FrozenFileUrlSplit('/home/user/photo.png')
+    True
+    >>> photo.with_extension('jpg')
+    FrozenFileUrlSplit("/home/user/photo.jpg")
+    >>> photo.with_path('/tmp').url
+    '/tmp/photo.png'
+    """
+    __slots__ = ('__hash',)
+
+    def __init__(self, file_url: str = None, assume_clean: bool = False
+                 ) -> None:
+        """Constructor
+
+        Same URL rules as the 'FileUrlSplit' constructor.
+
+        :param file_url: URL string
+        :param assume_clean: The URL is already a clean absolute path
+        :raises AbsolutePathError: When URL passed is not absolute
+        """
+        super().__init__(file_url=file_url, assume_clean=assume_clean)
+        self.__hash = hash(self.url)
+
+    def with_url(self, file_url: str) -> 'FrozenFileUrlSplit':
+        """New object with another URL
+
+        Runs all the error checks of the 'FileUrlSplit.url' setter.
+
+        :param file_url: New URL string
+        :raises AbsolutePathError: When URL passed is not absolute
+        :raises InvalidCharacterError: If URL passed contains reserved chars
+        :raises InvalidFilenameError: If URL passed contains reserved names
+        :raises FilenameTooLongError: File name with the extension is too long
+        """
+        return self.__with('url', file_url)
+
+    def with_path(self, file_path: str) -> 'FrozenFileUrlSplit':
+        """New object with another path
+
+        Same as the 'FileUrlSplit.path' setter.
+
+        :param file_path: New path URL string
+        :raises AbsolutePathError: When path passed is not absolute
+        :raises InvalidCharacterError: If path passed contains reserved chars
+        :raises InvalidFilenameError: If path passed contains reserved names
+        :raises FilenameTooLongError: A path name is too long
+        """
+        return self.__with('path', file_path)
+
+    def with_name(self, file_name: str) -> 'FrozenFileUrlSplit':
+        """New object with another name, keeping the extension
+
+        Same as the 'FileUrlSplit.name' setter.
+
+        :param file_name: String containing the file name
+        :raises InvalidCharacterError: If name passed contains reserved chars
+        :raises InvalidFilenameError: If name passed is reserved
+        :raises FilenameTooLongError: File name with the extension is too long
+        """
+        return self.__with('name', file_name)
+
+    def with_filename(self, filename: str) -> 'FrozenFileUrlSplit':
+        """New object with another filename (name and extension)
+
+        Same as the 'FileUrlSplit.filename' setter.
+
+        :param filename: String containing the filename
+        :raises InvalidCharacterError: If name passed contains reserved chars
+        :raises InvalidFilenameError: If name passed is reserved
+        :raises FilenameTooLongError: File name with the extension is too long
+        """
+        return self.__with('filename', filename)
+
+    def with_extension(self, file_extension: str) -> 'FrozenFileUrlSplit':
+        """New object with another extension
+
+        Same as the 'FileUrlSplit.extension' setter.
+
+        :param file_extension: String containing the filename extension
+        :raises InvalidCharacterError: If name passed contains reserved chars
+        :raises FilenameTooLongError: File name with the extension is too long
+        """
+        return self.__with('extension', file_extension)
+
+    def __with(self, attribute: str, value: str) -> 'FrozenFileUrlSplit':
+        # Copy on write with the setters of a 'FileUrlSplit'
+        file_url_split = FileUrlSplit(file_url=self.url, assume_clean=True)
+        setattr(file_url_split, attribute, value)
+        if file_url_split.url == self.url:
+            return self
+
+        return type(self)(file_url=file_url_split.url, assume_clean=True)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenFileUrlSplit):
+            return self.url == other.url
+        return NotImplemented
+
+    def __lt__(self, other: object) -> bool:
+        if isinstance(other, FrozenFileUrlSplit):
+            return self.url < other.url
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self.__hash
+
+    def __reduce__(self):
+        # The hash of a string changes between processes, so it is made
+        # again when unpickled
+        return (type(self), (self.url, True))
+
+
+def _check_errors_policy(errors: str) -> None:
+    # Policy of the bulk functions for the invalid URLs, see 'iter_split'
+    # raise: ValueError
+    if errors not in ('raise', 'skip', 'record'):
+        raise ValueError(
+            f'Unknown errors policy "{errors}". '
+            'Use "raise", "skip" or "record".')
+
+
+def iter_split(
+        lines: Iterable[str],
+        errors: str = 'raise',
+        validate: bool = False,
+        path_table: PathTable = None,
+) -> Iterator[Union[SplitRecord, SplitError]]:
+    """Lazily split URLs one at a time
+
+    Each URL is handled exactly like the 'FileUrlSplit' constructor does,
+    and only one split is kept in memory at a time.
+
+    >>> for record in iter_split(['/home/user/photo.png', 'home/x.txt'],
+    ...                          errors='skip'):
+    ...     print(record.path, record.filename)
+    /home/user/ photo.png
+
+    :param lines: Iterable of URL strings
+    :param errors: What to do with an invalid URL. "raise" raises the
+        exception, "skip" ignores the URL and "record" yields a SplitError
+        with the URL and the exception
+    :param validate: Run all the error checks of the 'url' setter, not only
+        the absolute URL check
+    :param path_table: PathTable of shared path strings, for when the
+        records are kept
+    :raises ValueError: If the errors policy is unknown
+    :raises AbsolutePathError: When an URL passed is not absolute
+    :raises InvalidCharacterError: If an URL contains reserved chars
+    :raises InvalidFilenameError: If an URL contains reserved names
+    :raises FilenameTooLongError: If an URL contains a too long name
+    :return: Generator of SplitRecord (or SplitError)
+    """
+    _check_errors_policy(errors=errors)
+
+    return _iter_split(
+        lines=lines, errors=errors, validate=validate, path_table=path_table)
+
+
+def _iter_split(
+        lines: Iterable[str],
+        errors: str,
+        validate: bool,
+        path_table: PathTable = None,
+) -> Iterator[Union[SplitRecord, SplitError]]:
+    # Generator behind 'iter_split', so that the policy is checked early
+    validator = _get_validator() if validate else None
+    split = _split_cache or _split
+
+    for line in lines:
+        try:
+            record = split(line)
+            if validator:
+                validator.check_url(url=record.url)
+            if path_table is not None:
+                record = record._replace(path=path_table.intern(record.path))
+
+        except Error as error:
+            if errors == 'raise':
+                raise
+            if errors == 'record':
+                yield SplitError(line, error)
+            continue
+
+        yield record
+
+
+def split_stream(
+        file_object: IO[str],
+        errors: str = 'raise',
+        validate: bool = False,
+        path_table: PathTable = None,
+) -> Iterator[Union[SplitRecord, SplitError]]:
+    """Lazily split a newline delimited stream of URLs
+
+    Works with text files, pipes and 'sys.stdin'. Line endings are removed
+    and empty lines are ignored. See 'iter_split' for the parameters.
+
+    >>> import io
+    >>> stream = io.StringIO('file:///tmp/photo.png\\n\\n/tmp/a.tar.gz\\n')
+    >>> [record.extension for record in split_stream(stream)]
+    ['.png', '.tar.gz']
+
+    :param file_object: Text file object opened for reading
+    :return: Generator of SplitRecord (or SplitError)
+    """
+    return iter_split(
+        lines=(line.rstrip('\r\n') for line in file_object
+               if line not in ('\n', '\r\n', '')),
+        errors=errors,
+        validate=validate,
+        path_table=path_table)
+
+
+class ByteSplit(NamedTuple):
+    """Offsets of an URL in a buffer of UTF-8 bytes
+
+    'source' is the buffer, and the URL is 'source[start:end]'. URLs that
+    had to be decoded or fixed, like 'c:\\path' or 'file:///a%20b', have
+    their clean URL string as 'source', with offsets into it. The
+    divisions are only decoded when read.
+    """
+    source: Any
+    start: int
+    path_end: int
+    extension_start: int
+    end: int
+
+    @property
+    def url(self) -> str:
+        """URL without the file prefix"""
+        return _decode_slice(self.source, self.start, self.end)
+
+    @property
+    def path(self) -> str:
+        """URL path without the filename"""
+        return _decode_slice(self.source, self.start, self.path_end)
+
+    @property
+    def filename(self) -> str:
+        """Filename with the extension"""
+        return _decode_slice(self.source, self.path_end, self.end)
+
+    @property
+    def name(self) -> str:
+        """Filename without the extension"""
+        return _decode_slice(
+            self.source, self.path_end, self.extension_start)
+
+    @property
+    def extension(self) -> str:
+        """File extension"""
+        return _decode_slice(self.source, self.extension_start, self.end)
+
+
+def _decode_slice(source: Any, start: int, end: int) -> str:
+    # Text of a slice of a buffer or of a clean URL string
+    if isinstance(source, str):
+        return source[start:end]
+    return source[start:end].decode('utf-8', 'replace')
+
+
+# ASCII word chars, the second char of an URL that needs no cleaning
+_WORD_BYTES = frozenset(
+    (string.ascii_letters + string.digits + '_').encode())
+
+
+def split_bytes(
+        buffer: Any, errors: str = 'raise',
+) -> Iterator[Union[ByteSplit, SplitError]]:
+    """Lazily split a newline delimited buffer of UTF-8 URLs into offsets
+
+    The buffer can be 'bytes', 'bytearray', 'mmap' or a 'memoryview' of
+    one of them. Clean absolute URLs, the usual lines of a manifest, are
+    split without decoding or copying the line. Only the others are
+    decoded, and cleaned exactly like the 'FileUrlSplit' constructor does.
+    Line endings are removed and empty lines are ignored.
+
+    >>> for split in split_bytes(b'/srv/photo.png\\nfile:///srv/a.tar.gz\\n'):
+    ...     print(split.start, split.path_end, split.extension, split.path)
+    0 5 .png /srv/
+    0 5 .tar.gz /srv/
+
+    :param buffer: Buffer of UTF-8 URLs, one per line
+    :param errors: What to do with an invalid URL. "raise" raises the
+        exception, "skip" ignores the URL and "record" yields a SplitError
+        with the decoded line and the exception
+    :raises ValueError: If the errors policy is unknown
+    :raises AbsolutePathError: When an URL passed is not absolute
+    :return: Generator of ByteSplit (or SplitError)
+    """
+    _check_errors_policy(errors=errors)
+
+    # 'memoryview' has no 'find', so its object is used when the view is
+    # the whole of it. Other views are copied once.
+    if isinstance(buffer, memoryview):
+        if (buffer.contiguous and buffer.nbytes == len(buffer.obj)
+                and hasattr(buffer.obj, 'rfind')):
+            buffer = buffer.obj
+        else:
+            buffer = buffer.tobytes()
+
+    return _split_bytes(buffer=buffer, errors=errors)
+
+
+def _split_bytes(
+        buffer: Any, errors: str) -> Iterator[Union[ByteSplit, SplitError]]:
+    # Generator behind 'split_bytes', so that the policy is checked early
+    size = len(buffer)
+    find = buffer.find
+    rfind = buffer.rfind
+    find_extension = _extension_rules.find_bytes
+    word_bytes = _WORD_BYTES
+
+    start = 0
+    while start < size:
+        end = find(b'\n', start)
+        if end < 0:
+            end = size
+        next_start = end + 1
+        if end > start and buffer[end - 1] == 13:  # '\r'
+            end -= 1
+
+        if end > start:
+            # Clean URL: the offsets are into the buffer
+            if (buffer[start] == 47  # '/'
+                    and (end - start < 3 or buffer[start + 1] in word_bytes)
+                    and find(b'%', start, end) < 0
+                    and find(b'\\', start, end) < 0):
+                path_end = rfind(b'/', start, end) + 1
+                yield ByteSplit(
+                    buffer, start, path_end,
+                    path_end + find_extension(buffer[path_end:end]), end)
+
+            # Others are decoded and cleaned
             else:
-                self.__platform = 'Another'
-                self.__invalid_chars = [
-                    x for x in string.punctuation
-                    if x not in ['~', ' ', '-', '_', '.']]
+                line = buffer[start:end].decode('utf-8', 'replace')
+                try:
+                    url = _get_url(file_url=line)
+                except Error as error:
+                    if errors == 'raise':
+                        raise
+                    if errors == 'record':
+                        yield SplitError(line, error)
+                else:
+                    path_end = url.rfind('/') + 1
+                    yield ByteSplit(
+                        url, 0, path_end,
+                        path_end + _extension_rules.find(url[path_end:]),
+                        len(url))
+
+        start = next_start
+
+
+class ValidationResult(NamedTuple):
+    """Validation code of many URLs
+
+    Each attribute has an item for each URL, in the input order. 'codes'
+    is an 'array.array' of VALID, INVALID_CHARACTER, INVALID_FILENAME,
+    FILENAME_TOO_LONG or NOT_ABSOLUTE_PATH. 'chars' is a list of the
+    invalid char found ('' for the other codes). 'components' is an
+    'array.array' of the index of the invalid component of the clean URL,
+    split at the slashes (-1 for VALID and NOT_ABSOLUTE_PATH).
+    """
+    codes: array.array
+    chars: List[str]
+    components: array.array
+
+
+def validate_many(
+        file_urls: Iterable[str], platform: str = None) -> ValidationResult:
+    """Validate many URLs without raising exceptions
+
+    Runs the same checks as the 'url' setter, in the same order: absolute
+    URL, then invalid chars, reserved names and too long names of each
+    component. No exception is made for the invalid URLs, so invalid
+    inputs cost the same as valid ones.
+
+    >>> result = validate_many(['/home/a.txt', 'home/b.txt', '/home/c?.txt'],
+    ...                        platform='win32')
+    >>> list(result.codes) == [VALID, NOT_ABSOLUTE_PATH, INVALID_CHARACTER]
+    True
+    >>> result.chars[2], result.components[2]
+    ('?', 2)
+
+    :param file_urls: Iterable of URL strings
+    :param platform: A 'sys.platform' value. Default is the platform used
+        by the 'FileUrlSplit' objects, see 'set_platform'
+    :return: ValidationResult of the URLs
+    """
+    find_error = _get_validator(platform=platform).find_url_error
+    codes = array.array('B')
+    chars = []
+    components = array.array('l')
+    add_code = codes.append
+    add_char = chars.append
+    add_component = components.append
+
+    for file_url in file_urls:
+        url = _clean_url(file_url=file_url)
+        error = find_error(url=url) if url is not None else None
+        if error:
+            kind, index, found = error
+            add_code(kind)
+            add_char(found if kind == INVALID_CHARACTER else '')
+            add_component(index)
+        else:
+            add_code(VALID if url is not None else NOT_ABSOLUTE_PATH)
+            add_char('')
+            add_component(-1)
 
-    def __check_invalid_chars(self, str_to_check: str) -> None:
-        # raise: InvalidCharacterError
-        for invalid_char in self.__invalid_chars:
-            if invalid_char in str_to_check:
-                raise InvalidCharacterError(
-                    message=f"Cannot contain '{invalid_char}'",
-                    invalid_character_found=invalid_char,
-                    all_invalid_characters_list=self.__invalid_chars,
-                )
-
-    def __check_invalid_names(self, name_string: str) -> None:
-        if self.__invalid_names:
-            if name_string in self.__invalid_names:
-                raise InvalidFilenameError(
-                    message=(f'The name "{name_string}" is reserved and '
-                             'cannot be used.'),
-                    all_invalid_filename_list=self.__invalid_names,
-                )
+    return ValidationResult(codes, chars, components)
+
+
+class ArraySplit(NamedTuple):
+    """Offsets and extension codes of many URLs
+
+    With NumPy, each attribute is a NumPy array. Without it, 'urls' and
+    'extensions' are lists and the others are 'array.array' of ints.
+    The path of an URL is 'url[:path_end]', the filename is
+    'url[path_end:]' and the extension is 'url[extension_start:]' or
+    'extensions[extension_code]'.
+    """
+    urls: Any
+    path_ends: Any
+    extension_starts: Any
+    extension_codes: Any
+    extensions: Any
+
+
+def split_array(
+        file_urls: Iterable[str], use_numpy: bool = None) -> ArraySplit:
+    """Split many URLs into offsets and extension codes
+
+    No Python object is made for each division of the URL. With NumPy, the
+    slashes and dots are found with vectorized string operations, and the
+    extensions are returned as codes of a sorted array of unique
+    extensions. Without NumPy, the same result is computed in pure Python.
+
+    >>> result = split_array(['/home/user/photo.png', '/tmp/a.tar.gz'])
+    >>> [int(x) for x in result.path_ends]
+    [11, 5]
+    >>> [str(result.extensions[x]) for x in result.extension_codes]
+    ['.png', '.tar.gz']
+
+    :param file_urls: Iterable (or NumPy array) of URL strings
+    :param use_numpy: Use NumPy if True, pure Python if False. Default is to
+        use NumPy when it is installed
+    :raises ImportError: If use_numpy is True and NumPy is not installed
+    :raises AbsolutePathError: When an URL passed is not absolute
+    :return: ArraySplit with the URLs, offsets and extension codes
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise ImportError('NumPy is not installed')
+
+    if use_numpy:
+        return _split_array_numpy(file_urls=file_urls)
+
+    urls = []
+    path_ends = array.array('l')
+    extension_starts = array.array('l')
+    extension_codes = array.array('l')
+    codes = {}
+
+    for file_url in file_urls:
+        url = _get_url(file_url=file_url)
+        path_end = url.rfind('/') + 1
+        extension = _get_extension(filename=url[path_end:])
+
+        urls.append(url)
+        path_ends.append(path_end)
+        extension_starts.append(len(url) - len(extension))
+        extension_codes.append(codes.setdefault(extension, len(codes)))
+
+    # Sorted extensions, as 'numpy.unique' does
+    extensions = sorted(codes)
+    new_codes = {codes[x]: index for index, x in enumerate(extensions)}
+    extension_codes = array.array(
+        'l', (new_codes[x] for x in extension_codes))
+
+    return ArraySplit(
+        urls, path_ends, extension_starts, extension_codes, extensions)
+
+
+def _split_array_numpy(file_urls: Iterable[str]) -> ArraySplit:
+    # NumPy version of 'split_array'
+    if isinstance(file_urls, numpy.ndarray) and file_urls.dtype.kind == 'U':
+        urls = file_urls.ravel()
+        is_copy = False
+    else:
+        # None and '' are the root path, as in '_get_url'
+        urls = numpy.array([x or '/' for x in file_urls], dtype=str)
+        is_copy = True
+    if not urls.size:
+        empty = numpy.zeros(0, dtype=int)
+        return ArraySplit(urls, empty, empty, empty, numpy.zeros(0, str))
+
+    # Only the URLs that are not already clean absolute paths are cleaned,
+    # in Python, and put back in their place. A clean URL starts with a
+    # slash followed by a word char and has no '%', backslash or line
+    # break. Cleaning never makes an URL longer, except '' that becomes '/',
+    # so the clean URLs fit in the array.
+    second_char = urls.astype('U2').view('U1').reshape(-1, 2)[:, 1]
+    clean = (
+        numpy.char.startswith(urls, '/')
+        & (numpy.char.isalnum(second_char) | (second_char == '_'))
+        & (numpy.char.find(urls, '%') < 0)
+        & (numpy.char.find(urls, '\\') < 0)
+        & (numpy.char.find(urls, '\n') < 0))
+    dirty = numpy.flatnonzero(~clean)
+    if dirty.size:
+        if not is_copy:
+            urls = urls.copy()
+        urls[dirty] = [_get_url(file_url=x) for x in urls[dirty].tolist()]
+
+    path_ends = numpy.char.rfind(urls, '/') + 1
+    url_ends = numpy.char.str_len(urls)
+    url_list = urls.tolist()
+
+    # Same rules as '_get_extension', with the offsets of the dots: hidden
+    # files have no extension and, with the default rules, 'name.tar.ext'
+    # has the extension '.tar.ext'
+    if set(_extension_rules) == {'.tar.*'}:
+        last_dots = numpy.char.rfind(urls, '.', path_ends)
+        last_dot_ends = numpy.maximum(last_dots, path_ends)
+        has_extension = (
+            (last_dots > path_ends) & (last_dots < url_ends - 1)
+            & (numpy.char.count(urls, '.', path_ends, last_dot_ends)
+               < last_dots - path_ends))
+
+        tar_dots = numpy.char.rfind(urls, '.', path_ends, last_dot_ends)
+        is_tar = (
+            has_extension & (last_dots - tar_dots == 4)
+            & numpy.char.endswith(urls, '.tar', 0, last_dot_ends)
+            & (numpy.char.count(
+                urls, '.', path_ends, numpy.maximum(tar_dots, path_ends))
+               < tar_dots - path_ends))
+
+        extension_starts = numpy.where(
+            is_tar, tar_dots, numpy.where(has_extension, last_dots, url_ends))
+
+    # Other compound extension rules are found for each filename
+    else:
+        extension_starts = path_ends + numpy.fromiter(
+            (_extension_rules.find(url[path_end:])
+             for url, path_end in zip(url_list, path_ends.tolist())),
+            dtype=int, count=len(url_list))
+
+    # Sorted extensions, as 'numpy.unique' does, without sorting all URLs
+    url_extensions = [
+        url[start:]
+        for url, start in zip(url_list, extension_starts.tolist())]
+    extensions = sorted(dict.fromkeys(url_extensions))
+    codes = {x: index for index, x in enumerate(extensions)}
+    extension_codes = numpy.fromiter(
+        map(codes.__getitem__, url_extensions), dtype=int,
+        count=len(url_extensions))
+
+    return ArraySplit(
+        urls, path_ends, extension_starts, extension_codes,
+        numpy.array(extensions, dtype=str))
+
+
+# Chunk size limits for 'split_parallel'. Small chunks make the pickle and
+# pipe overhead bigger than the split itself, big chunks leave workers idle.
+_MIN_PARALLEL_CHUNK = 2_000
+_MAX_PARALLEL_CHUNK = 50_000
+
+
+def split_parallel(
+        file_urls: Iterable[str],
+        workers: int = None,
+        chunksize: int = None,
+        errors: str = 'raise',
+        validate: bool = False,
+) -> List[Union[Tuple[str, str, str, str, str], SplitError]]:
+    """Split URLs using multiple processes
+
+    The URLs are divided into chunks that are split in a process pool.
+    The result is in the same order as the input. Small inputs, or a single
+    worker, are split in the current process, as the pool would only add
+    the cost of sending the data.
+
+    The splits are plain tuples of the 'SplitRecord' fields, and equal
+    paths are the same string object. The parent process unpickles all the
+    results alone, and named tuples take about twice as long, which would
+    limit the speedup of many workers.
+
+    >>> records = split_parallel(['/home/user/photo.png', '/tmp/a.tar.gz'])
+    >>> [extension for url, path, filename, name, extension in records]
+    ['.png', '.tar.gz']
+    >>> SplitRecord._make(records[0]).name
+    'photo'
+
+    :param file_urls: Iterable of URL strings
+    :param workers: Number of processes. Default is the number of CPUs
+    :param chunksize: Number of URLs sent to a process at once. By default,
+        it is chosen so that each worker gets about 4 chunks
+    :param errors: Error policy, see 'iter_split'
+    :param validate: Run all the error checks, see 'iter_split'
+    :raises ValueError: If the errors policy is unknown
+    :return: List of (url, path, filename, name, extension) tuples (or
+        SplitError)
+    """
+    _check_errors_policy(errors=errors)
+
+    file_urls = list(file_urls)
+    workers = workers or os.cpu_count() or 1
+    if not chunksize:
+        chunksize = min(
+            max(-(-len(file_urls) // (workers * 4)), _MIN_PARALLEL_CHUNK),
+            _MAX_PARALLEL_CHUNK)
+
+    if workers == 1 or len(file_urls) <= chunksize:
+        return _split_chunk(file_urls, errors, validate)
+
+    chunks = [
+        file_urls[index:index + chunksize]
+        for index in range(0, len(file_urls), chunksize)]
+
+    records = []
+    # Workers started with "spawn" import the module again, so the
+    # settings of this process are sent to them
+    pool = concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker,
+        initargs=_worker_settings())
+    futures = [
+        pool.submit(_split_chunk, chunk, errors, validate)
+        for chunk in chunks]
+    try:
+        for future in futures:
+            records.extend(future.result())
+
+    except BaseException:
+        # The chunks not started yet are dropped, instead of being split
+        # only to be thrown away
+        for future in futures:
+            future.cancel()
+        raise
+
+    finally:
+        pool.shutdown(wait=False)
+
+    return records
+
+
+def _worker_settings() -> tuple:
+    # Settings of this process used by the splits, see '_init_worker'
+    return (_platform_override, _extension_rules)
+
+
+def _init_worker(
+        platform: Optional[str], extension_rules: ExtensionRules) -> None:
+    # Initializer of the pool workers, with the settings of the parent
+    set_platform(platform=platform)
+    set_extension_rules(rules=extension_rules)
+
+
+def _split_chunk(
+        file_urls: List[str],
+        errors: str,
+        validate: bool,
+) -> List[Union[Tuple[str, str, str, str, str], SplitError]]:
+    # Worker of 'split_parallel'. Plain tuples are sent back, and the equal
+    # paths of a chunk are pickled only once, as the same string.
+    paths = {}
+    rows = []
+    add_row = rows.append
+    for record in _iter_split(
+            lines=file_urls, errors=errors, validate=validate):
+        if type(record) is SplitError:
+            add_row(record)
+            continue
+
+        url, path, filename, name, extension = record
+        add_row((url, paths.setdefault(path, path), filename, name, extension))
+
+    return rows
+
+
+class StatRecord(NamedTuple):
+    """Split of an URL with the status of its file
+
+    'size' and 'mtime' are None when the file does not exist.
+    """
+    record: SplitRecord
+    exists: bool
+    size: Optional[int]
+    mtime: Optional[float]
+
+
+async def stat_split(
+        file_urls: Iterable[str],
+        workers: int = 8,
+        errors: str = 'raise',
+) -> AsyncIterator[Union[StatRecord, SplitError]]:
+    """Split URLs and get the status of their files, concurrently
+
+    This is the only function that accesses the file system. As 'os.stat'
+    blocks, the files are checked in a pool of threads, and the results are
+    yielded as they complete, so not in the input order. The clean URL is
+    the file path checked, so on Windows the drive is not considered.
+
+    >>> async def sizes(urls):
+    ...     return [x.size async for x in stat_split(urls)]
+    >>> asyncio.run(sizes(['/no/such/file.txt']))
+    [None]
+
+    :param file_urls: Iterable of URL strings
+    :param workers: Max number of files checked at the same time
+    :param errors: What to do with an invalid URL, see 'iter_split'. A
+        file that cannot be checked (other than a missing file) is an
+        error too, and its SplitError has the clean URL and the 'OSError'
+        or 'ValueError' of 'os.stat'
+    :raises ValueError: If the errors policy is unknown, or the URL has a
+        NUL char
+    :raises AbsolutePathError: When an URL passed is not absolute
+    :raises OSError: When a file cannot be checked
+    :return: Async generator of StatRecord (or SplitError)
+    """
+    records = iter_split(lines=file_urls, errors=errors)
+    loop = asyncio.get_running_loop()
+
+    # Not a 'with' block: its exit waits for all the threads, which would
+    # block the event loop when the consumer stops early
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    pending = set()
+    try:
+        for record in records:
+            if isinstance(record, SplitError):
+                yield record
+                continue
+
+            pending.add(loop.run_in_executor(pool, _stat_record, record))
+
+            # Bounded: only a few URLs wait for a thread at a time
+            if len(pending) >= workers * 2:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                for result in _stat_results(done=done, errors=errors):
+                    yield result
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED)
+            for result in _stat_results(done=done, errors=errors):
+                yield result
+
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
+def _stat_results(
+        done: Iterable[asyncio.Future],
+        errors: str) -> Iterator[Union[StatRecord, SplitError]]:
+    # Results of the finished '_stat_record' calls, with the errors policy
+    for future in done:
+        result = future.result()
+        if isinstance(result, SplitError):
+            if errors == 'raise':
+                raise result.error
+            if errors == 'skip':
+                continue
+        yield result
+
+
+def _stat_record(record: SplitRecord) -> Union[StatRecord, SplitError]:
+    # Status of the file of a 'stat_split' record. Other errors than a
+    # missing file, like a name too long, a permission denied or a NUL
+    # char, are returned for the errors policy.
+    try:
+        status = os.stat(record.url)
+    except (FileNotFoundError, NotADirectoryError):
+        return StatRecord(record, False, None, None)
+    except (OSError, ValueError) as error:
+        return SplitError(record.url, error)
+
+    return StatRecord(record, True, status.st_size, status.st_mtime)
+
+
+class RenamePlan(NamedTuple):
+    """Result of 'plan_renames'
+
+    'sources' and 'targets' are the clean URLs before and after the
+    rename, in the input order. 'collisions' has each target URL that more
+    than one source is renamed to, with the list of those sources.
+    'errors' has the URLs that could not be renamed, when the "record"
+    error policy is used.
+    """
+    sources: List[str]
+    targets: List[str]
+    collisions: Dict[str, List[str]]
+    errors: List[SplitError]
+
+
+def plan_renames(
+        file_urls: Iterable[str],
+        extension: str = None,
+        path: str = None,
+        name_template: str = None,
+        errors: str = 'raise') -> RenamePlan:
+    """Plan the rename of many files at once
+
+    Computes the new URL of each file as the 'extension', 'path' and 'name'
+    setters of 'FileUrlSplit' would, with the same error checks. The new
+    extension and path are checked only once for all files. No file is
+    renamed, only the URLs are computed.
+
+    The name template is a 'str.format' string with the fields "name",
+    "extension" (the old ones) and "index" (position in the input).
+
+    >>> plan = plan_renames(
+    ...     ['/home/user/a.txt', '/tmp/b.txt', '/home/user/b.md'],
+    ...     extension='md', path='/srv/docs/',
+    ...     name_template='{name}_{index:02}')
+    >>> plan.targets
+    ['/srv/docs/a_00.md', '/srv/docs/b_01.md', '/srv/docs/b_02.md']
+    >>> plan_renames(['/tmp/a.txt', '/home/a.txt'], path='/srv').collisions
+    {'/srv/a.txt': ['/tmp/a.txt', '/home/a.txt']}
+
+    :param file_urls: Iterable of URL strings
+    :param extension: New extension for all files. None keeps the extension
+        of each file and an empty string removes it
+    :param path: New path for all files. None keeps the path of each file
+    :param name_template: Template of the new name of each file, without
+        the extension. None keeps the name of each file
+    :param errors: What to do with a file that can not be renamed, see
+        'iter_split'. A wrong new extension or path always raises
+    :raises ValueError: If the errors policy is unknown
+    :raises AbsolutePathError: When an URL or the path is not absolute
+    :raises InvalidCharacterError: If a new value contains reserved chars
+    :raises InvalidFilenameError: If a new name is reserved
+    :raises FilenameTooLongError: A new file name is too long
+    :return: RenamePlan with the sources, targets and collisions
+    """
+    _check_errors_policy(errors=errors)
+
+    validator = _get_validator()
+
+    # The new extension and path are the same for all files, as the
+    # setters, decode and check them only once
+    if extension:
+        extension = _unquote(
+            string=extension, encoding='utf-8', errors='replace')
+        validator.check_chars(text=extension)
+        if extension[0] != '.':
+            extension = '.' + extension
+
+    if path is not None:
+        path = _get_url(file_url=path)
+        if path[-1] != '/':
+            path = path + '/'
+        validator.check_url(url=path)
+
+    plan = RenamePlan([], [], {}, [])
+    first_sources = {}
+
+    for index, file_url in enumerate(file_urls):
+        try:
+            source = _split(file_url=file_url)
+            target = _rename_target(
+                source=source, index=index, extension=extension, path=path,
+                name_template=name_template, validator=validator)
+
+        except Error as error:
+            if errors == 'raise':
+                raise
+            if errors == 'record':
+                plan.errors.append(SplitError(file_url, error))
+            continue
+
+        plan.sources.append(source.url)
+        plan.targets.append(target)
+
+        # Collisions: index of the targets by URL
+        first_source = first_sources.setdefault(target, source.url)
+        if first_source != source.url:
+            plan.collisions.setdefault(target, [first_source]).append(
+                source.url)
+
+    return plan
+
+
+def _rename_target(
+        source: SplitRecord,
+        index: int,
+        extension: Optional[str],
+        path: Optional[str],
+        name_template: Optional[str],
+        validator: '_Validator') -> str:
+    # New URL of a file of 'plan_renames'
+    # raise: InvalidCharacterError, InvalidFilenameError,
+    # FilenameTooLongError
+    new_extension = source.extension if extension is None else extension
+
+    if name_template is None:
+        name = source.name
+    else:
+        name = name_template.format(
+            name=source.name, extension=source.extension, index=index)
+        if '%' in name:
+            name = _unquote(
+                string=name, encoding='utf-8', errors='replace')
+        if name:
+            validator.check_chars(text=name)
+            validator.check_name(name=name + new_extension)
+
+    filename = name + new_extension
+    if filename != source.filename and len(filename) > 255:
+        raise FilenameTooLongError(
+            message=(
+                'File name too long. The file name together with '
+                'the extension cannot exceed the limit of 255 '
+                'characters.'))
+
+    return (source.path if path is None else path) + filename
+
+
+class GroupStats(object):
+    """Counts and byte totals of URLs grouped by a key
+
+    'counts' and 'sizes' are 'collections.Counter' of the key, like the
+    extension. 'errors' has a SplitError for each invalid URL, when the
+    errors policy is "record". Partial results, like those of many
+    workers, are merged with 'update' or '+'.
+
+    >>> a = group_by(['/a/x.png', '/a/y.png'], sizes=[10, 20])
+    >>> b = group_by(['/b/z.txt'], sizes=[5])
+    >>> total = a + b
+    >>> total.counts.most_common()
+    [('.png', 2), ('.txt', 1)]
+    >>> total.sizes['.png']
+    30
+    """
+
+    def __init__(self, key: str = 'extension') -> None:
+        """Constructor
+
+        :param key: Name of the key, "extension", "path" or "depth"
+        """
+        self.key = key
+        self.counts = collections.Counter()
+        self.sizes = collections.Counter()
+        self.errors = []
+
+    def update(self, other: 'GroupStats') -> 'GroupStats':
+        """Add the counts, sizes and errors of other GroupStats
+
+        :param other: GroupStats with the same key
+        :raises ValueError: If the keys are not the same
+        :return: This object
+        """
+        if other.key != self.key:
+            raise ValueError(
+                f'Cannot merge groups by "{self.key}" and by "{other.key}"')
+
+        self.counts.update(other.counts)
+        self.sizes.update(other.sizes)
+        self.errors.extend(other.errors)
+        return self
+
+    def __add__(self, other: 'GroupStats') -> 'GroupStats':
+        return GroupStats(key=self.key).update(self).update(other)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, GroupStats):
+            return NotImplemented
+        return (
+            (self.key, self.counts, self.sizes, self.errors) ==
+            (other.key, other.counts, other.sizes, other.errors))
 
     def __repr__(self):
-        return f'FileUrlSplit("{self.__url}")'
+        return (
+            f'GroupStats(key="{self.key}", groups={len(self.counts)}, '
+            f'urls={sum(self.counts.values())})')
+
+
+def _extension_key(url: str) -> str:
+    # Extension of a clean URL, without making the other divisions
+    return _extension_rules.extension(url[url.rfind('/') + 1:])
+
+
+def _path_key(url: str) -> str:
+    # Path of a clean URL
+    return url[:url.rfind('/') + 1]
+
+
+def _depth_key(url: str) -> int:
+    # Number of directories in the path of a clean URL, 0 for '/file'
+    return url.count('/') - 1
+
+
+_GROUP_KEYS = {
+    'extension': _extension_key,
+    'path': _path_key,
+    'depth': _depth_key,
+}
+
+
+def group_by(
+        file_urls: Iterable[str],
+        key: str = 'extension',
+        sizes: Iterable[int] = None,
+        errors: str = 'raise') -> GroupStats:
+    """Count URLs grouped by extension, path or depth
+
+    The URLs are read one at a time, and only the division used as the key
+    is made, so a stream of any size can be counted with little memory.
+    The depth is the number of directories in the path.
+
+    >>> stats = group_by(['/home/a.png', '/home/user/b.png', '/c.txt'])
+    >>> stats.counts['.png']
+    2
+    >>> group_by(['/home/a.png', '/home/user/b.png'], key='depth').counts
+    Counter({1: 1, 2: 1})
+
+    :param file_urls: Iterable of URL strings
+    :param key: Group by "extension", "path" or "depth"
+    :param sizes: Iterable of the byte size of each URL, in the same order
+    :param errors: What to do with an invalid URL. "raise" raises the
+        exception, "skip" ignores the URL and "record" adds a SplitError
+        to 'errors'
+    :raises ValueError: If the key or the errors policy is unknown, or the
+        sizes are not as many as the URLs
+    :raises AbsolutePathError: When an URL passed is not absolute
+    :return: GroupStats of the URLs
+    """
+    if key not in _GROUP_KEYS:
+        raise ValueError(
+            f'Unknown key "{key}". Use "extension", "path" or "depth".')
+    _check_errors_policy(errors=errors)
+
+    get_key = _GROUP_KEYS[key]
+    stats = GroupStats(key=key)
+    counts = stats.counts
+
+    # Fastest path: counted by 'Counter' itself
+    if sizes is None and errors == 'raise':
+        counts.update(map(get_key, map(_get_url, file_urls)))
+        return stats
+
+    totals = stats.sizes
+    # The shorter of the URLs and sizes is filled with 'missing', so that
+    # no URL is dropped from the counts without an error
+    missing = object()
+    pairs = itertools.zip_longest(
+        file_urls, sizes, fillvalue=missing) if sizes is not None else (
+        (file_url, 0) for file_url in file_urls)
+    for file_url, size in pairs:
+        if file_url is missing or size is missing:
+            raise ValueError('The URLs and the sizes differ in length.')
+        try:
+            group = get_key(_get_url(file_url))
+        except Error as error:
+            if errors == 'raise':
+                raise
+            if errors == 'record':
+                stats.errors.append(SplitError(file_url, error))
+            continue
+
+        counts[group] += 1
+        if size:
+            totals[group] += size
+
+    return stats
+
+
+# Stages timed by 'enable_instrumentation': the stage name, the namespace
+# (module globals or class) and the name of the function in it
+_INSTRUMENTED_STAGES = (
+    ('get_url', globals(), '_get_url'),
+    ('clean_url', globals(), '_clean_url'),
+    ('unquote', globals(), '_unquote'),
+    ('match_prefix', globals(), '_match_prefix'),
+    ('search_path', globals(), '_search_path'),
+    ('get_path', globals(), '_get_path'),
+    ('get_filename', globals(), '_get_filename'),
+    ('get_extension', globals(), '_get_extension'),
+    ('get_name', globals(), '_get_name'),
+    ('validate_url', _Validator, 'find_url_error'),
+    ('validate_chars', _Validator, 'check_chars'),
+    ('validate_name', _Validator, 'check_name'),
+)
+
+# Counters of the instrumentation, None when disabled
+_instrumentation = None
+
+
+def enable_instrumentation() -> None:
+    """Count and time each stage of the split
+
+    The functions of each stage (URL decoding, prefix removal, path,
+    filename, extension, name and validation) are replaced by timed
+    versions, which count the calls and their total time. The URLs that
+    take the fast path (nothing to decode or fix) and the exceptions made,
+    by type, are also counted. When disabled, the original functions are
+    used, with no cost at all. Enabling it again keeps the counters.
+
+    >>> enable_instrumentation()
+    >>> FileUrlSplit('file:///home/user/photo.png').extension
+    '.png'
+    >>> snapshot = instrumentation_snapshot()
+    >>> snapshot['slow_path'], snapshot['stages']['get_path']['calls']
+    (1, 1)
+    >>> disable_instrumentation()
+    >>> instrumentation_clear()
+    """
+    global _instrumentation
+    if _instrumentation is not None and _instrumentation['enabled']:
+        return
+    if _instrumentation is None:
+        _instrumentation = _new_instrumentation()
+    _instrumentation['enabled'] = True
+
+    stages = _instrumentation['stages']
+    for stage, namespace, attribute in _INSTRUMENTED_STAGES:
+        _set_function(namespace, attribute, _timed(
+            function=_get_function(namespace, attribute),
+            counters=stages[stage]))
+
+    globals()['_is_clean_url'] = _counted_fast_path(
+        function=_is_clean_url, counters=_instrumentation)
+    Error.__init__ = _counted_error_init
+
+
+def disable_instrumentation() -> None:
+    """Stop counting and timing, and use the original functions again
+
+    The counters are kept, see 'instrumentation_clear'.
+    """
+    if _instrumentation is None or not _instrumentation['enabled']:
+        return
+    _instrumentation['enabled'] = False
+
+    for _, namespace, attribute in _INSTRUMENTED_STAGES:
+        _set_function(
+            namespace, attribute,
+            _get_function(namespace, attribute).__wrapped__)
+
+    globals()['_is_clean_url'] = _is_clean_url.__wrapped__
+    del Error.__init__
+
+
+def instrumentation_snapshot() -> Dict[str, Any]:
+    """Copy of the instrumentation counters
+
+    The dict has:
+    'enabled': True while the instrumentation is enabled.
+    'stages': Dict of each stage name to a dict of 'calls' and 'ns', the
+    number of calls and their total nanoseconds. A stage includes the time
+    of the stages it calls, like 'get_url' includes 'unquote'.
+    'fast_path' and 'slow_path': Number of URLs that were clean already,
+    and that had to be decoded or fixed.
+    'cache': Dict of the 'cache_info' counters, or None.
+    'exceptions': Dict of each exception type name to the number made.
+
+    :return: Dict of the counters
+    """
+    counters = _instrumentation or _new_instrumentation()
+    info = cache_info()
+    return {
+        'enabled': counters['enabled'],
+        'stages': {
+            stage: {'calls': calls, 'ns': ns}
+            for stage, (calls, ns) in counters['stages'].items()},
+        'fast_path': counters['fast_path'],
+        'slow_path': counters['slow_path'],
+        'cache': info._asdict() if info else None,
+        'exceptions': dict(counters['exceptions']),
+    }
+
+
+def instrumentation_clear() -> None:
+    """Reset the instrumentation counters to zero"""
+    if _instrumentation is None:
+        return
+    for counters in _instrumentation['stages'].values():
+        counters[:] = [0, 0]
+    _instrumentation['fast_path'] = 0
+    _instrumentation['slow_path'] = 0
+    _instrumentation['exceptions'].clear()
+
+
+def _new_instrumentation() -> Dict[str, Any]:
+    # Zeroed counters. Each stage has a list of calls and nanoseconds.
+    return {
+        'enabled': False,
+        'stages': {x[0]: [0, 0] for x in _INSTRUMENTED_STAGES},
+        'fast_path': 0,
+        'slow_path': 0,
+        'exceptions': collections.Counter(),
+    }
+
+
+def _get_function(namespace: Any, attribute: str) -> Any:
+    # Function of the module globals or of a class
+    if isinstance(namespace, dict):
+        return namespace[attribute]
+    return getattr(namespace, attribute)
+
+
+def _set_function(namespace: Any, attribute: str, function: Any) -> None:
+    # Replace a function of the module globals or of a class
+    if isinstance(namespace, dict):
+        namespace[attribute] = function
+    else:
+        setattr(namespace, attribute, function)
+
+
+def _timed(function: Any, counters: List[int]) -> Any:
+    # Version of the function that counts its calls and time
+    perf_counter_ns = time.perf_counter_ns
+
+    @functools.wraps(function)
+    def timed(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            counters[0] += 1
+            counters[1] += perf_counter_ns() - start
+
+    return timed
+
+
+def _counted_fast_path(function: Any, counters: Dict[str, Any]) -> Any:
+    # Version of '_is_clean_url' that counts the fast and slow paths
+    @functools.wraps(function)
+    def counted(*args, **kwargs):
+        is_clean = function(*args, **kwargs)
+        counters['fast_path' if is_clean else 'slow_path'] += 1
+        return is_clean
+
+    return counted
+
+
+def _counted_error_init(self: Error, *args: Any) -> None:
+    # 'Error.__init__' while instrumented, called by all the exceptions of
+    # the module
+    _instrumentation['exceptions'][type(self).__name__] += 1
+    Exception.__init__(self, *args)
+
+
+# Columns of the command line output, see 'main'
+_CLI_COLUMNS = ('url', 'path', 'filename', 'name', 'extension')
+
+# Number of lines read, split and written at once by 'main'
+_CLI_CHUNK = 10_000
+
+
+def main(argv: List[str] = None) -> int:
+    """Command line interface
+
+    Reads URLs, one per line, from files or the standard input, and writes
+    their divisions as TSV or JSON Lines to the standard output. Run with
+    '--help' for the options.
+
+    :param argv: Arguments, without the program name. Default is
+        'sys.argv[1:]'
+    :return: Exit status, 0 on success
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='fileurlsplit',
+        description=(
+            'Split file URLs, one per line, into url, path, filename, name '
+            'and extension columns.'))
+    parser.add_argument(
+        'files', nargs='*', default=['-'], metavar='FILE',
+        help='Files of URLs. Default (or "-") is the standard input')
+    parser.add_argument(
+        '-c', '--columns', default=','.join(_CLI_COLUMNS),
+        help=f'Comma separated columns. Default is "{",".join(_CLI_COLUMNS)}"')
+    parser.add_argument(
+        '-f', '--format', choices=['tsv', 'jsonl'], default='tsv',
+        help='Output format. Default is "tsv"')
+    parser.add_argument(
+        '--header', action='store_true', help='Write the TSV column names')
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='Number of processes. Default is 1')
+    parser.add_argument(
+        '--validate', action='store_true',
+        help='Run all the checks of the url setter, not only the absolute '
+             'URL check')
+    parser.add_argument(
+        '--errors', choices=['raise', 'skip', 'record'], default='raise',
+        help='Invalid URLs: "raise" stops with an error, "skip" ignores '
+             'them and "record" writes them with the error to the standard '
+             'error. Default is "raise"')
+    parser.add_argument(
+        '--doctest', action='store_true',
+        help='Run the docstring tests of the module and exit')
+    args = parser.parse_args(argv)
+
+    if args.doctest:
+        import doctest
+        return 1 if doctest.testmod(m=sys.modules[__name__]).failed else 0
+
+    columns = tuple(x.strip() for x in args.columns.split(','))
+    unknown = [x for x in columns if x not in _CLI_COLUMNS]
+    if unknown:
+        parser.error(f'unknown columns: {", ".join(unknown)}')
+    if args.jobs < 1:
+        parser.error('--jobs must be 1 or more')
+
+    try:
+        if args.header and args.format == 'tsv':
+            sys.stdout.write('\t'.join(columns) + '\n')
+
+        for text, error_text, error in _cli_chunks(
+                chunks=_cli_read(files=args.files), jobs=args.jobs,
+                columns=columns, output_format=args.format,
+                errors=args.errors, validate=args.validate):
+            sys.stdout.write(text)
+            if error_text:
+                sys.stderr.write(error_text)
+            if error:
+                sys.stdout.flush()
+                sys.stderr.write(f'fileurlsplit: {error}\n')
+                return 1
+
+        sys.stdout.flush()
+
+    except BrokenPipeError:
+        # The reader, like 'head', closed the pipe. Python would write an
+        # error when flushing the standard output at exit.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+
+    except OSError as error:
+        sys.stderr.write(f'fileurlsplit: {error}\n')
+        return 1
+
+    return 0
+
+
+def _cli_read(files: List[str]) -> Iterator[List[str]]:
+    # Chunks of the lines of the files, without line endings and empty lines
+    chunk = []
+    for file in files:
+        file_object = (
+            sys.stdin if file == '-'
+            else open(file, encoding='utf-8', errors='replace'))
+        try:
+            for line in file_object:
+                line = line.rstrip('\r\n')
+                if line:
+                    chunk.append(line)
+                    if len(chunk) == _CLI_CHUNK:
+                        yield chunk
+                        chunk = []
+        finally:
+            if file_object is not sys.stdin:
+                file_object.close()
+
+    if chunk:
+        yield chunk
+
+
+def _cli_chunks(
+        chunks: Iterator[List[str]], jobs: int, **kwargs: Any,
+) -> Iterator[Tuple[str, str, Optional[str]]]:
+    # Formatted chunks, in the input order. With many jobs, a few chunks
+    # per process are sent ahead, so the input is never read all at once.
+    if jobs == 1:
+        for chunk in chunks:
+            yield _cli_format(chunk, **kwargs)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker,
+            initargs=_worker_settings()) as pool:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_cli_format, chunk, **kwargs))
+            if len(pending) >= jobs * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _cli_format(
+        lines: List[str],
+        columns: Tuple[str, ...],
+        output_format: str,
+        errors: str,
+        validate: bool) -> Tuple[str, str, Optional[str]]:
+    # Split and format a chunk. Returns the output text, the text of the
+    # recorded errors and the message of the error that stops the program.
+    # Only strings are sent back by the workers.
+    if output_format == 'jsonl':
+        import json
+    indexes = [SplitRecord._fields.index(x) for x in columns]
+    rows = []
+    error_rows = []
+    for record in _iter_split(
+            lines=lines, errors='skip' if errors == 'skip' else 'record',
+            validate=validate):
+        if type(record) is SplitError:
+            if errors == 'raise':
+                rows.append('')
+                return (
+                    '\n'.join(rows), ''.join(error_rows),
+                    f'{record.file_url}: {record.error.message}')
+            error_rows.append(
+                f'{_tsv_escape(record.file_url)}\t'
+                f'{_tsv_escape(record.error.message)}\n')
+            continue
+
+        if output_format == 'tsv':
+            rows.append('\t'.join([_tsv_escape(record[x]) for x in indexes]))
+        else:
+            rows.append(json.dumps(
+                {x: record[y] for x, y in zip(columns, indexes)},
+                ensure_ascii=False))
+
+    rows.append('')
+    return '\n'.join(rows), ''.join(error_rows), None
+
+
+def _tsv_escape(value: str) -> str:
+    # TSV value in a single line: backslashes, tabs and line endings are
+    # written as '\\', '\t', '\n' and '\r'
+    return (
+        value.replace('\\', '\\\\').replace('\t', '\\t')
+        .replace('\n', '\\n').replace('\r', '\\r'))
 
 
 if __name__ == "__main__":
-    # No third-party testing coverage
-    import doctest     # pragma: no cover
-    doctest.testmod()  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        file_url_split.enable_cache(maxsize=2)
+
+    def tearDown(self) -> None:
+        file_url_split.disable_cache()
+
+    def test_hits_and_misses(self):
+        file_url_split.FileUrlSplit('/home/user/text.txt')
+        file_url_split.FileUrlSplit('/home/user/text.txt')
+        list(file_url_split.iter_split(['/home/user/text.txt', '/x.png']))
+        info = file_url_split.cache_info()
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.currsize, 2)
+
+    def test_eviction(self):
+        for file_url in ['/a.txt', '/b.txt', '/c.txt', '/a.txt']:
+            file_url_split.FileUrlSplit(file_url)
+        info = file_url_split.cache_info()
+        self.assertEqual(info.hits, 0)
+        self.assertEqual(info.misses, 4)
+        self.assertEqual(info.currsize, 2)
+
+    def test_clear(self):
+        file_url_split.FileUrlSplit('/home/user/text.txt')
+        file_url_split.cache_clear()
+        info = file_url_split.cache_info()
+        self.assertEqual(info.currsize, 0)
+        self.assertEqual(info.misses, 0)
+
+    def test_disabled(self):
+        file_url_split.disable_cache()
+        self.assertIsNone(file_url_split.cache_info())
+        file_url_split.cache_clear()
+
+    def test_same_result(self):
+        for _ in range(2):
+            file_url = file_url_split.FileUrlSplit(
+                'file:///home/user/book.tar.gz')
+            self.assertEqual(file_url.url, '/home/user/book.tar.gz')
+            self.assertEqual(file_url.path, '/home/user/')
+            self.assertEqual(file_url.filename, 'book.tar.gz')
+            self.assertEqual(file_url.name, 'book')
+            self.assertEqual(file_url.extension, '.tar.gz')
+
+    def test_setter_does_not_change_cache(self):
+        file_url = file_url_split.FileUrlSplit('/home/user/text.txt')
+        file_url.extension = '.pdf'
+        file_url = file_url_split.FileUrlSplit('/home/user/text.txt')
+        self.assertEqual(file_url.extension, '.txt')
+        self.assertEqual(file_url_split.cache_info().hits, 1)
+
+
+class TestCacheRaises(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        file_url_split.disable_cache()
+
+    def test_non_absolute_path_raises(self):
+        file_url_split.enable_cache()
+        for _ in range(2):
+            self.assertRaises(
+                file_url_split.AbsolutePathError,
+                file_url_split.FileUrlSplit, 'home/user/text.txt')
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import src.fileurlsplit as file_url_split
+
+FILE_URLS = [
+    'file:///home/user/photo.png',
+    '',
+    '/home/user/book.tar.gz\r',
+    r'c:\home\user\text.txt',
+]
+
+
+def run(argv: list, stdin: str = '') -> tuple:
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    with mock.patch.object(sys, 'stdin', io.StringIO(stdin)), \
+            contextlib.redirect_stdout(stdout), \
+            contextlib.redirect_stderr(stderr):
+        status = file_url_split.main(argv)
+    return status, stdout.getvalue(), stderr.getvalue()
+
+
+class TestCommandLine(unittest.TestCase):
+
+    def test_tsv(self):
+        status, out, _ = run(['--header'], '\n'.join(FILE_URLS))
+        self.assertEqual(status, 0)
+        self.assertEqual(out.splitlines(), [
+            'url\tpath\tfilename\tname\textension',
+            '/home/user/photo.png\t/home/user/\tphoto.png\tphoto\t.png',
+            '/home/user/book.tar.gz\t/home/user/\tbook.tar.gz\tbook\t.tar.gz',
+            '/home/user/text.txt\t/home/user/\ttext.txt\ttext\t.txt',
+        ])
+
+    def test_tsv_escapes(self):
+        status, out, _ = run(
+            ['-c', 'url,name'], '/a/b%0Ac.txt\n/a/d%09e%0D.txt\n')
+        self.assertEqual(status, 0)
+        self.assertEqual(out.splitlines(), [
+            '/a/b\\nc.txt\tb\\nc',
+            '/a/d\\te\\r.txt\td\\te\\r',
+        ])
+
+        # Recorded errors have the input line, before the slashes are fixed
+        status, _, err = run(['--errors', 'record'], 'a\\b.txt\n')
+        self.assertEqual(status, 0)
+        self.assertEqual(len(err.splitlines()), 1)
+        self.assertTrue(err.startswith('a\\\\b.txt\t'))
+
+    def test_jsonl_columns(self):
+        status, out, _ = run(
+            ['-f', 'jsonl', '-c', 'name,extension'], '\n'.join(FILE_URLS))
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            [json.loads(x) for x in out.splitlines()],
+            [{'name': 'photo', 'extension': '.png'},
+             {'name': 'book', 'extension': '.tar.gz'},
+             {'name': 'text', 'extension': '.txt'}])
+
+    def test_files_and_jobs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file = os.path.join(directory, 'manifest.txt')
+            with open(file, 'w', encoding='utf-8') as manifest:
+                manifest.write('\n'.join(FILE_URLS * 3))
+
+            _, expected, _ = run(['-c', 'url'], '\n'.join(FILE_URLS * 6))
+            with mock.patch.object(file_url_split, '_CLI_CHUNK', 2):
+                status, out, _ = run(
+                    ['-c', 'url', '-j', '2', file, '-', file],
+                    '')
+            self.assertEqual(status, 0)
+            self.assertEqual(out, expected)
+
+    def test_errors(self):
+        lines = '/a/b.txt\nrelative/c.txt\n/a/AUX\n'
+        status, out, err = run([], lines)
+        self.assertEqual(status, 1)
+        self.assertEqual(out, '/a/b.txt\t/a/\tb.txt\tb\t.txt\n')
+        self.assertIn('relative/c.txt', err)
+
+        status, out, err = run(['--errors', 'skip', '-c', 'url'], lines)
+        self.assertEqual((status, out, err), (0, '/a/b.txt\n/a/AUX\n', ''))
+
+        file_url_split.set_platform('win32')
+        try:
+            status, out, err = run(
+                ['--errors', 'record', '--validate', '-c', 'url'], lines)
+        finally:
+            file_url_split.set_platform()
+        self.assertEqual((status, out), (0, '/a/b.txt\n'))
+        self.assertEqual(
+            [x.split('\t')[0] for x in err.splitlines()],
+            ['relative/c.txt', '/a/AUX'])
+
+    def test_bad_arguments(self):
+        for argv in [['-c', 'url,size'], ['-j', '0'], ['-f', 'csv']]:
+            with self.assertRaises(SystemExit):
+                run(argv)
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+
+class TestCompactFileUrlSplit(unittest.TestCase):
+
+    def test_same_result_as_file_url_split(self):
+        for file_url in [
+                '/home/user/text.txt', '/home/user/.text.txt',
+                '/home/user/todo.text.tar.gz', '/home/user/text.',
+                r'c:\windows\user\text.txt', 'file:///home/user/text',
+                'file%3A%2F%2F%2Fhome%2Fuser%2Fbook.pdf', '/x', '/x/', '/',
+                '/a/x.gz.gz', '/srv//a.txt', '//a', '', None]:
+            compact = file_url_split.CompactFileUrlSplit(file_url)
+            obj = file_url_split.FileUrlSplit(file_url)
+            self.assertEqual(compact.url, obj.url)
+            self.assertEqual(compact.path, obj.path)
+            self.assertEqual(compact.filename, obj.filename)
+            self.assertEqual(compact.name, obj.name)
+            self.assertEqual(compact.extension, obj.extension)
+
+    def test_divisions_are_url_slices(self):
+        # The path ends at the last slash and the name is the filename
+        # without its extension, in every API
+        expected = {
+            '/a/x.gz.gz': ('/a/', 'x.gz.gz', 'x.gz', '.gz'),
+            '/srv//a.txt': ('/srv//', 'a.txt', 'a', '.txt'),
+        }
+        for file_url, divisions in expected.items():
+            for split in [
+                    file_url_split.FileUrlSplit(file_url),
+                    file_url_split.FileUrlSplit(file_url, lazy=True),
+                    file_url_split.CompactFileUrlSplit(file_url),
+                    file_url_split.FrozenFileUrlSplit(file_url),
+                    next(file_url_split.iter_split([file_url]))]:
+                self.assertEqual(
+                    (split.path, split.filename, split.name,
+                     split.extension),
+                    divisions)
+
+            result = file_url_split.split_array([file_url], use_numpy=False)
+            self.assertEqual(
+                file_url[:result.path_ends[0]], divisions[0])
+            self.assertEqual(
+                file_url[result.extension_starts[0]:], divisions[3])
+            self.assertEqual(
+                list(file_url_split.group_by([file_url], key='path').counts),
+                [divisions[0]])
+
+    def test_repr_obj(self):
+        self.assertEqual(
+            repr(file_url_split.CompactFileUrlSplit('/home/user/text.txt')),
+            'CompactFileUrlSplit("/home/user/text.txt")')
+
+    def test_no_instance_dict(self):
+        compact = file_url_split.CompactFileUrlSplit('/home/user/text.txt')
+        self.assertFalse(hasattr(compact, '__dict__'))
+
+    def test_read_only(self):
+        compact = file_url_split.CompactFileUrlSplit('/home/user/text.txt')
+        self.assertRaises(
+            AttributeError, setattr, compact, 'extension', '.pdf')
+
+
+class TestCompactFileUrlSplitRaises(unittest.TestCase):
+
+    def test_non_absolute_path_raises(self):
+        self.assertRaises(
+            file_url_split.AbsolutePathError,
+            file_url_split.CompactFileUrlSplit, 'home/user/text.txt')
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+import random
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+
+def reference_get_extension(filename: str) -> str:
+    # Extension rules before the 'ExtensionRules' table
+    file_name = filename.lstrip('.')
+    if '.' not in file_name or file_name[-1] == '.':
+        return ''
+    file_slices = file_name.split('.')
+    if len(file_slices) == 2:
+        return '.' + file_slices[-1]
+    if file_slices[-2] == 'tar':
+        return '.' + file_slices[-2] + '.' + file_slices[-1]
+    return '.' + file_slices[-1]
+
+
+class TestExtensionRules(unittest.TestCase):
+
+    def tearDown(self):
+        file_url_split.set_extension_rules()
+
+    def test_default_rules_fuzz(self):
+        rules = file_url_split.ExtensionRules()
+        # Same rules, without the fast path of the default table
+        general = file_url_split.ExtensionRules(['.tar.*', '.y.z'])
+        rng = random.Random(0)
+        for _ in range(20_000):
+            filename = ''.join(
+                rng.choice(['.', 'a', 'tar', 'gz', 'x'])
+                for _ in range(rng.randint(0, 8)))
+            expected = reference_get_extension(filename)
+            self.assertEqual(rules.extension(filename), expected, filename)
+            self.assertEqual(general.extension(filename), expected, filename)
+            self.assertEqual(
+                file_url_split._get_extension(filename), expected, filename)
+            self.assertEqual(
+                rules.find_bytes(filename.encode()),
+                len(filename) - len(expected), filename)
+
+    def test_compound_rules(self):
+        rules = file_url_split.ExtensionRules(
+            ['.tar.*', '.min.js', '.pkg.tar.xz', '.d.ts'])
+        self.assertEqual(rules.extension('app.min.js'), '.min.js')
+        self.assertEqual(rules.extension('app.js'), '.js')
+        self.assertEqual(rules.extension('index.d.ts'), '.d.ts')
+        self.assertEqual(rules.extension('linux.pkg.tar.xz'), '.pkg.tar.xz')
+        self.assertEqual(rules.extension('linux.tar.xz'), '.tar.xz')
+        self.assertEqual(rules.extension('linux.pkg.tar.gz'), '.tar.gz')
+        self.assertEqual(rules.extension('.min.js'), '.js')
+        self.assertEqual(rules.extension('min.js'), '.js')
+        self.assertEqual(rules.find('app.min.js'), 3)
+        self.assertEqual(rules.find('readme'), 6)
+
+    def test_add_and_remove(self):
+        rules = file_url_split.ExtensionRules()
+        rules.add('.min.js')
+        self.assertIn('.min.js', rules)
+        self.assertEqual(len(rules), 2)
+        self.assertEqual(list(rules), ['.min.js', '.tar.*'])
+        rules.remove('.tar.*')
+        self.assertEqual(rules.extension('book.tar.gz'), '.gz')
+        self.assertEqual(rules.extension('app.min.js'), '.min.js')
+        with self.assertRaises(KeyError):
+            rules.remove('.tar.*')
+        rules.add('.tar.*')
+        rules.remove('.min.js')
+        self.assertEqual(rules.extension('book.tar.gz'), '.tar.gz')
+        self.assertEqual(rules.extension('app.min.js'), '.js')
+
+    def test_invalid_rules(self):
+        rules = file_url_split.ExtensionRules()
+        for rule in ['.gz', 'tar.gz', '.tar..gz', '.*.gz', '.tar.g*', '']:
+            with self.assertRaises(ValueError):
+                rules.add(rule)
+
+    def test_set_extension_rules(self):
+        file_url_split.get_extension_rules().add('.min.js')
+        fus = file_url_split.FileUrlSplit('/srv/www/app.min.js')
+        self.assertEqual(fus.name, 'app')
+        self.assertEqual(fus.extension, '.min.js')
+
+        file_url_split.set_extension_rules()
+        self.assertEqual(
+            file_url_split.CompactFileUrlSplit('/srv/www/app.min.js')
+            .extension, '.js')
+
+        file_url_split.set_extension_rules(
+            file_url_split.ExtensionRules([]))
+        self.assertEqual(
+            file_url_split.FileUrlSplit('/home/book.tar.gz').extension,
+            '.gz')
+
+    def test_split_array(self):
+        file_url_split.get_extension_rules().add('.min.js')
+        urls = ['/a/app.min.js', '/b/c.tar.gz', '/x/.bashrc', '/y/z.png']
+        engines = [False] + ([True] if file_url_split.numpy else [])
+        for use_numpy in engines:
+            result = file_url_split.split_array(urls, use_numpy=use_numpy)
+            self.assertEqual(
+                [int(x) for x in result.extension_starts], [6, 4, 10, 4])
+            self.assertEqual(
+                [str(result.extensions[x]) for x in result.extension_codes],
+                ['.min.js', '.tar.gz', '', '.png'])
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+platform = sys.platform
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code: str, hash_seed: str, stdin: bytes = b'') -> bytes:
+    # Output of the code, run from the repository root in a new process
+    return subprocess.run(
+        [sys.executable, '-c', code], input=stdin, stdout=subprocess.PIPE,
+        cwd=ROOT, env=dict(os.environ, PYTHONHASHSEED=hash_seed),
+        check=True).stdout
+
+
+class TestFrozenFileUrlSplit(unittest.TestCase):
+
+    def test_properties(self):
+        frozen = file_url_split.FrozenFileUrlSplit(
+            'file:///home/user/book.tar.gz')
+        self.assertEqual(frozen.url, '/home/user/book.tar.gz')
+        self.assertEqual(frozen.path, '/home/user/')
+        self.assertEqual(frozen.filename, 'book.tar.gz')
+        self.assertEqual(frozen.name, 'book')
+        self.assertEqual(frozen.extension, '.tar.gz')
+
+    def test_repr_obj(self):
+        self.assertEqual(
+            repr(file_url_split.FrozenFileUrlSplit('/home/user/text.txt')),
+            'FrozenFileUrlSplit("/home/user/text.txt")')
+
+    def test_equal_and_hash(self):
+        a = file_url_split.FrozenFileUrlSplit('file:///home/user/text.txt')
+        b = file_url_split.FrozenFileUrlSplit(r'c:\home\user\text.txt')
+        c = file_url_split.FrozenFileUrlSplit('/home/user/other.txt')
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+        self.assertNotEqual(a, '/home/user/text.txt')
+        self.assertEqual(len({a, b, c}), 2)
+        self.assertEqual({a: 1}[b], 1)
+
+    def test_order(self):
+        urls = ['/b/x.txt', '/a/y.txt', '/a/x.txt']
+        self.assertEqual(
+            [x.url for x in sorted(
+                file_url_split.FrozenFileUrlSplit(x) for x in urls)],
+            sorted(urls))
+        self.assertLessEqual(
+            file_url_split.FrozenFileUrlSplit('/a'),
+            file_url_split.FrozenFileUrlSplit('/b'))
+
+    def test_immutable(self):
+        frozen = file_url_split.FrozenFileUrlSplit('/home/user/text.txt')
+        self.assertRaises(AttributeError, setattr, frozen, 'name', 'other')
+        self.assertFalse(hasattr(frozen, '__dict__'))
+
+    def test_pickle(self):
+        frozen = file_url_split.FrozenFileUrlSplit('/a/b.txt')
+        copy = pickle.loads(pickle.dumps(frozen))
+        self.assertEqual(copy, frozen)
+        self.assertEqual(hash(copy), hash(frozen))
+        self.assertEqual(copy.extension, '.txt')
+
+    def test_pickle_in_another_process(self):
+        # String hashes change with the process, and so the hash of the
+        # dict keys must be made again when unpickled
+        data = run_python(
+            'import pickle, sys\n'
+            'import src.fileurlsplit as file_url_split\n'
+            'key = file_url_split.FrozenFileUrlSplit("/a/b.txt")\n'
+            'sys.stdout.buffer.write(pickle.dumps({key: 1}))\n',
+            hash_seed='1')
+        output = run_python(
+            'import pickle, sys\n'
+            'import src.fileurlsplit as file_url_split\n'
+            'keys = pickle.loads(sys.stdin.buffer.read())\n'
+            'key = file_url_split.FrozenFileUrlSplit("/a/b.txt")\n'
+            'print(key in keys, key in set(keys))\n',
+            hash_seed='2', stdin=data)
+        self.assertEqual(output.split(), [b'True', b'True'])
+
+
+class TestFrozenFileUrlSplitWith(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.frozen = file_url_split.FrozenFileUrlSplit('/home/user/text.txt')
+
+    def test_with_url(self):
+        new = self.frozen.with_url('file:///tmp/book.pdf')
+        self.assertEqual(new.url, '/tmp/book.pdf')
+        self.assertEqual(self.frozen.url, '/home/user/text.txt')
+
+    def test_with_path(self):
+        self.assertEqual(
+            self.frozen.with_path('/tmp').url, '/tmp/text.txt')
+
+    def test_with_name(self):
+        self.assertEqual(
+            self.frozen.with_name('book').url, '/home/user/book.txt')
+        new = self.frozen.with_name(None)
+        self.assertEqual(new.filename, '.txt')
+        self.assertEqual(new.extension, '')
+
+    def test_with_filename(self):
+        new = self.frozen.with_filename('book.tar.gz')
+        self.assertEqual(new.name, 'book')
+        self.assertEqual(new.extension, '.tar.gz')
+
+    def test_with_extension(self):
+        self.assertEqual(
+            self.frozen.with_extension('pdf').url, '/home/user/text.pdf')
+        self.assertEqual(
+            self.frozen.with_extension('').url, '/home/user/text')
+
+    def test_no_change_returns_same_object(self):
+        self.assertIs(self.frozen.with_extension('.txt'), self.frozen)
+
+
+class TestFrozenFileUrlSplitRaises(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        sys.platform = platform
+
+    def test_with_raises(self):
+        frozen = file_url_split.FrozenFileUrlSplit('/home/user/text.txt')
+        self.assertRaises(
+            file_url_split.AbsolutePathError, frozen.with_path, 'tmp/')
+        self.assertRaises(
+            file_url_split.InvalidCharacterError, frozen.with_name, 'a/b')
+        self.assertRaises(
+            file_url_split.FilenameTooLongError,
+            frozen.with_extension, 'x' * 255)
+
+    def test_with_invalid_filename_raises(self):
+        sys.platform = 'win32'
+        frozen = file_url_split.FrozenFileUrlSplit('/home/user/text.txt')
+        self.assertRaises(
+            file_url_split.InvalidFilenameError, frozen.with_filename, 'AUX')
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
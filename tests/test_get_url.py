@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+import random
+import re
+import unittest
+import urllib.parse
+
+import src.fileurlsplit as file_url_split
+
+
+def reference_get_url(file_url: str) -> str:
+    # The original URL cleaning, with the 're' module
+    if not file_url:
+        return '/'
+
+    file_url = urllib.parse.unquote(
+        string=file_url, encoding='utf-8', errors='replace')
+    file_url = file_url.replace('\\', '/')
+
+    prefix_match = re.search(r'^\w+:', file_url)
+    if prefix_match:
+        if file_url[prefix_match.end():][0] != '/':
+            raise file_url_split.AbsolutePathError(message='')
+    else:
+        if file_url[0] != '/':
+            raise file_url_split.AbsolutePathError(message='')
+
+    match = re.search(r'/\w.+$', file_url)
+    if match:
+        file_url = file_url[match.start():match.end()]
+
+    return file_url
+
+
+def random_urls(count: int, seed: int) -> list:
+    rand = random.Random(seed)
+    pieces = [
+        '/', '/', '//', 'home', 'user', 'file:', 'c:', 'C:', 'file:///',
+        '.', '.hidden', 'text.txt', '_x', 'é', '%2F', '%20', '%', '\\',
+        '\n', ' ', ':', 'a', '1', '-', '~']
+    return [
+        ''.join(rand.choice(pieces) for _ in range(rand.randint(0, 8)))
+        for _ in range(count)]
+
+
+class TestGetUrl(unittest.TestCase):
+
+    def assert_same_as_reference(self, file_url: str) -> None:
+        try:
+            expected = reference_get_url(file_url)
+        except (file_url_split.AbsolutePathError, IndexError):
+            # The reference raised IndexError for a prefix without a path,
+            # like "c:"
+            self.assertRaises(
+                file_url_split.AbsolutePathError,
+                file_url_split._get_url, file_url)
+            return
+
+        self.assertEqual(
+            file_url_split._get_url(file_url), expected, msg=repr(file_url))
+
+    def test_same_result_as_reference(self):
+        for file_url in random_urls(count=50000, seed=2):
+            self.assert_same_as_reference(file_url)
+
+    def test_prefixes(self):
+        for file_url in [
+                'file:///home/user/text.txt', 'file://home/user/text.txt',
+                'file:/home/user/text.txt', 'c:/home', 'C:\\home\\x.txt',
+                'file:///.hidden/text.txt', 'file:///a', 'file:///ab',
+                'file:', 'c:', 'c:x', 'file%3A%2F%2F%2Fhome%2Fuser',
+                '/home/user/text.txt\n', '/a\nb/cd/ef', '///home//x',
+                '//a', '/', '//', '/_', 'é:/x/y', '_:/x/y', ':/x/y']:
+            self.assert_same_as_reference(file_url)
+
+    def test_clean_url_does_not_raise(self):
+        self.assertIsNone(file_url_split._clean_url('home/user/text.txt'))
+        self.assertIsNone(file_url_split._clean_url('c:'))
+        self.assertEqual(
+            file_url_split._clean_url('file:///home/user/text.txt'),
+            '/home/user/text.txt')
+
+
+class TestCleanUrlFastPath(unittest.TestCase):
+
+    def test_clean_urls_are_unchanged(self):
+        for file_url in random_urls(count=20000, seed=1):
+            if file_url and file_url_split._is_clean_url(file_url):
+                self.assertEqual(
+                    reference_get_url(file_url), file_url, msg=repr(file_url))
+
+    def test_common_urls_are_clean(self):
+        for file_url in ['/home/user/text.txt', '/_x/y', '/x', '/',
+                         '/srv/data/dir with spaces/a.b.c']:
+            self.assertTrue(file_url_split._is_clean_url(file_url))
+
+    def test_urls_that_are_not_clean(self):
+        for file_url in ['file:///home/user/text.txt', r'c:\windows',
+                         '/home/user/book%20.pdf', '/.hidden/text.txt',
+                         '/home/user/text\n']:
+            self.assertFalse(file_url_split._is_clean_url(file_url))
+
+
+class TestAssumeClean(unittest.TestCase):
+
+    def test_assume_clean(self):
+        file_url = file_url_split.FileUrlSplit(
+            '/home/user/book%20.tar.gz', assume_clean=True)
+        self.assertEqual(file_url.url, '/home/user/book%20.tar.gz')
+        self.assertEqual(file_url.path, '/home/user/')
+        self.assertEqual(file_url.name, 'book%20')
+        self.assertEqual(file_url.extension, '.tar.gz')
+
+    def test_assume_clean_empty_url(self):
+        file_url = file_url_split.FileUrlSplit(None, assume_clean=True)
+        self.assertEqual(file_url.url, '/')
+        self.assertEqual(file_url.path, '/')
+
+    def test_compact_assume_clean(self):
+        compact = file_url_split.CompactFileUrlSplit(
+            '/home/user/text.txt', assume_clean=True)
+        self.assertEqual(compact.filename, 'text.txt')
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+import pickle
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+FILE_URLS = [
+    'file:///home/user/photo.png',
+    '/home/user/book.tar.gz',
+    r'c:\home\user\docs\text.txt',
+    '/home/other.png',
+    '/readme',
+]
+
+
+class TestGroupBy(unittest.TestCase):
+
+    def test_same_as_split(self):
+        splits = [file_url_split.FileUrlSplit(x) for x in FILE_URLS]
+        for key, attr in [('extension', 'extension'), ('path', 'path')]:
+            stats = file_url_split.group_by(FILE_URLS, key=key)
+            expected = {}
+            for split in splits:
+                value = getattr(split, attr)
+                expected[value] = expected.get(value, 0) + 1
+            self.assertEqual(dict(stats.counts), expected)
+
+    def test_depth(self):
+        stats = file_url_split.group_by(FILE_URLS, key='depth')
+        self.assertEqual(dict(stats.counts), {2: 2, 3: 1, 1: 1, 0: 1})
+
+    def test_sizes(self):
+        stats = file_url_split.group_by(
+            iter(FILE_URLS), sizes=iter([10, 20, 30, 40, 50]))
+        self.assertEqual(stats.counts['.png'], 2)
+        self.assertEqual(stats.sizes['.png'], 50)
+        self.assertEqual(stats.sizes['.tar.gz'], 20)
+        self.assertEqual(stats.sizes[''], 50)
+
+    def test_errors(self):
+        urls = ['/a/x.png', 'relative/y.png', '/b/z.png']
+        with self.assertRaises(file_url_split.AbsolutePathError):
+            file_url_split.group_by(urls)
+        with self.assertRaises(file_url_split.AbsolutePathError):
+            file_url_split.group_by(urls, sizes=[1, 2, 3])
+
+        stats = file_url_split.group_by(urls, sizes=[1, 2, 4], errors='skip')
+        self.assertEqual(stats.counts['.png'], 2)
+        self.assertEqual(stats.sizes['.png'], 5)
+        self.assertEqual(stats.errors, [])
+
+        stats = file_url_split.group_by(urls, errors='record')
+        self.assertEqual(stats.counts['.png'], 2)
+        self.assertEqual(len(stats.errors), 1)
+        self.assertEqual(stats.errors[0].file_url, 'relative/y.png')
+
+    def test_unknown_key_or_policy(self):
+        with self.assertRaises(ValueError):
+            file_url_split.group_by(FILE_URLS, key='name')
+        with self.assertRaises(ValueError):
+            file_url_split.group_by(FILE_URLS, errors='ignore')
+
+    def test_sizes_of_other_length(self):
+        urls = ['/a.txt', '/b.txt', '/c.png']
+        for sizes in [[], [10], [10, 20], [10, 20, 30, 40]]:
+            with self.assertRaises(ValueError):
+                file_url_split.group_by(urls, sizes=sizes)
+            with self.assertRaises(ValueError):
+                file_url_split.group_by(
+                    iter(urls), sizes=iter(sizes), errors='record')
+
+    def test_merge(self):
+        whole = file_url_split.group_by(FILE_URLS, sizes=range(5))
+        first = file_url_split.group_by(FILE_URLS[:2], sizes=range(2))
+        second = pickle.loads(pickle.dumps(
+            file_url_split.group_by(FILE_URLS[2:], sizes=range(2, 5))))
+        self.assertEqual(first + second, whole)
+        first.update(second)
+        self.assertEqual(first, whole)
+
+        with self.assertRaises(ValueError):
+            first.update(file_url_split.group_by(FILE_URLS, key='path'))
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def tearDown(self):
+        file_url_split.disable_instrumentation()
+        file_url_split.instrumentation_clear()
+        file_url_split.disable_cache()
+        file_url_split.set_platform()
+
+    def test_disabled_uses_original_functions(self):
+        originals = (
+            file_url_split._get_url, file_url_split._unquote,
+            file_url_split._is_clean_url,
+            file_url_split._Validator.find_url_error)
+        file_url_split.enable_instrumentation()
+        file_url_split.enable_instrumentation()
+        self.assertIsNot(file_url_split._get_url, originals[0])
+        self.assertIn('__init__', vars(file_url_split.Error))
+
+        file_url_split.disable_instrumentation()
+        file_url_split.disable_instrumentation()
+        self.assertEqual(
+            (file_url_split._get_url, file_url_split._unquote,
+             file_url_split._is_clean_url,
+             file_url_split._Validator.find_url_error),
+            originals)
+        self.assertNotIn('__init__', vars(file_url_split.Error))
+
+    def test_stages_and_paths(self):
+        file_url_split.enable_instrumentation()
+        file_url_split.FileUrlSplit('/home/user/photo.png')
+        file_url_split.FileUrlSplit('file:///home/user/a%20b.txt')
+        snapshot = file_url_split.instrumentation_snapshot()
+
+        self.assertTrue(snapshot['enabled'])
+        self.assertEqual(snapshot['fast_path'], 1)
+        self.assertEqual(snapshot['slow_path'], 1)
+        stages = snapshot['stages']
+        self.assertEqual(stages['get_url']['calls'], 2)
+        self.assertEqual(stages['unquote']['calls'], 1)
+        self.assertEqual(stages['get_extension']['calls'], 2)
+        self.assertGreater(stages['get_url']['ns'], 0)
+        self.assertGreaterEqual(
+            stages['get_url']['ns'], stages['clean_url']['ns'])
+        self.assertIsNone(snapshot['cache'])
+
+        file_url_split.disable_instrumentation()
+        file_url_split.FileUrlSplit('/home/user/photo.png')
+        self.assertEqual(
+            file_url_split.instrumentation_snapshot()['stages'],
+            stages)
+
+        file_url_split.instrumentation_clear()
+        snapshot = file_url_split.instrumentation_snapshot()
+        self.assertFalse(snapshot['enabled'])
+        self.assertEqual(snapshot['stages']['get_url'], {'calls': 0, 'ns': 0})
+        self.assertEqual(snapshot['fast_path'], 0)
+
+    def test_exceptions(self):
+        file_url_split.set_platform('win32')
+        file_url_split.enable_instrumentation()
+        split = file_url_split.FileUrlSplit('/home/user/photo.png')
+        for attribute, value in [('name', 'a:b'), ('filename', 'AUX'),
+                                 ('url', 'relative')]:
+            with self.assertRaises(file_url_split.Error):
+                setattr(split, attribute, value)
+
+        with self.assertRaises(file_url_split.InvalidCharacterError) as er:
+            split.url = '/home/a?b'
+        self.assertEqual(er.exception.message, "Cannot contain '?'")
+
+        snapshot = file_url_split.instrumentation_snapshot()
+        self.assertEqual(snapshot['exceptions'], {
+            'InvalidCharacterError': 2,
+            'InvalidFilenameError': 1,
+            'AbsolutePathError': 1,
+        })
+        self.assertGreater(snapshot['stages']['validate_name']['calls'], 0)
+
+    def test_cache(self):
+        file_url_split.enable_cache(maxsize=16)
+        file_url_split.enable_instrumentation()
+        for _ in range(3):
+            file_url_split.FileUrlSplit('/home/user/photo.png')
+        cache = file_url_split.instrumentation_snapshot()['cache']
+        self.assertEqual((cache['hits'], cache['misses']), (2, 1))
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
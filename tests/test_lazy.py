@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+
+class TestLazyProperties(unittest.TestCase):
+
+    def test_same_result_as_eager(self):
+        for file_url in [
+                '/home/user/text.txt', '/home/user/.text.txt',
+                '/home/user/todo.text.tar.gz', '/home/user/text.',
+                r'c:\windows\user\text.txt', 'file:///home/user/text',
+                '/x', '/x/', '/', '', None]:
+            lazy = file_url_split.FileUrlSplit(file_url, lazy=True)
+            eager = file_url_split.FileUrlSplit(file_url)
+            self.assertEqual(lazy.url, eager.url)
+            self.assertEqual(lazy.extension, eager.extension)
+            self.assertEqual(lazy.name, eager.name)
+            self.assertEqual(lazy.filename, eager.filename)
+            self.assertEqual(lazy.path, eager.path)
+
+    def test_only_extension(self):
+        file_url = file_url_split.FileUrlSplit(
+            '/home/user/book.tar.gz', lazy=True)
+        self.assertEqual(file_url.extension, '.tar.gz')
+
+    def test_new_url(self):
+        file_url = file_url_split.FileUrlSplit(
+            '/home/user/text.txt', lazy=True)
+        self.assertEqual(file_url.name, 'text')
+        file_url.url = '/home/user/Downloads/image.png'
+        self.assertEqual(file_url.path, '/home/user/Downloads/')
+        self.assertEqual(file_url.name, 'image')
+        self.assertEqual(file_url.extension, '.png')
+
+
+class TestLazySetters(unittest.TestCase):
+
+    def test_new_extension_before_reading(self):
+        file_url = file_url_split.FileUrlSplit(
+            '/home/user/text.txt', lazy=True)
+        file_url.extension = 'pdf'
+        self.assertEqual(file_url.url, '/home/user/text.pdf')
+        self.assertEqual(file_url.filename, 'text.pdf')
+
+    def test_new_name_before_reading(self):
+        file_url = file_url_split.FileUrlSplit(
+            '/home/user/text.txt', lazy=True)
+        file_url.name = 'book'
+        self.assertEqual(file_url.url, '/home/user/book.txt')
+
+    def test_new_filename_before_reading(self):
+        file_url = file_url_split.FileUrlSplit(
+            '/home/user/text.txt', lazy=True)
+        file_url.filename = 'book.tar.gz'
+        self.assertEqual(file_url.name, 'book')
+        self.assertEqual(file_url.extension, '.tar.gz')
+
+    def test_new_path_before_reading(self):
+        file_url = file_url_split.FileUrlSplit(
+            '/home/user/text.txt', lazy=True)
+        file_url.path = '/tmp'
+        self.assertEqual(file_url.url, '/tmp/text.txt')
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
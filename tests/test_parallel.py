@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+import concurrent.futures
+import functools
+import multiprocessing
+import pickle
+import unittest
+from unittest import mock
+
+import src.fileurlsplit as file_url_split
+
+
+class TestSplitParallel(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.file_urls = [
+            f'file:///home/user/dir_{x % 7}/file_{x}.tar.gz'
+            for x in range(1000)]
+
+    def test_in_order(self):
+        records = file_url_split.split_parallel(
+            self.file_urls, workers=2, chunksize=100)
+        self.assertEqual(len(records), len(self.file_urls))
+        for index, record in enumerate(records):
+            _, path, _, name, extension = record
+            self.assertEqual(name, f'file_{index}')
+            self.assertEqual(path, f'/home/user/dir_{index % 7}/')
+            self.assertEqual(extension, '.tar.gz')
+
+    def test_plain_tuples_with_shared_paths(self):
+        records = file_url_split.split_parallel(
+            self.file_urls, workers=2, chunksize=100)
+        self.assertIs(type(records[0]), tuple)
+        self.assertEqual(
+            [file_url_split.SplitRecord._make(x) for x in records],
+            list(file_url_split.iter_split(self.file_urls)))
+        # Same path of the same chunk
+        self.assertIs(records[0][1], records[7][1])
+
+    def test_same_result_in_single_process(self):
+        self.assertEqual(
+            file_url_split.split_parallel(
+                self.file_urls, workers=2, chunksize=300),
+            file_url_split.split_parallel(self.file_urls, workers=1))
+
+    def test_skip_errors(self):
+        self.file_urls[10] = 'home/user/text.txt'
+        records = file_url_split.split_parallel(
+            self.file_urls, workers=2, chunksize=100, errors='skip')
+        self.assertEqual(len(records), len(self.file_urls) - 1)
+        self.assertEqual(records[10][3], 'file_11')
+
+
+class TestSplitParallelRaises(unittest.TestCase):
+
+    def test_non_absolute_path_raises(self):
+        file_urls = ['/home/user/text.txt'] * 500 + ['home/user/text.txt']
+        self.assertRaises(
+            file_url_split.AbsolutePathError,
+            file_url_split.split_parallel, file_urls,
+            workers=2, chunksize=100)
+
+    def test_error_cancels_pending_chunks(self):
+        futures = []
+
+        class RecordingPool(concurrent.futures.ThreadPoolExecutor):
+            def submit(self, *args, **kwargs):
+                future = super().submit(*args, **kwargs)
+                futures.append(future)
+                return future
+
+        file_urls = ['home/user/text.txt'] + ['/home/user/text.txt'] * 9999
+        with mock.patch.object(
+                concurrent.futures, 'ProcessPoolExecutor', RecordingPool):
+            self.assertRaises(
+                file_url_split.AbsolutePathError,
+                file_url_split.split_parallel, file_urls,
+                workers=2, chunksize=100)
+
+        self.assertEqual(len(futures), 100)
+        self.assertTrue(futures[-1].cancelled())
+
+    def test_unknown_errors_policy_raises(self):
+        self.assertRaises(
+            ValueError, file_url_split.split_parallel, [], errors='ignore')
+
+
+def spawn_pool():
+    # Process pools of 'split_parallel' started with "spawn", the default
+    # on macOS and Windows, whose workers import the module again
+    return mock.patch.object(
+        concurrent.futures, 'ProcessPoolExecutor', functools.partial(
+            concurrent.futures.ProcessPoolExecutor,
+            mp_context=multiprocessing.get_context('spawn')))
+
+
+class TestSplitParallelSpawn(unittest.TestCase):
+
+    def tearDown(self):
+        file_url_split.set_platform()
+        file_url_split.set_extension_rules()
+
+    def test_platform(self):
+        file_url_split.set_platform('win32')
+        file_urls = ['/a/b.txt', '/a/AUX', '/a/c?.txt'] * 100
+        expected = file_url_split.split_parallel(
+            file_urls, workers=1, errors='record', validate=True)
+        with spawn_pool():
+            records = file_url_split.split_parallel(
+                file_urls, workers=2, chunksize=100, errors='record',
+                validate=True)
+
+        self.assertEqual(
+            [type(x) for x in records], [type(x) for x in expected])
+        self.assertIsInstance(
+            records[1].error, file_url_split.InvalidFilenameError)
+        self.assertEqual(
+            records[2].error.invalid_character_found, '?')
+
+    def test_extension_rules(self):
+        file_url_split.set_extension_rules(
+            file_url_split.ExtensionRules(['.tar.*', '.min.js']))
+        file_urls = ['/a/b.min.js', '/a/c.tar.gz', '/a/d.js'] * 100
+        with spawn_pool():
+            records = file_url_split.split_parallel(
+                file_urls, workers=2, chunksize=100)
+
+        self.assertEqual(
+            [x[4] for x in records],
+            ['.min.js', '.tar.gz', '.js'] * 100)
+
+    def test_extension_rules_are_pickled(self):
+        rules = file_url_split.ExtensionRules(['.tar.*', '.min.js'])
+        copy = pickle.loads(pickle.dumps(rules))
+        self.assertEqual(list(copy), ['.min.js', '.tar.*'])
+        self.assertEqual(copy.extension('a.min.js'), '.min.js')
+
+    def test_errors_are_pickled(self):
+        for error in [
+                file_url_split.InvalidCharacterError('m', '?', ['?']),
+                file_url_split.InvalidFilenameError('m', ['AUX']),
+                file_url_split.AbsolutePathError('m'),
+                file_url_split.FilenameTooLongError('m')]:
+            copy = pickle.loads(pickle.dumps(error))
+            self.assertIs(type(copy), type(error))
+            self.assertEqual(copy.message, 'm')
+            self.assertEqual(vars(copy), vars(error))
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+import random
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+FILE_URLS = [
+    '/data/x/a.parquet',
+    '/data/x/y/b.parquet',
+    '/data/x/c.csv',
+    '/data/xy/d.parquet',
+    '/data/e',
+    '/f.txt',
+]
+
+
+class TestPathIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = file_url_split.PathIndex(FILE_URLS)
+
+    def test_find(self):
+        self.assertEqual(
+            [x.url for x in self.index.find('/data/x/', '.parquet')],
+            ['/data/x/a.parquet', '/data/x/y/b.parquet'])
+        self.assertEqual(
+            sorted(x.url for x in self.index.find('/data/x')),
+            ['/data/x/a.parquet', '/data/x/c.csv', '/data/x/y/b.parquet'])
+        self.assertEqual(
+            [x.url for x in self.index.find(extension='')], ['/data/e'])
+        self.assertEqual(list(self.index.find('/nothing/')), [])
+        self.assertEqual(list(self.index.find('/data/', '.png')), [])
+        self.assertEqual(sorted(x.url for x in self.index), sorted(FILE_URLS))
+
+    def test_count(self):
+        self.assertEqual(len(self.index), 6)
+        self.assertEqual(self.index.count(), 6)
+        self.assertEqual(self.index.count('/data/'), 5)
+        self.assertEqual(self.index.count('/data/', '.parquet'), 3)
+        self.assertEqual(self.index.count('/nothing/', '.parquet'), 0)
+        self.assertEqual(
+            self.index.extensions('/data/x/'), {'.parquet': 2, '.csv': 1})
+        self.assertEqual(self.index.extensions('/nothing/'), {})
+
+    def test_records(self):
+        split = file_url_split.FileUrlSplit('file:///srv/a.png')
+        index = file_url_split.PathIndex([split, 'file:///srv/b.png'])
+        records = list(index.find('/srv/'))
+        self.assertIs(records[0], split)
+        self.assertIsInstance(records[1], file_url_split.SplitRecord)
+        self.assertIn('/srv/a.png', index)
+        self.assertIn(split, index)
+        self.assertNotIn('/srv/c.png', index)
+        self.assertNotIn('relative/a.png', index)
+
+        index.add('/srv/a.png')
+        self.assertEqual(len(index), 2)
+        with self.assertRaises(file_url_split.AbsolutePathError):
+            index.add('relative/a.png')
+
+    def test_remove(self):
+        self.index.remove('/data/x/y/b.parquet')
+        self.assertEqual(self.index.count('/data/', '.parquet'), 2)
+        self.assertEqual(self.index.count('/data/x/y/'), 0)
+        self.assertEqual(self.index.extensions('/data/x/y/'), {})
+        with self.assertRaises(KeyError):
+            self.index.remove('/data/x/y/b.parquet')
+        with self.assertRaises(KeyError):
+            self.index.remove('/data/x/b.parquet')
+
+        self.assertEqual(self.index.remove_tree('/data/x/'), 2)
+        self.assertEqual(self.index.remove_tree('/data/x/'), 0)
+        self.assertEqual(
+            sorted(x.url for x in self.index),
+            ['/data/e', '/data/xy/d.parquet', '/f.txt'])
+        self.assertEqual(self.index.remove_tree('/'), 3)
+        self.assertEqual(len(self.index), 0)
+
+    def test_same_as_linear_scan(self):
+        rand = random.Random(5)
+        dirs = ['a', 'b', 'ab', 'c']
+        extensions = ['.txt', '.tar.gz', '', '.png']
+        index = file_url_split.PathIndex()
+        records = {}
+        for _ in range(3000):
+            path = '/' + ''.join(
+                rand.choice(dirs) + '/' for _ in range(rand.randint(0, 3)))
+            url = path + rand.choice(['x', 'y']) + rand.choice(extensions)
+            operation = rand.random()
+            if operation < 0.6:
+                index.add(url)
+                records[url] = file_url_split.FileUrlSplit(url)
+            elif operation < 0.9:
+                if url in records:
+                    index.remove(url)
+                    del records[url]
+            else:
+                removed = [x for x in records if x.startswith(path)]
+                self.assertEqual(index.remove_tree(path), len(removed))
+                for x in removed:
+                    del records[x]
+
+            extension = rand.choice(extensions + [None])
+            expected = sorted(
+                x for x, split in records.items() if x.startswith(path)
+                and extension in (None, split.extension))
+            self.assertEqual(
+                sorted(x.url for x in index.find(path, extension)),
+                expected)
+            self.assertEqual(index.count(path, extension), len(expected))
+            self.assertEqual(len(index), len(records))
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+
+class TestPathTable(unittest.TestCase):
+
+    def test_shared_path(self):
+        table = file_url_split.PathTable()
+        a = file_url_split.FileUrlSplit('/home/user/a.txt', path_table=table)
+        b = file_url_split.FileUrlSplit(
+            'file:///home/user/b.txt', path_table=table)
+        self.assertEqual(a.path, '/home/user/')
+        self.assertIs(a.path, b.path)
+        self.assertEqual(len(table), 1)
+        self.assertIn('/home/user/', table)
+
+    def test_shared_path_in_lazy_mode(self):
+        table = file_url_split.PathTable()
+        a = file_url_split.FileUrlSplit(
+            '/home/user/a.txt', lazy=True, path_table=table)
+        b = file_url_split.FileUrlSplit(
+            '/home/user/b.txt', lazy=True, path_table=table)
+        self.assertIs(a.path, b.path)
+        self.assertEqual(b.filename, 'b.txt')
+
+    def test_parent_chain(self):
+        table = file_url_split.PathTable()
+        path = table.intern('/data/photos/2024/')
+        self.assertEqual(table.parent(path), '/data/photos/')
+        self.assertIs(table.parent(path), table.parent('/data/photos/2024/'))
+        self.assertEqual(table.parent('/data/'), '/')
+        self.assertIsNone(table.parent('/'))
+        self.assertEqual(
+            sorted(table), ['/', '/data/', '/data/photos/',
+                            '/data/photos/2024/'])
+
+    def test_split_many_shares_paths(self):
+        columns = file_url_split.FileUrlSplit.split_many(
+            ['/home/user/a.txt', '/home/user/b.txt'])
+        self.assertIs(columns.paths[0], columns.paths[1])
+
+    def test_iter_split_shares_paths(self):
+        table = file_url_split.PathTable()
+        records = list(file_url_split.iter_split(
+            ['/home/user/a.txt', '/home/user/b.txt'], path_table=table))
+        self.assertIs(records[0].path, records[1].path)
+        self.assertEqual(records[1].filename, 'b.txt')
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+import sys
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+platform = sys.platform
+
+
+class TestPlatformRules(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        sys.platform = platform
+        file_url_split.set_platform(None)
+
+    def test_rules_are_made_once(self):
+        self.assertIs(
+            file_url_split.get_platform_rules('win32'),
+            file_url_split.get_platform_rules('win32'))
+
+    def test_current_platform(self):
+        sys.platform = 'darwin'
+        self.assertEqual(file_url_split.get_platform_rules().platform, 'Mac')
+
+    def test_platform_names(self):
+        for sys_platform, name in [
+                ('linux', 'Linux'), ('freebsd8', 'BSD'), ('darwin', 'Mac'),
+                ('win32', 'Windows'), ('cygwin', 'Windows'),
+                ('msys', 'Windows'), ('riscos', 'Another')]:
+            self.assertEqual(
+                file_url_split.get_platform_rules(sys_platform).platform,
+                name)
+
+    def test_another_platform_chars(self):
+        invalid_chars = file_url_split.get_platform_rules(
+            'riscos').invalid_chars
+        self.assertIn('>', invalid_chars)
+        self.assertNotIn('~', invalid_chars)
+        self.assertNotIn('.', invalid_chars)
+
+    def test_set_platform(self):
+        file_url_split.set_platform('win32')
+        self.assertEqual(
+            file_url_split.get_platform_rules().platform, 'Windows')
+        file_url = file_url_split.FileUrlSplit('/home/user/text.txt')
+        self.assertRaises(
+            file_url_split.InvalidFilenameError,
+            setattr, file_url, 'filename', 'AUX')
+
+        file_url_split.set_platform('linux')
+        file_url = file_url_split.FileUrlSplit('/home/user/text.txt')
+        file_url.filename = 'AUX'
+        self.assertEqual(file_url.url, '/home/user/AUX')
+
+    def test_exception_lists(self):
+        file_url_split.set_platform('win32')
+        file_url = file_url_split.FileUrlSplit('/home/user/text.txt')
+        try:
+            file_url.name = 'new|text'
+        except file_url_split.InvalidCharacterError as er:
+            self.assertEqual(er.invalid_character_found, '|')
+            self.assertIsInstance(er.all_invalid_characters_list, list)
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
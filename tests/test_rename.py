@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+import sys
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+platform = sys.platform
+
+
+class TestPlanRenames(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.file_urls = [
+            'file:///home/user/a.txt', '/home/user/b.tar.gz', '/tmp/c']
+
+    def test_new_extension(self):
+        plan = file_url_split.plan_renames(self.file_urls, extension='md')
+        self.assertEqual(
+            plan.sources,
+            ['/home/user/a.txt', '/home/user/b.tar.gz', '/tmp/c'])
+        self.assertEqual(
+            plan.targets,
+            ['/home/user/a.md', '/home/user/b.md', '/tmp/c.md'])
+        self.assertEqual(plan.collisions, {})
+
+    def test_remove_extension(self):
+        plan = file_url_split.plan_renames(self.file_urls, extension='')
+        self.assertEqual(
+            plan.targets, ['/home/user/a', '/home/user/b', '/tmp/c'])
+
+    def test_new_path(self):
+        plan = file_url_split.plan_renames(
+            self.file_urls, path='file:///srv/data')
+        self.assertEqual(
+            plan.targets,
+            ['/srv/data/a.txt', '/srv/data/b.tar.gz', '/srv/data/c'])
+
+    def test_name_template(self):
+        plan = file_url_split.plan_renames(
+            self.file_urls, name_template='{index}-{name}{extension}')
+        self.assertEqual(
+            plan.targets,
+            ['/home/user/0-a.txt.txt', '/home/user/1-b.tar.gz.tar.gz',
+             '/tmp/2-c'])
+
+    def test_same_result_as_setters(self):
+        plan = file_url_split.plan_renames(
+            self.file_urls, extension='%2Emd', path='/srv',
+            name_template='new %41')
+        for source, target in zip(self.file_urls, plan.targets):
+            file_url = file_url_split.FileUrlSplit(source)
+            file_url.name = 'new %41'
+            file_url.extension = '%2Emd'
+            file_url.path = '/srv'
+            self.assertEqual(file_url.url, target)
+
+    def test_collisions(self):
+        plan = file_url_split.plan_renames(
+            ['/a/x.txt', '/b/x.txt', '/c/x.txt', '/a/y.txt'], path='/d/')
+        self.assertEqual(
+            plan.collisions,
+            {'/d/x.txt': ['/a/x.txt', '/b/x.txt', '/c/x.txt']})
+
+    def test_skip_and_record_errors(self):
+        file_urls = ['/a/x.txt', 'b/x.txt', '/c/x.txt']
+        plan = file_url_split.plan_renames(
+            file_urls, extension='md', errors='skip')
+        self.assertEqual(plan.targets, ['/a/x.md', '/c/x.md'])
+        self.assertEqual(plan.errors, [])
+
+        plan = file_url_split.plan_renames(
+            file_urls, extension='md', errors='record')
+        self.assertEqual(plan.errors[0].file_url, 'b/x.txt')
+        self.assertIsInstance(
+            plan.errors[0].error, file_url_split.AbsolutePathError)
+
+
+class TestPlanRenamesRaises(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        sys.platform = platform
+
+    def test_invalid_extension_raises(self):
+        self.assertRaises(
+            file_url_split.InvalidCharacterError,
+            file_url_split.plan_renames, ['/a/x.txt'], extension='/md')
+
+    def test_non_absolute_path_raises(self):
+        self.assertRaises(
+            file_url_split.AbsolutePathError,
+            file_url_split.plan_renames, ['/a/x.txt'], path='srv/')
+
+    def test_invalid_name_raises(self):
+        sys.platform = 'win32'
+        self.assertRaises(
+            file_url_split.InvalidFilenameError,
+            file_url_split.plan_renames, ['/a/x'], name_template='AUX')
+        self.assertRaises(
+            file_url_split.InvalidCharacterError,
+            file_url_split.plan_renames, ['/a/x'], name_template='a|b')
+
+    def test_too_long_raises(self):
+        self.assertRaises(
+            file_url_split.FilenameTooLongError,
+            file_url_split.plan_renames, ['/a/x.txt'],
+            name_template='x' * 252)
+
+    def test_unknown_errors_policy_raises(self):
+        self.assertRaises(
+            ValueError, file_url_split.plan_renames, [], errors='ignore')
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+import random
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+FILE_URLS = [
+    '/home/user/text.txt', '/home/user/.text.txt', '/home/user/.text',
+    '/home/user/todo.text.tar.gz', '/home/user/tar.gz', '/home/user/text.',
+    '/home/user/todo.text.ta.gz', r'c:\windows\user\text.txt',
+    'file:///home/user/text', 'file%3A%2F%2F%2Fhome%2Fuser%2Fbook.pdf',
+    '/x', '/x/', '/', '', '/.hidden/text.txt', '/_x/y.z', '/é/ü.txt',
+    '/a/x.tar', '/a/..tar.gz', '/a/x..tar.gz', '/a/.x.tar.gz', '/a/x.tar.',
+    '/a/x.gz.gz', '/srv//a.txt']
+
+
+class TestSplitArray(unittest.TestCase):
+
+    def assert_same_as_objects(self, result):
+        self.assertEqual(len(result.urls), len(FILE_URLS))
+        for index, file_url in enumerate(FILE_URLS):
+            obj = file_url_split.FileUrlSplit(file_url)
+            url = str(result.urls[index])
+            path_end = int(result.path_ends[index])
+            extension_start = int(result.extension_starts[index])
+            extension_code = int(result.extension_codes[index])
+            self.assertEqual(url, obj.url)
+            self.assertEqual(url[:path_end], obj.path)
+            self.assertEqual(url[path_end:], obj.filename)
+            self.assertEqual(url[extension_start:], obj.extension)
+            self.assertEqual(
+                str(result.extensions[extension_code]), obj.extension)
+
+    def test_pure_python(self):
+        self.assert_same_as_objects(
+            file_url_split.split_array(FILE_URLS, use_numpy=False))
+
+    def test_sorted_extension_codes(self):
+        result = file_url_split.split_array(
+            ['/a.txt', '/b.png', '/c.txt', '/d'], use_numpy=False)
+        self.assertEqual(result.extensions, ['', '.png', '.txt'])
+        self.assertEqual(list(result.extension_codes), [2, 1, 2, 0])
+
+    @unittest.skipUnless(file_url_split.numpy, 'NumPy is not installed')
+    def test_numpy(self):
+        self.assert_same_as_objects(
+            file_url_split.split_array(
+                file_url_split.numpy.array(FILE_URLS), use_numpy=True))
+
+    @unittest.skipUnless(file_url_split.numpy, 'NumPy is not installed')
+    def test_numpy_list(self):
+        self.assert_same_as_objects(
+            file_url_split.split_array(FILE_URLS, use_numpy=True))
+
+    @unittest.skipUnless(file_url_split.numpy, 'NumPy is not installed')
+    def test_numpy_does_not_change_the_input(self):
+        file_urls = file_url_split.numpy.array(FILE_URLS)
+        file_url_split.split_array(file_urls, use_numpy=True)
+        self.assertEqual(file_urls.tolist(), FILE_URLS)
+
+    @unittest.skipUnless(file_url_split.numpy, 'NumPy is not installed')
+    def test_numpy_none(self):
+        for use_numpy in [False, True]:
+            result = file_url_split.split_array(
+                [None, '', '/a.txt'], use_numpy=use_numpy)
+            self.assertEqual(
+                [str(x) for x in result.urls], ['/', '/', '/a.txt'])
+
+    @unittest.skipUnless(file_url_split.numpy, 'NumPy is not installed')
+    def test_numpy_same_as_pure_python_fuzz(self):
+        rand = random.Random(1)
+        pieces = ['.', 'tar', 'gz', 'a', '/', '%20', 'file://', '\\']
+        file_urls = [
+            '/' + ''.join(rand.choice(pieces) for _ in range(
+                rand.randint(0, 8)))
+            for _ in range(5000)]
+        for rules in [None, ['.tar.*', '.a.gz', '.gz.gz.*']]:
+            if rules:
+                file_url_split.set_extension_rules(
+                    file_url_split.ExtensionRules(rules))
+            try:
+                python = file_url_split.split_array(
+                    file_urls, use_numpy=False)
+                vectorized = file_url_split.split_array(
+                    file_urls, use_numpy=True)
+            finally:
+                file_url_split.set_extension_rules()
+            self.assertEqual(vectorized.urls.tolist(), python.urls)
+            for attribute in ['path_ends', 'extension_starts',
+                              'extension_codes']:
+                self.assertEqual(
+                    getattr(vectorized, attribute).tolist(),
+                    getattr(python, attribute).tolist())
+            self.assertEqual(vectorized.extensions.tolist(), python.extensions)
+
+    @unittest.skipUnless(file_url_split.numpy, 'NumPy is not installed')
+    def test_numpy_empty(self):
+        result = file_url_split.split_array([], use_numpy=True)
+        self.assertEqual(len(result.urls), 0)
+        self.assertEqual(len(result.extensions), 0)
+
+
+class TestSplitArrayRaises(unittest.TestCase):
+
+    def test_non_absolute_path_raises(self):
+        self.assertRaises(
+            file_url_split.AbsolutePathError,
+            file_url_split.split_array, ['home/user/text.txt'],
+            use_numpy=False)
+
+    @unittest.skipIf(file_url_split.numpy, 'NumPy is installed')
+    def test_numpy_not_installed_raises(self):
+        self.assertRaises(
+            ImportError,
+            file_url_split.split_array, FILE_URLS, use_numpy=True)
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+import mmap
+import tempfile
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+FILE_URLS = [
+    '/home/user/photo.png',
+    '/home/user/book.tar.gz',
+    '/home/usér/ação.txt',
+    'file:///home/user/text.txt',
+    r'c:\home\user\text.txt',
+    '/home/user%20docs/a%C3%A7%C3%A3o.txt',
+    '/home/.hidden/.bashrc',
+    # Divisions found by offsets, not by searching repeated text
+    '/a/x.gz.gz',
+    '/srv//a.txt',
+    '/a.txt/a.txt',
+    '/readme',
+    '/',
+]
+
+
+def divisions(split) -> tuple:
+    return (
+        split.url, split.path, split.filename, split.name, split.extension)
+
+
+class TestSplitBytes(unittest.TestCase):
+
+    def setUp(self):
+        self.expected = [
+            divisions(file_url_split.FileUrlSplit(x)) for x in FILE_URLS]
+        self.data = '\n'.join(FILE_URLS).encode()
+
+    def test_same_as_split(self):
+        self.assertEqual(
+            [divisions(x) for x in file_url_split.split_bytes(self.data)],
+            self.expected)
+
+    def test_buffer_types(self):
+        with tempfile.TemporaryFile() as file:
+            file.write(self.data)
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # The last view leaves the last line, '/', out
+                for buffer in [bytearray(self.data), mm,
+                               memoryview(self.data),
+                               memoryview(self.data)[:len(self.data) - 1]]:
+                    result = [
+                        divisions(x)
+                        for x in file_url_split.split_bytes(buffer)]
+                    self.assertEqual(
+                        result[:len(FILE_URLS) - 1], self.expected[:-1])
+
+    def test_offsets_into_buffer(self):
+        data = b'/tmp/a.png\r\n\r\n/srv/book.tar.gz'
+        splits = list(file_url_split.split_bytes(data))
+        self.assertEqual(len(splits), 2)
+        self.assertIs(splits[0].source, data)
+        self.assertEqual(tuple(splits[0])[1:], (0, 5, 6, 10))
+        self.assertEqual(tuple(splits[1])[1:], (14, 19, 23, 30))
+
+    def test_cleaned_line(self):
+        split, = file_url_split.split_bytes(b'file:///tmp/a%20b.png')
+        self.assertEqual(split.source, '/tmp/a b.png')
+        self.assertEqual(tuple(split)[1:], (0, 5, 8, 12))
+
+    def test_errors(self):
+        data = b'/tmp/a.png\nrelative/b.png\n/tmp/c.png'
+        with self.assertRaises(file_url_split.AbsolutePathError):
+            list(file_url_split.split_bytes(data))
+
+        result = list(file_url_split.split_bytes(data, errors='skip'))
+        self.assertEqual([x.filename for x in result], ['a.png', 'c.png'])
+
+        result = list(file_url_split.split_bytes(data, errors='record'))
+        self.assertEqual(result[1].file_url, 'relative/b.png')
+        self.assertIsInstance(
+            result[1].error, file_url_split.AbsolutePathError)
+
+        with self.assertRaises(ValueError):
+            file_url_split.split_bytes(data, errors='ignore')
+
+    def test_extension_rules(self):
+        rules = file_url_split.ExtensionRules(['.tar.*', '.min.js'])
+        for filename in ['a.min.js', 'a.js', '.min.js', 'a.tar.gz', 'a.',
+                         'a', '..a', 'a.b.c', 'ação.min.js']:
+            self.assertEqual(
+                rules.find_bytes(filename.encode()),
+                len(filename[:rules.find(filename)].encode()), filename)
+            self.assertEqual(
+                rules.find_bytes(bytearray(filename.encode())),
+                rules.find_bytes(filename.encode()))
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
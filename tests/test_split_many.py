@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+
+class TestSplitMany(unittest.TestCase):
+
+    def test_columns(self):
+        columns = file_url_split.FileUrlSplit.split_many(
+            ['/home/user/text.txt', 'file:///home/user/book.tar.gz', '/x/'])
+        self.assertEqual(
+            columns.urls,
+            ['/home/user/text.txt', '/home/user/book.tar.gz', '/x/'])
+        self.assertEqual(columns.paths, ['/home/user/', '/home/user/', '/x/'])
+        self.assertEqual(columns.filenames, ['text.txt', 'book.tar.gz', ''])
+        self.assertEqual(columns.names, ['text', 'book', ''])
+        self.assertEqual(columns.extensions, ['.txt', '.tar.gz', ''])
+
+    def test_same_result_as_objects(self):
+        file_urls = [
+            '/home/user/.text.txt', r'c:\windows\user\text.txt', '', None,
+            'file%3A%2F%2F%2Fhome%2Fuser%2Fbook.pdf', '/tmp', '/text.']
+        columns = file_url_split.FileUrlSplit.split_many(file_urls)
+        for index, file_url in enumerate(file_urls):
+            obj = file_url_split.FileUrlSplit(file_url)
+            self.assertEqual(columns.urls[index], obj.url)
+            self.assertEqual(columns.paths[index], obj.path)
+            self.assertEqual(columns.filenames[index], obj.filename)
+            self.assertEqual(columns.names[index], obj.name)
+            self.assertEqual(columns.extensions[index], obj.extension)
+
+    def test_empty_input(self):
+        columns = file_url_split.FileUrlSplit.split_many([])
+        self.assertEqual(columns, ([], [], [], [], []))
+
+    def test_generator_input(self):
+        columns = file_url_split.FileUrlSplit.split_many(
+            f'/home/user/{x}.txt' for x in range(3))
+        self.assertEqual(columns.names, ['0', '1', '2'])
+
+
+class TestSplitManyRaises(unittest.TestCase):
+
+    def test_non_absolute_path_raises(self):
+        self.assertRaises(
+            file_url_split.AbsolutePathError,
+            file_url_split.FileUrlSplit.split_many,
+            ['/home/user/text.txt', 'home/user/text.txt'])
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
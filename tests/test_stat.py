@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import src.fileurlsplit as file_url_split
+
+
+def collect(file_urls: list, **kwargs) -> list:
+    async def run() -> list:
+        return [
+            x async for x in file_url_split.stat_split(file_urls, **kwargs)]
+    return asyncio.run(run())
+
+
+class TestStatSplit(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = os.path.realpath(self.directory.name)
+        os.makedirs(os.path.join(self.root, 'sub'))
+        for index in range(20):
+            with open(os.path.join(self.root, 'sub', f'file_{index}.txt'),
+                      'w') as text_file:
+                text_file.write('x' * index)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_existing_files(self):
+        file_urls = [
+            f'file://{self.root}/sub/file_{index}.txt' for index in range(20)]
+        results = collect(file_urls, workers=3)
+        self.assertEqual(len(results), 20)
+        for result in results:
+            self.assertTrue(result.exists)
+            self.assertEqual(result.record.path, f'{self.root}/sub/')
+            self.assertEqual(
+                result.size, int(result.record.name.split('_')[1]))
+            self.assertIsInstance(result.mtime, float)
+
+    def test_missing_files(self):
+        results = collect([
+            f'{self.root}/sub/missing.txt',
+            f'{self.root}/sub/file_1.txt/missing.txt'])
+        self.assertEqual(
+            [(x.exists, x.size, x.mtime) for x in results],
+            [(False, None, None)] * 2)
+
+    def test_record_errors(self):
+        results = collect(
+            ['sub/file_1.txt', f'{self.root}/sub/file_1.txt'],
+            errors='record')
+        self.assertIsInstance(results[0], file_url_split.SplitError)
+        self.assertTrue(results[1].exists)
+
+    def test_stat_errors(self):
+        file_urls = [
+            f'{self.root}/sub/{"x" * 300}.txt',
+            f'{self.root}/sub/a\x00b.txt',
+            f'{self.root}/sub/file_2.txt']
+        results = collect(file_urls, errors='record')
+        self.assertEqual(len(results), 3)
+        errors = {
+            type(x.error): x.file_url for x in results
+            if isinstance(x, file_url_split.SplitError)}
+        self.assertEqual(errors, {
+            OSError: file_urls[0], ValueError: file_urls[1]})
+
+        results = collect(file_urls, errors='skip')
+        self.assertEqual([x.size for x in results], [2])
+
+        with self.assertRaises(OSError):
+            collect(file_urls[:1])
+        with self.assertRaises(ValueError):
+            collect(file_urls[1:])
+
+    def test_early_stop_does_not_wait(self):
+        def slow_stat(path):
+            time.sleep(0.3)
+            return os.lstat(path)
+
+        async def first(file_urls: list):
+            results = file_url_split.stat_split(file_urls, workers=2)
+            result = await results.__anext__()
+            start = time.perf_counter()
+            await results.aclose()
+            return result, time.perf_counter() - start
+
+        file_urls = [f'{self.root}/sub/file_{x}.txt' for x in range(20)]
+        with mock.patch.object(file_url_split.os, 'stat', slow_stat):
+            result, closing_time = asyncio.run(first(file_urls))
+        self.assertTrue(result.exists)
+        self.assertLess(closing_time, 0.2)
+
+
+class TestStatSplitRaises(unittest.TestCase):
+
+    def test_non_absolute_path_raises(self):
+        self.assertRaises(
+            file_url_split.AbsolutePathError, collect, ['home/user/x.txt'])
+
+    def test_unknown_errors_policy_raises(self):
+        self.assertRaises(ValueError, collect, [], errors='ignore')
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
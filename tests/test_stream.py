@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+import io
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+
+class TestIterSplit(unittest.TestCase):
+
+    def test_records(self):
+        records = list(file_url_split.iter_split(
+            ['file:///home/user/text.txt',
+             'file%3A%2F%2F%2Fhome%2Fuser%2Fbook.pdf']))
+        self.assertEqual(
+            records[0],
+            ('/home/user/text.txt', '/home/user/', 'text.txt', 'text', '.txt'))
+        self.assertEqual(records[1].url, '/home/user/book.pdf')
+        self.assertEqual(records[1].extension, '.pdf')
+
+    def test_is_lazy(self):
+        def lines():
+            yield '/home/user/text.txt'
+            raise RuntimeError('Consumed too much')
+
+        records = file_url_split.iter_split(lines())
+        self.assertEqual(next(records).filename, 'text.txt')
+
+    def test_skip_errors(self):
+        records = list(file_url_split.iter_split(
+            ['home/user/text.txt', '/home/user/text.txt'], errors='skip'))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].url, '/home/user/text.txt')
+
+    def test_record_errors(self):
+        records = list(file_url_split.iter_split(
+            ['home/user/text.txt', '/home/user/text.txt'], errors='record'))
+        self.assertIsInstance(records[0], file_url_split.SplitError)
+        self.assertEqual(records[0].file_url, 'home/user/text.txt')
+        self.assertIsInstance(
+            records[0].error, file_url_split.AbsolutePathError)
+        self.assertIsInstance(records[1], file_url_split.SplitRecord)
+
+    def test_validate_record_errors(self):
+        records = list(file_url_split.iter_split(
+            ['/home/user/' + 'x' * 256, '/home/user/text.txt'],
+            errors='record', validate=True))
+        self.assertIsInstance(
+            records[0].error, file_url_split.FilenameTooLongError)
+        self.assertEqual(records[1].name, 'text')
+
+
+class TestSplitStream(unittest.TestCase):
+
+    def test_stream(self):
+        stream = io.StringIO(
+            'file:///home/user/text.txt\n\n/home/user/book.tar.gz\r\n/x')
+        records = list(file_url_split.split_stream(stream))
+        self.assertEqual(
+            [record.url for record in records],
+            ['/home/user/text.txt', '/home/user/book.tar.gz', '/x'])
+        self.assertEqual(records[1].extension, '.tar.gz')
+
+
+class TestIterSplitRaises(unittest.TestCase):
+
+    def test_non_absolute_path_raises(self):
+        records = file_url_split.iter_split(['home/user/text.txt'])
+        self.assertRaises(file_url_split.AbsolutePathError, next, records)
+
+    def test_unknown_errors_policy_raises(self):
+        self.assertRaises(
+            ValueError, file_url_split.iter_split, [], errors='ignore')
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+import random
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+
+def reference_check_url(url: str, rules: file_url_split.PlatformRules):
+    # The component by component check of the 'url' setter
+    for split_name in url.split('/'):
+        for invalid_char in rules.invalid_chars:
+            if invalid_char in split_name:
+                raise file_url_split.InvalidCharacterError(
+                    message=f"Cannot contain '{invalid_char}'",
+                    invalid_character_found=invalid_char,
+                    all_invalid_characters_list=list(rules.invalid_chars))
+        if split_name in rules.invalid_names:
+            raise file_url_split.InvalidFilenameError(
+                message=f'The name "{split_name}" is reserved and cannot be '
+                        'used.',
+                all_invalid_filename_list=list(rules.invalid_names))
+        if len(split_name) > 255:
+            raise file_url_split.FilenameTooLongError(message='')
+
+
+def error_of(function, *args) -> tuple:
+    try:
+        function(*args)
+    except file_url_split.InvalidCharacterError as er:
+        return type(er), er.invalid_character_found
+    except file_url_split.Error as er:
+        return type(er), None
+    return None, None
+
+
+class TestUrlValidator(unittest.TestCase):
+
+    def test_same_errors_as_component_check(self):
+        rand = random.Random(7)
+        pieces = [
+            'home', 'user', 'AUX', 'CON', 'x' * 256, 'a|b', 'a:b', 'a*b<c',
+            'text.txt', 'a>b?c', '~user', 'a"b', 'a-b_c', '', 'é']
+        for platform in ['linux', 'freebsd8', 'darwin', 'win32', 'riscos']:
+            validator = file_url_split._get_validator(platform)
+            for _ in range(2000):
+                url = '/' + '/'.join(
+                    rand.choice(pieces) for _ in range(rand.randint(0, 5)))
+                self.assertEqual(
+                    error_of(validator.check_url, url),
+                    error_of(reference_check_url, url, validator.rules),
+                    msg=f'{platform} {url!r}')
+
+    def test_find_url_error(self):
+        validator = file_url_split._get_validator('win32')
+        self.assertIsNone(validator.find_url_error('/home/user/text.txt'))
+        self.assertEqual(
+            validator.find_url_error('/home/a|b/text.txt'),
+            (file_url_split.INVALID_CHARACTER, 2, '|'))
+        self.assertEqual(
+            validator.find_url_error('/home/AUX/a|b/text.txt'),
+            (file_url_split.INVALID_FILENAME, 2, 'AUX'))
+
+    def test_first_invalid_char_in_rules_order(self):
+        validator = file_url_split._get_validator('win32')
+        self.assertEqual(
+            error_of(validator.check_chars, 'a|b:c'),
+            (file_url_split.InvalidCharacterError, ':'))
+
+
+class TestValidateMany(unittest.TestCase):
+
+    def tearDown(self):
+        file_url_split.set_platform()
+
+    def test_same_as_url_setter(self):
+        codes = {
+            None: file_url_split.VALID,
+            file_url_split.AbsolutePathError:
+                file_url_split.NOT_ABSOLUTE_PATH,
+            file_url_split.InvalidCharacterError:
+                file_url_split.INVALID_CHARACTER,
+            file_url_split.InvalidFilenameError:
+                file_url_split.INVALID_FILENAME,
+            file_url_split.FilenameTooLongError:
+                file_url_split.FILENAME_TOO_LONG,
+        }
+        rand = random.Random(3)
+        pieces = [
+            'home', 'AUX', 'x' * 256, 'a|b', 'a:b', 'a?b', 'text.txt', '',
+            'a%7Cb', 'é']
+        urls = [
+            rand.choice(['/', 'file:///', 'c:\\', '']) + '/'.join(
+                rand.choice(pieces) for _ in range(rand.randint(0, 4)))
+            for _ in range(2000)]
+
+        for platform in ['linux', 'darwin', 'win32']:
+            file_url_split.set_platform(platform)
+            result = file_url_split.validate_many(urls)
+            self.assertEqual(len(result.codes), len(urls))
+            for index, url in enumerate(urls):
+                split = file_url_split.FileUrlSplit()
+                found, char = error_of(setattr, split, 'url', url)
+                self.assertEqual(
+                    result.codes[index], codes[found], msg=f'{url!r}')
+                self.assertEqual(result.chars[index], char or '')
+
+    def test_result(self):
+        result = file_url_split.validate_many(
+            iter(['/home/a.txt', 'a.txt', '/home/AUX/a:b', '/x/a:b']),
+            platform='win32')
+        self.assertEqual(
+            list(result.codes),
+            [file_url_split.VALID, file_url_split.NOT_ABSOLUTE_PATH,
+             file_url_split.INVALID_FILENAME,
+             file_url_split.INVALID_CHARACTER])
+        self.assertEqual(result.chars, ['', '', '', ':'])
+        self.assertEqual(list(result.components), [-1, -1, 2, 2])
+
+        empty = file_url_split.validate_many([])
+        self.assertEqual(len(empty.codes), 0)
+
+
+class TestPlatformMask(unittest.TestCase):
+
+    def test_same_as_each_platform(self):
+        rand = random.Random(11)
+        pieces = [
+            'home', 'AUX', 'LPT1', 'AUX.txt', 'x' * 256, 'a|b', 'a:b',
+            'a*b', 'text.txt', '', 'a%3Fb', 'é', 'a;b', '~a-b_c']
+        platforms = ['linux', 'freebsd8', 'darwin', 'win32', 'riscos']
+        validators = [file_url_split._get_validator(x) for x in platforms]
+        self.assertEqual(
+            tuple(x.rules for x in validators), file_url_split.PLATFORMS)
+
+        urls = [
+            rand.choice(['/', 'file:///', 'c:\\', '']) + '/'.join(
+                rand.choice(pieces) for _ in range(rand.randint(0, 4)))
+            for _ in range(3000)]
+        masks = file_url_split.platform_masks(urls)
+        for url, mask in zip(urls, masks):
+            self.assertEqual(mask, file_url_split.platform_mask(url))
+            clean = file_url_split._clean_url(url)
+            for index, validator in enumerate(validators):
+                valid = (
+                    clean is not None
+                    and validator.find_url_error(clean) is None)
+                self.assertEqual(
+                    bool(mask & 1 << index), valid, msg=f'{index} {url!r}')
+
+    def test_platform_names(self):
+        self.assertEqual(
+            file_url_split.platform_names(file_url_split.ALL_PLATFORMS),
+            ['Linux', 'BSD', 'Mac', 'Windows', 'Another'])
+        self.assertEqual(file_url_split.platform_names(0), [])
+        self.assertEqual(file_url_split.platform_mask('home/a.txt'), 0)
+        self.assertEqual(
+            file_url_split.platform_mask('/home/' + 'x' * 256), 0)
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover
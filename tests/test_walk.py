@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+import os
+import tempfile
+import unittest
+
+import src.fileurlsplit as file_url_split
+
+
+class TestWalk(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = os.path.realpath(self.directory.name)
+        for name in ['a.txt', 'b.tar.gz', 'sub/c.png', 'sub/deep/d.txt',
+                     'sub/deep/.hidden', 'e%20f.txt']:
+            os.makedirs(
+                os.path.dirname(os.path.join(self.root, name)), exist_ok=True)
+            open(os.path.join(self.root, name), 'w').close()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_recursive(self):
+        records = sorted(file_url_split.FileUrlSplit.walk(self.root))
+        self.assertEqual(
+            [x.url for x in records],
+            [f'{self.root}/{x}' for x in [
+                'a.txt', 'b.tar.gz', 'e%20f.txt', 'sub/c.png',
+                'sub/deep/.hidden', 'sub/deep/d.txt']])
+
+    def test_same_result_as_file_url_split(self):
+        for record in file_url_split.FileUrlSplit.walk(self.root):
+            if '%' in record.url:
+                continue
+            obj = file_url_split.FileUrlSplit(record.url)
+            self.assertEqual(
+                record,
+                (obj.url, obj.path, obj.filename, obj.name, obj.extension))
+
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), 'No FIFOs')
+    def test_only_files(self):
+        os.mkfifo(os.path.join(self.root, 'fifo'))
+        os.symlink(os.path.join(self.root, 'sub'),
+                   os.path.join(self.root, 'link'))
+        os.symlink(os.path.join(self.root, 'a.txt'),
+                   os.path.join(self.root, 'a_link.txt'))
+        os.symlink(os.path.join(self.root, 'missing'),
+                   os.path.join(self.root, 'broken'))
+        self.assertEqual(
+            sorted(x.url for x in file_url_split.FileUrlSplit.walk(
+                self.root, recursive=False)),
+            [f'{self.root}/{x}' for x in [
+                'a.txt', 'a_link.txt', 'b.tar.gz', 'e%20f.txt']])
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), 'No symbolic links')
+    def test_follow_symlinks(self):
+        os.symlink(os.path.join(self.root, 'sub'),
+                   os.path.join(self.root, 'link'))
+        os.symlink(self.root, os.path.join(self.root, 'sub', 'loop'))
+
+        urls = [x.url for x in file_url_split.FileUrlSplit.walk(self.root)]
+        self.assertNotIn(f'{self.root}/link/c.png', urls)
+        self.assertEqual(len(urls), 6)
+
+        urls = sorted(
+            x.url for x in file_url_split.FileUrlSplit.walk(
+                self.root, follow_symlinks=True))
+        # 'sub' is walked once, by its real name or by the link
+        self.assertEqual(len(urls), 6)
+        self.assertEqual(
+            len([x for x in urls if '/sub/' in x or '/link/' in x]), 3)
+
+    def test_not_recursive(self):
+        records = file_url_split.FileUrlSplit.walk(
+            self.root, recursive=False)
+        self.assertEqual(
+            sorted(x.filename for x in records),
+            ['a.txt', 'b.tar.gz', 'e%20f.txt'])
+
+    def test_extensions(self):
+        records = file_url_split.FileUrlSplit.walk(
+            self.root, extensions=['txt', '.tar.gz', ''])
+        self.assertEqual(
+            sorted(x.filename for x in records),
+            ['.hidden', 'a.txt', 'b.tar.gz', 'd.txt', 'e%20f.txt'])
+
+    def test_shared_path(self):
+        records = list(file_url_split.FileUrlSplit.walk(
+            self.root, recursive=False))
+        self.assertIs(records[0].path, records[1].path)
+
+    def test_relative_root(self):
+        cwd = os.getcwd()
+        os.chdir(self.root)
+        try:
+            records = file_url_split.FileUrlSplit.walk('sub', recursive=False)
+            self.assertEqual(
+                [x.path for x in records], [f'{self.root}/sub/'])
+        finally:
+            os.chdir(cwd)
+
+
+class TestWalkRaises(unittest.TestCase):
+
+    def test_missing_root_raises(self):
+        self.assertRaises(
+            OSError, list,
+            file_url_split.FileUrlSplit.walk('/no/such/directory'))
+
+
+if __name__ == '__main__':
+    # No third-party testing coverage
+    unittest.main()  # pragma: no cover